@@ -66,7 +66,7 @@ async def get_call_status(
         status=map_call_state_to_status(call_state.state),
         agent_id=call_state.agent_id or "unknown",  # Handle None
         phone_number="",  # Not available in CallStateInfo
-        start_time=call_state.timestamp,  # Use timestamp as start_time
+        start_time=call_state.occurred_at,  # Use timestamp as start_time
         duration=None,  # Not available in CallStateInfo
         metadata=call_state.metadata
     )
@@ -7,6 +7,7 @@ import asyncpg
 
 from core.startup.services.base import BaseStartupService
 from data.db.connection import get_async_engine
+from data.db.pool import get_db_pool
 from data.db.ops.sync.tables import DatabaseSyncService
 from core.config.registry import config_registry
 from core.logging.setup import get_logger
@@ -110,8 +111,16 @@ class DatabaseService(BaseStartupService):
 
   async def cleanup(self, context: "StartupContext") -> None:
     """Close PostgreSQL database connections."""
+    try:
+      # Write any call status updates still waiting in the batcher
+      from services.call.management.supervisor.events.batcher import get_status_batcher
+      await get_status_batcher().stop()
+    except Exception as e:
+      logger.error(f"Error flushing pending call status updates: {e}")
+
     try:
       logger.info("Closing PostgreSQL database connections...")
+      await get_db_pool().close()
       await get_async_engine().dispose()
       logger.info("All PostgreSQL database connections closed successfully")
     except Exception as e:
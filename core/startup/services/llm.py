@@ -4,7 +4,7 @@ LLM startup service.
 from typing import Dict, Any, TYPE_CHECKING
 
 from .base import BaseStartupService
-from services.llm.orchestrator import LLMOrchestrator
+from services.llm.orchestrator import get_orchestrator, close_orchestrator
 from core.logging.setup import get_logger
 
 if TYPE_CHECKING:
@@ -24,7 +24,7 @@ class LLMService(BaseStartupService):
     """Initialize LLM orchestrator and providers."""
     try:
       # Initialize LLM orchestrator
-      self._orchestrator = LLMOrchestrator()
+      self._orchestrator = get_orchestrator()
 
       # Test a simple generation to verify providers work
       test_messages = [{"role": "user", "content": "Hello, this is a test."}]
@@ -63,8 +63,9 @@ class LLMService(BaseStartupService):
     """Cleanup LLM resources."""
     try:
       if self._orchestrator:
-        # Cleanup any provider connections if needed
-        pass
+        # Close pooled provider connections
+        await close_orchestrator()
+        self._orchestrator = None
       logger.info("LLM service cleaned up")
     except Exception as e:
       logger.error(f"Error cleaning up LLM service: {e}")
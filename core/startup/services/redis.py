@@ -45,6 +45,13 @@ class RedisService(BaseStartupService):
 
   async def cleanup(self, context: "StartupContext") -> None:
     """Close Redis connections."""
+    try:
+      # Let in-flight call session writes reach Redis first
+      from services.call.management.supervisor.events import wait_for_pending_writes
+      await wait_for_pending_writes()
+    except Exception as e:
+      logger.error(f"Error waiting for pending session writes: {e}")
+
     try:
       await close_redis()
       logger.info("Redis connections closed")
@@ -36,6 +36,10 @@ class TelephonyService(BaseStartupService):
 
       logger.info("Telephony provider connection verified")
 
+      # Keep active-call maps in sync with peer workers
+      from services.call.management.supervisor.events import start_peer_listener
+      start_peer_listener()
+
       return {
           "provider": "ringover",
           "api_url": telephony_config.api_base_url,
@@ -55,6 +59,9 @@ class TelephonyService(BaseStartupService):
   async def cleanup(self, context: "StartupContext") -> None:
     """Cleanup telephony resources."""
     try:
+      from services.call.management.supervisor.events import stop_peer_listener
+      await stop_peer_listener()
+
       if self._api_client:
         # API client cleanup happens automatically with async context manager
         pass
@@ -2,7 +2,7 @@
 
 from data.db.ops.call.create import create_call_log
 from data.db.ops.call.read import get_call_log, get_call_logs, get_call_by_ringover_id
-from data.db.ops.call.update import update_call_status, update_call_log
+from data.db.ops.call.update import update_call_status, update_call_status_many, update_call_log
 from data.db.ops.call.delete import delete_call_log
 
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
     "get_call_logs",
     "get_call_by_ringover_id",
     "update_call_status",
+    "update_call_status_many",
     "update_call_log",
     "delete_call_log"
 ]
@@ -1,31 +1,74 @@
 """
 Update operations for call logs.
 """
+import enum
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, bindparam, func
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Optional, Dict, Any
+from asyncpg import PostgresError
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 
 from data.db.models.calllog import CallLog, CallStatus
+from data.db.pool import AsyncDatabasePool
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_BATCH_STATUS_SQL = (
+    f"UPDATE {CallLog.__tablename__} SET status = $2, updated_at = $3, "
+    "answered_at = COALESCE($4, answered_at), ended_at = COALESCE($5, ended_at) "
+    "WHERE call_id = $1"
+)
+
+
+def _to_db_value(value: Any) -> Any:
+  """Convert a Python value to what asyncpg expects for our columns."""
+  if isinstance(value, enum.Enum):
+    # SQLAlchemy stores enum columns by member name
+    return value.name
+  if isinstance(value, datetime) and value.tzinfo is not None:
+    # Timestamp columns are stored as naive UTC
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+  return value
+
+
+async def _update_call_status_pooled(
+    pool: AsyncDatabasePool,
+    call_id: str,
+    update_data: Dict[str, Any]
+) -> bool:
+  """Run a status update on a pooled asyncpg connection."""
+  columns = list(update_data)
+  assignments = ", ".join(
+      f"{column} = ${index}" for index, column in enumerate(columns, start=2))
+  query = (
+      f"UPDATE {CallLog.__tablename__} SET {assignments} WHERE call_id = $1"
+  )
+
+  async with pool.acquire() as conn:
+    result = await conn.execute(
+        query, call_id, *(_to_db_value(update_data[c]) for c in columns))
+
+  # asyncpg returns the command tag, e.g. "UPDATE 1"
+  return result.split()[-1] != "0"
+
 
 async def update_call_status(
-    session: AsyncSession,
+    session: Optional[AsyncSession],
     call_id: str,
     status: CallStatus,
+    pool: Optional[AsyncDatabasePool] = None,
     **kwargs
 ) -> bool:
   """
   Update call status and related timing fields.
 
   Args:
-      session: Database session
+      session: Database session (unused when a pool is given)
       call_id: Call identifier
       status: New call status
+      pool: Shared asyncpg pool to run the update on instead of the session
       **kwargs: Additional fields to update
 
   Returns:
@@ -43,6 +86,13 @@ async def update_call_status(
     # Add any additional fields
     update_data.update(kwargs)
 
+    if pool is not None:
+      if await _update_call_status_pooled(pool, call_id, update_data):
+        logger.info(f"Updated call {call_id} status to {status}")
+        return True
+      logger.warning(f"No call found with ID {call_id} to update")
+      return False
+
     result = await session.execute(
         update(CallLog)
         .where(CallLog.call_id == call_id)
@@ -58,12 +108,95 @@ async def update_call_status(
       logger.warning(f"No call found with ID {call_id} to update")
       return False
 
+  except PostgresError as e:
+    logger.error(f"Failed to update call status for {call_id}: {e}")
+    return False
   except SQLAlchemyError as e:
     logger.error(f"Failed to update call status for {call_id}: {e}")
     await session.rollback()
     return False
 
 
+async def update_call_status_many(
+    session: Optional[AsyncSession],
+    rows: List[Tuple[str, CallStatus, Optional[datetime], Optional[datetime]]],
+    pool: Optional[AsyncDatabasePool] = None
+) -> int:
+  """
+  Update the status of many calls in a single executemany round-trip.
+
+  Args:
+      session: Database session (unused when a pool is given)
+      rows: (call_id, status, answered_at, ended_at) tuples; None timing
+          fields leave the stored value untouched
+      pool: Shared asyncpg pool to run the update on instead of the session
+
+  Returns:
+      Number of rows submitted for update
+  """
+  if not rows:
+    return 0
+
+  if pool is not None:
+    now = _to_db_value(datetime.now(timezone.utc))
+    args = [
+        (call_id, _to_db_value(status), now,
+         _to_db_value(answered_at), _to_db_value(ended_at))
+        for call_id, status, answered_at, ended_at in rows
+    ]
+    try:
+      async with pool.acquire() as conn:
+        await conn.executemany(_BATCH_STATUS_SQL, args)
+
+      logger.info(f"Batch updated status for {len(args)} calls")
+      return len(args)
+
+    except PostgresError as e:
+      logger.error(f"Failed to batch update call status: {e}")
+      return 0
+
+  table = CallLog.__table__
+  stmt = (
+      update(table)
+      .where(table.c.call_id == bindparam("b_call_id"))
+      .values(
+          status=bindparam("b_status"),
+          updated_at=bindparam("b_updated_at"),
+          answered_at=func.coalesce(
+              bindparam("b_answered_at", type_=table.c.answered_at.type),
+              table.c.answered_at),
+          ended_at=func.coalesce(
+              bindparam("b_ended_at", type_=table.c.ended_at.type),
+              table.c.ended_at)
+      )
+  )
+
+  now = datetime.now(timezone.utc)
+  params = [
+      {
+          "b_call_id": call_id,
+          "b_status": status,
+          "b_updated_at": now,
+          "b_answered_at": answered_at,
+          "b_ended_at": ended_at
+      }
+      for call_id, status, answered_at, ended_at in rows
+  ]
+
+  try:
+    connection = await session.connection()
+    await connection.execute(stmt, params)
+    await session.commit()
+
+    logger.info(f"Batch updated status for {len(params)} calls")
+    return len(params)
+
+  except SQLAlchemyError as e:
+    logger.error(f"Failed to batch update call status: {e}")
+    await session.rollback()
+    return 0
+
+
 async def update_call_log(
     session: AsyncSession,
     call_id: str,
@@ -0,0 +1,115 @@
+"""
+Shared asyncpg connection pool for hot-path queries.
+"""
+import asyncio
+import asyncpg
+from typing import Optional
+
+from core.config.registry import config_registry
+from core.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncDatabasePool:
+  """Lazily created asyncpg pool reused across requests."""
+
+  def __init__(
+      self,
+      min_size: int = 10,
+      max_size: int = 50,
+      command_timeout: float = 60,
+      max_inactive_connection_lifetime: float = 300
+  ):
+    """Initialize pool settings."""
+    self.min_size = min_size
+    self.max_size = max_size
+    self.command_timeout = command_timeout
+    self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+    self._pool: Optional[asyncpg.Pool] = None
+    # Serializes creation so concurrent first acquires share one pool
+    self._create_lock = asyncio.Lock()
+
+  async def get_pool(self) -> asyncpg.Pool:
+    """
+    Get or create the underlying asyncpg pool.
+
+    Returns:
+        asyncpg Pool instance
+    """
+    if self._pool is not None:
+      return self._pool
+
+    async with self._create_lock:
+      if self._pool is None:
+        db_config = config_registry.database
+        self._pool = await asyncpg.create_pool(
+            dsn=db_config.sync_database_url,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            command_timeout=self.command_timeout,
+            max_inactive_connection_lifetime=self.max_inactive_connection_lifetime
+        )
+        logger.info(
+            f"Created asyncpg pool (min={self.min_size}, max={self.max_size})")
+
+    return self._pool
+
+  def acquire(self):
+    """
+    Acquire a connection from the pool.
+
+    Usage:
+        async with db_pool.acquire() as conn:
+          await conn.execute(...)
+    """
+    return _PoolAcquireContext(self)
+
+  async def close(self) -> None:
+    """Close the pool and all its connections."""
+    if self._pool is not None:
+      await self._pool.close()
+      self._pool = None
+      logger.info("asyncpg pool closed")
+
+
+class _PoolAcquireContext:
+  """Async context manager that creates the pool on first acquire."""
+
+  def __init__(self, db_pool: AsyncDatabasePool):
+    self._db_pool = db_pool
+    self._pool: Optional[asyncpg.Pool] = None
+    self._connection: Optional[asyncpg.Connection] = None
+
+  async def __aenter__(self) -> asyncpg.Connection:
+    pool = await self._db_pool.get_pool()
+    self._connection = await pool.acquire()
+    self._pool = pool
+    return self._connection
+
+  async def __aexit__(self, exc_type, exc, tb) -> None:
+    # Release into the pool the connection came from, even if the shared
+    # pool has since been closed or replaced
+    pool, connection = self._pool, self._connection
+    self._pool = None
+    self._connection = None
+    await pool.release(connection)
+
+
+# Global pool instance
+_db_pool: Optional[AsyncDatabasePool] = None
+
+
+def get_db_pool() -> AsyncDatabasePool:
+  """
+  Get the shared asyncpg pool wrapper.
+
+  Returns:
+      AsyncDatabasePool instance
+  """
+  global _db_pool
+
+  if _db_pool is None:
+    _db_pool = AsyncDatabasePool()
+
+  return _db_pool
@@ -2,6 +2,7 @@
 Redis connection setup and client management.
 """
 import redis.asyncio as redis
+from redis.exceptions import ConnectionError as RedisConnectionError
 from typing import Optional
 from core.config.registry import config_registry
 from core.logging.setup import get_logger
@@ -18,14 +19,22 @@ async def get_redis_client() -> redis.Redis:
 
   Returns:
       Redis client instance
+
+  Raises:
+      redis.exceptions.ConnectionError: If no connection can be established
   """
   global _redis_client
 
   if _redis_client is None:
-    await connect_redis()
+    try:
+      await connect_redis()
+    except Exception as e:
+      # Surface outages as connection errors so callers can retry them
+      raise RedisConnectionError(
+          f"Failed to establish Redis connection: {e}") from e
 
   if _redis_client is None:
-    raise RuntimeError("Failed to establish Redis connection")
+    raise RedisConnectionError("Failed to establish Redis connection")
 
   return _redis_client
 
@@ -1,5 +1,5 @@
 """Redis operations package."""
 
-from data.redis.ops import session
+from data.redis.ops import session, events
 
-__all__ = ["session"]
+__all__ = ["session", "events"]
@@ -0,0 +1,10 @@
+"""Call event pub/sub operations package."""
+
+from data.redis.ops.events.publish import CALL_EVENTS_CHANNEL, publish_call_event
+from data.redis.ops.events.subscribe import listen_call_events
+
+__all__ = [
+    "CALL_EVENTS_CHANNEL",
+    "publish_call_event",
+    "listen_call_events"
+]
@@ -0,0 +1,31 @@
+"""
+Publish call state changes to peer workers.
+"""
+from data.redis.connection import get_redis_client
+from core.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
+# Channel carrying "<call_id>:<status>" messages
+CALL_EVENTS_CHANNEL = "calls:events"
+
+
+async def publish_call_event(call_id: str, status: str) -> bool:
+  """
+  Publish a call state change.
+
+  Args:
+      call_id: Call identifier
+      status: New call status value
+
+  Returns:
+      True if successful
+  """
+  try:
+    redis_client = await get_redis_client()
+    await redis_client.publish(CALL_EVENTS_CHANNEL, f"{call_id}:{status}")
+    return True
+
+  except Exception as e:
+    logger.error(f"Failed to publish event for call {call_id}: {e}")
+    return False
@@ -0,0 +1,84 @@
+"""
+Subscribe to call state changes published by peer workers.
+"""
+import asyncio
+import time
+from typing import Callable
+
+from redis.exceptions import RedisError
+
+from data.redis.connection import get_redis_client
+from data.redis.ops.events.publish import CALL_EVENTS_CHANNEL
+from core.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
+
+async def listen_call_events(
+    on_event: Callable[[str, str], None],
+    initial_backoff: float = 1.0,
+    max_backoff: float = 30.0
+) -> None:
+  """
+  Listen for call state changes until cancelled.
+
+  Lost connections and Redis errors are logged and the subscription is
+  re-established with exponential backoff.
+
+  Args:
+      on_event: Called with (call_id, status) for every message
+      initial_backoff: Seconds to wait before the first reconnect
+      max_backoff: Upper bound on the wait between reconnects
+  """
+  backoff = initial_backoff
+
+  while True:
+    started_at = time.monotonic()
+    try:
+      await _listen(on_event)
+      logger.warning(f"Subscription to {CALL_EVENTS_CHANNEL} ended")
+    except asyncio.CancelledError:
+      raise
+    except Exception as e:
+      logger.error(f"Call event subscription failed: {e}")
+
+    # A subscription that stayed up for a while starts over from the
+    # shortest wait; repeated quick failures back off
+    if time.monotonic() - started_at >= max_backoff:
+      backoff = initial_backoff
+
+    logger.info(f"Resubscribing to {CALL_EVENTS_CHANNEL} in {backoff:.1f}s")
+    await asyncio.sleep(backoff)
+    backoff = min(backoff * 2, max_backoff)
+
+
+async def _listen(on_event: Callable[[str, str], None]) -> None:
+  """Subscribe once and dispatch messages until the connection ends."""
+  redis_client = await get_redis_client()
+  pubsub = redis_client.pubsub()
+
+  try:
+    await pubsub.subscribe(CALL_EVENTS_CHANNEL)
+    logger.info(f"Subscribed to {CALL_EVENTS_CHANNEL}")
+
+    async for message in pubsub.listen():
+      if message.get("type") != "message":
+        continue
+
+      # Call IDs may contain ':', the status never does
+      call_id, _, status = message["data"].rpartition(":")
+      if not call_id:
+        continue
+
+      try:
+        on_event(call_id, status)
+      except Exception as e:
+        logger.error(f"Failed to handle event for call {call_id}: {e}")
+
+  finally:
+    try:
+      await pubsub.unsubscribe(CALL_EVENTS_CHANNEL)
+    except (RedisError, OSError):
+      # The connection is already gone; nothing to unsubscribe from
+      pass
+    await pubsub.aclose()
@@ -1,14 +1,33 @@
 """Session operations package."""
 
-from data.redis.ops.session.store import store_call_session
-from data.redis.ops.session.retrieve import get_call_session
-from data.redis.ops.session.update import update_call_session, update_call_session_field
-from data.redis.ops.session.delete import delete_call_session
+from data.redis.ops.session.store import (
+    store_call_session,
+    store_call_session_raw
+)
+from data.redis.ops.session.retrieve import (
+    get_call_session,
+    get_call_sessions_bulk
+)
+from data.redis.ops.session.update import (
+    update_call_session,
+    update_call_session_fields,
+    update_call_session_field,
+    update_call_session_atomic
+)
+from data.redis.ops.session.delete import (
+    delete_call_session,
+    finish_call_session
+)
 
 __all__ = [
     "store_call_session",
+    "store_call_session_raw",
     "get_call_session",
+    "get_call_sessions_bulk",
     "update_call_session",
+    "update_call_session_fields",
     "update_call_session_field",
-    "delete_call_session"
+    "update_call_session_atomic",
+    "delete_call_session",
+    "finish_call_session"
 ]
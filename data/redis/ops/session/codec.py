@@ -0,0 +1,34 @@
+"""
+Field encoding for call sessions stored as Redis hashes.
+"""
+import json
+from typing import Dict, Any
+
+
+def encode_session_fields(session_data: Dict[str, Any]) -> Dict[str, str]:
+  """
+  Encode session fields as JSON strings for a Redis hash.
+
+  Args:
+      session_data: Session fields to encode
+
+  Returns:
+      Mapping of field name to JSON-encoded value
+  """
+  return {
+      field: json.dumps(value, default=str)
+      for field, value in session_data.items()
+  }
+
+
+def decode_session_fields(raw_data: Dict[str, str]) -> Dict[str, Any]:
+  """
+  Decode session fields read from a Redis hash.
+
+  Args:
+      raw_data: Mapping returned by HGETALL
+
+  Returns:
+      Session data with decoded values
+  """
+  return {field: json.loads(value) for field, value in raw_data.items()}
@@ -1,7 +1,12 @@
 """
 Delete call session state from Redis.
 """
+from typing import Any
+
+from redis.exceptions import ConnectionError as RedisConnectionError, RedisError
+
 from data.redis.connection import get_redis_client
+from data.redis.ops.session.codec import encode_session_fields
 from core.logging.setup import get_logger
 
 logger = get_logger(__name__)
@@ -35,6 +40,42 @@ async def delete_call_session(call_id: str) -> bool:
     return False
 
 
+async def finish_call_session(call_id: str, **final_fields: Any) -> bool:
+  """
+  Write final fields to a call session and delete it in one round trip.
+
+  Args:
+      call_id: Call identifier
+      **final_fields: Fields written just before deletion, for observers
+
+  Returns:
+      True if a session was deleted
+  """
+  try:
+    redis_client = await get_redis_client()
+    key = f"call_session:{call_id}"
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+      if final_fields:
+        pipe.hset(key, mapping=encode_session_fields(final_fields))
+      pipe.delete(key)
+      results = await pipe.execute()
+
+    if results[-1]:
+      logger.debug(f"Finished session data for call {call_id}")
+      return True
+    else:
+      logger.warning(f"No session data found for call {call_id}")
+      return False
+
+  except RedisConnectionError:
+    # Callers may retry on a fresh connection
+    raise
+  except RedisError as e:
+    logger.error(f"Failed to finish session for call {call_id}: {e}")
+    return False
+
+
 async def clear_expired_sessions() -> int:
   """
   Clear expired call sessions (manual cleanup).
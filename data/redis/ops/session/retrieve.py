@@ -2,8 +2,9 @@
 Retrieve call session state from Redis.
 """
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from data.redis.connection import get_redis_client
+from data.redis.ops.session.codec import decode_session_fields
 from core.logging.setup import get_logger
 
 logger = get_logger(__name__)
@@ -23,9 +24,9 @@ async def get_call_session(call_id: str) -> Optional[Dict[str, Any]]:
     redis_client = await get_redis_client()
     key = f"call_session:{call_id}"
 
-    data = await redis_client.get(key)
+    data = await redis_client.hgetall(key)
     if data:
-      return json.loads(data)
+      return decode_session_fields(data)
 
     return None
 
@@ -34,6 +35,39 @@ async def get_call_session(call_id: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+async def get_call_sessions_bulk(
+    call_ids: List[str]
+) -> Dict[str, Optional[Dict[str, Any]]]:
+  """
+  Retrieve several call sessions in a single Redis round trip.
+
+  Args:
+      call_ids: Call identifiers
+
+  Returns:
+      Dict mapping each call ID to its session data, or None if not found
+  """
+  if not call_ids:
+    return {}
+
+  try:
+    redis_client = await get_redis_client()
+
+    async with redis_client.pipeline(transaction=False) as pipe:
+      for call_id in call_ids:
+        pipe.hgetall(f"call_session:{call_id}")
+      results = await pipe.execute()
+
+    return {
+        call_id: decode_session_fields(data) if data else None
+        for call_id, data in zip(call_ids, results)
+    }
+
+  except Exception as e:
+    logger.error(f"Failed to retrieve {len(call_ids)} call sessions: {e}")
+    return dict.fromkeys(call_ids)
+
+
 async def get_session_field(call_id: str, field: str) -> Optional[Any]:
   """
   Get a specific field from call session data.
@@ -46,9 +80,12 @@ async def get_session_field(call_id: str, field: str) -> Optional[Any]:
       Field value or None if not found
   """
   try:
-    session_data = await get_call_session(call_id)
-    if session_data:
-      return session_data.get(field)
+    redis_client = await get_redis_client()
+    key = f"call_session:{call_id}"
+
+    value = await redis_client.hget(key, field)
+    if value is not None:
+      return json.loads(value)
 
     return None
 
@@ -1,9 +1,12 @@
 """
 Store call session state in Redis.
 """
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
+
+from redis.exceptions import ConnectionError as RedisConnectionError, RedisError
+
 from data.redis.connection import get_redis_client
+from data.redis.ops.session.codec import encode_session_fields
 from core.logging.setup import get_logger
 
 logger = get_logger(__name__)
@@ -15,7 +18,7 @@ async def store_call_session(
     ttl: int = 3600
 ) -> bool:
   """
-  Store call session data in Redis.
+  Store call session data in Redis as a hash, one field per key.
 
   Args:
       call_id: Call identifier
@@ -29,11 +32,16 @@ async def store_call_session(
     redis_client = await get_redis_client()
     key = f"call_session:{call_id}"
 
-    # Serialize data to JSON
-    serialized_data = json.dumps(session_data, default=str)
+    # Serialize each field to JSON
+    mapping = encode_session_fields(session_data)
 
-    # Store with TTL
-    await redis_client.setex(key, ttl, serialized_data)
+    # Replace any previous session and store with TTL
+    async with redis_client.pipeline(transaction=True) as pipe:
+      pipe.delete(key)
+      if mapping:
+        pipe.hset(key, mapping=mapping)
+      pipe.expire(key, ttl)
+      await pipe.execute()
 
     logger.debug(f"Stored session data for call {call_id}")
     return True
@@ -43,6 +51,45 @@ async def store_call_session(
     return False
 
 
+async def store_call_session_raw(
+    call_id: str,
+    encoded_fields: Dict[str, Union[str, bytes]],
+    ttl: int = 3600
+) -> bool:
+  """
+  Store call session fields that are already JSON-encoded.
+
+  Args:
+      call_id: Call identifier
+      encoded_fields: Field names mapped to JSON-encoded values
+      ttl: Time to live in seconds (default 1 hour)
+
+  Returns:
+      True if successful
+  """
+  try:
+    redis_client = await get_redis_client()
+    key = f"call_session:{call_id}"
+
+    # Replace any previous session and store with TTL
+    async with redis_client.pipeline(transaction=True) as pipe:
+      pipe.delete(key)
+      if encoded_fields:
+        pipe.hset(key, mapping=encoded_fields)
+      pipe.expire(key, ttl)
+      await pipe.execute()
+
+    logger.debug(f"Stored session data for call {call_id}")
+    return True
+
+  except RedisConnectionError:
+    # Callers may retry on a fresh connection
+    raise
+  except RedisError as e:
+    logger.error(f"Failed to store session for call {call_id}: {e}")
+    return False
+
+
 async def update_call_session(
     call_id: str,
     updates: Dict[str, Any],
@@ -63,23 +110,13 @@ async def update_call_session(
     redis_client = await get_redis_client()
     key = f"call_session:{call_id}"
 
-    # Get existing data
-    existing_data = await redis_client.get(key)
-    if existing_data:
-      session_data = json.loads(existing_data)
-    else:
-      session_data = {}
-
-    # Update with new data
-    session_data.update(updates)
-
-    # Store updated data
-    serialized_data = json.dumps(session_data, default=str)
-
-    if ttl:
-      await redis_client.setex(key, ttl, serialized_data)
-    else:
-      await redis_client.set(key, serialized_data)
+    # Patch only the updated fields
+    async with redis_client.pipeline(transaction=True) as pipe:
+      if updates:
+        pipe.hset(key, mapping=encode_session_fields(updates))
+      if ttl:
+        pipe.expire(key, ttl)
+      await pipe.execute()
 
     logger.debug(f"Updated session data for call {call_id}")
     return True
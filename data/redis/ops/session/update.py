@@ -1,20 +1,118 @@
 """
 Update call session data in Redis.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    RedisError,
+    WatchError
+)
+
 from data.redis.connection import get_redis_client
+from data.redis.ops.session.codec import encode_session_fields, decode_session_fields
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Sets fields on an existing session hash in one round trip; ARGV holds
+# field/value pairs. A missing session is left alone and 0 returned
+_PATCH_SESSION_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV))
+return 1
+"""
+
+# Script registered against the current client; re-registered if it changes
+_patch_script = None
+
+
+def _get_patch_script(redis_client):
+  """Get the session patch script registered against the given client."""
+  global _patch_script
+
+  if (_patch_script is None or
+          _patch_script.registered_client is not redis_client):
+    _patch_script = redis_client.register_script(_PATCH_SESSION_LUA)
+  return _patch_script
+
 
-async def update_call_session(call_id: str, session_data: Dict[str, Any]) -> bool:
+def _patch_args(fields: Dict[str, Any]) -> List[str]:
+  """Build the patch script ARGV for the given fields."""
+  args = []
+  for field, value in encode_session_fields(fields).items():
+    args += (field, value)
+  return args
+
+
+async def _merge_session_fields(
+    redis_client,
+    session_key: str,
+    fields: Dict[str, Any],
+    merge: Dict[str, Dict[str, Any]]
+) -> bool:
   """
-  Update call session data in Redis.
+  Merge dicts into stored dict fields and set plain fields in one transaction.
+
+  The merge is done in Python so values round-trip through the same JSON
+  codec as every other write. The session is watched and the merge retried
+  if it changes before the write.
+
+  Args:
+      redis_client: Redis client
+      session_key: Session hash key
+      fields: Field names and their new values
+      merge: Field names mapped to dicts merged into the stored dict value
+
+  Returns:
+      True if the session existed and was updated, False otherwise
+  """
+  async with redis_client.pipeline(transaction=True) as pipe:
+    while True:
+      try:
+        await pipe.watch(session_key)
+        if not await pipe.exists(session_key):
+          return False
+
+        stored = await pipe.hmget(session_key, list(merge))
+        current = decode_session_fields({
+            field: raw for field, raw in zip(merge, stored) if raw is not None
+        })
+
+        values = dict(fields)
+        for field, patch in merge.items():
+          merged = current.get(field)
+          merged = dict(merged) if isinstance(merged, dict) else {}
+          merged.update(patch)
+          values[field] = merged
+
+        pipe.multi()
+        pipe.hset(session_key, mapping=encode_session_fields(values))
+        await pipe.execute()
+        return True
+
+      except WatchError:
+        # Session changed between read and write; merge again
+        continue
+
+
+async def update_call_session(
+    call_id: str,
+    session_data: Dict[str, Any],
+    ttl: int = 3600
+) -> bool:
+  """
+  Write call session data to Redis, creating the session if needed.
+
+  Fields not in `session_data` are kept. The TTL is (re)set in the same
+  transaction, so a session created here still expires.
 
   Args:
       call_id: Call identifier
       session_data: Session data to update
+      ttl: Time to live in seconds (default 1 hour)
 
   Returns:
       True if update was successful, False otherwise
@@ -23,10 +121,50 @@ async def update_call_session(call_id: str, session_data: Dict[str, Any]) -> boo
     redis_client = await get_redis_client()
     session_key = f"call_session:{call_id}"
 
-    # Update the session data
-    redis_client.hmset(session_key, session_data)
+    async with redis_client.pipeline(transaction=True) as pipe:
+      if session_data:
+        pipe.hset(session_key, mapping=encode_session_fields(session_data))
+      pipe.expire(session_key, ttl)
+      await pipe.execute()
 
-    logger.debug(f"Updated call session for {call_id}")
+    logger.debug(f"Updated call session {call_id}")
+    return True
+
+  except Exception as e:
+    logger.error(f"Failed to update call session {call_id}: {e}")
+    return False
+
+
+async def update_call_session_fields(call_id: str, **fields: Any) -> bool:
+  """
+  Update only the given fields of an existing call session hash.
+
+  A session that has expired or been deleted is not recreated, so late
+  events cannot leave a session behind without a TTL.
+
+  Args:
+      call_id: Call identifier
+      **fields: Field names and their new values
+
+  Returns:
+      True if the session existed and was updated, False otherwise
+  """
+  try:
+    if not fields:
+      return True
+
+    redis_client = await get_redis_client()
+    patch = _get_patch_script(redis_client)
+
+    # Patch the changed fields only
+    updated = await patch(
+        keys=[f"call_session:{call_id}"], args=_patch_args(fields))
+    if not updated:
+      logger.debug(f"No call session to update for {call_id}")
+      return False
+
+    logger.debug(
+        f"Updated fields {', '.join(fields)} for call session {call_id}")
     return True
 
   except Exception as e:
@@ -36,7 +174,7 @@ async def update_call_session(call_id: str, session_data: Dict[str, Any]) -> boo
 
 async def update_call_session_field(call_id: str, field: str, value: Any) -> bool:
   """
-  Update a specific field in call session data.
+  Update a specific field in an existing call session.
 
   Args:
       call_id: Call identifier
@@ -44,19 +182,53 @@ async def update_call_session_field(call_id: str, field: str, value: Any) -> boo
       value: New value for the field
 
   Returns:
-      True if update was successful, False otherwise
+      True if the session existed and was updated, False otherwise
+  """
+  return await update_call_session_fields(call_id, **{field: value})
+
+
+async def update_call_session_atomic(
+    call_id: str,
+    fields: Dict[str, Any],
+    merge: Optional[Dict[str, Dict[str, Any]]] = None
+) -> bool:
+  """
+  Patch an existing call session.
+
+  Plain fields only are set in a single round trip; merged fields are
+  read, merged and written back in a watched transaction.
+
+  Args:
+      call_id: Call identifier
+      fields: Field names and their new values
+      merge: Field names mapped to dicts merged into the stored dict value
+
+  Returns:
+      True if the session existed and was updated, False otherwise
   """
   try:
     redis_client = await get_redis_client()
     session_key = f"call_session:{call_id}"
 
-    # Update the specific field
-    redis_client.hset(session_key, field, str(value))
+    if merge:
+      updated = await _merge_session_fields(
+          redis_client, session_key, fields, merge)
+    elif fields:
+      patch = _get_patch_script(redis_client)
+      updated = await patch(keys=[session_key], args=_patch_args(fields))
+    else:
+      updated = bool(await redis_client.exists(session_key))
+
+    if not updated:
+      logger.warning(f"Call session not found for {call_id}")
+      return False
 
-    logger.debug(f"Updated field {field} for call session {call_id}")
+    logger.debug(f"Patched call session {call_id}")
     return True
 
-  except Exception as e:
-    logger.error(
-        f"Failed to update field {field} for call session {call_id}: {e}")
+  except RedisConnectionError:
+    # Callers may retry on a fresh connection
+    raise
+  except RedisError as e:
+    logger.error(f"Failed to patch call session {call_id}: {e}")
     return False
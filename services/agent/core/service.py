@@ -22,9 +22,9 @@ class AgentService:
     """Create and initialize an agent."""
     try:
       # Import here to avoid circular imports
-      from services.llm.orchestrator import LLMOrchestrator
+      from services.llm.orchestrator import get_orchestrator
 
-      llm_orchestrator = LLMOrchestrator()
+      llm_orchestrator = get_orchestrator()
       agent_core = AgentCore(config, llm_orchestrator)
 
       self.active_agents[agent_id] = {
@@ -6,7 +6,7 @@ from typing import Optional
 from core.logging.setup import get_logger
 from core.config.registry import config_registry
 from services.ringover import RingoverAPIClient
-from services.llm.orchestrator import LLMOrchestrator
+from services.llm.orchestrator import get_orchestrator
 from services.audio.processor import AudioProcessor
 from services.transcription.realtime import RealtimeTranscription
 from services.transcription.processor import TranscriptionProcessor
@@ -28,7 +28,7 @@ class CallCoordinationManager:
     self.ringover_client = RingoverAPIClient()
 
     # Component managers
-    self.llm_orchestrator = LLMOrchestrator()
+    self.llm_orchestrator = get_orchestrator()
     self.audio_processor = AudioProcessor()
 
     # Initialize transcription service
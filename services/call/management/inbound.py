@@ -81,7 +81,8 @@ class InboundCallService:
       # Store session in Redis
       await store_call_session(
           call_id=call_id,
-          session_data=call_context.dict()
+          session_data=call_context.model_dump(
+              mode="json", by_alias=True, exclude_none=True)
       )
 
       # Update agent call count
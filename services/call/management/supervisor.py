@@ -1,6 +0,0 @@
-"""
-Call supervisor service - thin wrapper for backward compatibility.
-"""
-from .supervisor.main import CallSupervisor
-
-__all__ = ['CallSupervisor']
@@ -0,0 +1,41 @@
+"""
+Per-status counters for calls tracked by the supervisor.
+"""
+from collections import defaultdict
+from typing import Dict, Hashable
+
+
+class CallStatusCounter:
+  """
+  Keeps a running count of active calls per status.
+
+  Supervisor components report each call's status as it is registered,
+  changes or is removed, so metrics never have to scan the active calls.
+  """
+
+  __slots__ = ("_status_of", "_counts")
+
+  def __init__(self):
+    """Initialize empty counters."""
+    self._status_of: Dict[str, Hashable] = {}
+    self._counts: Dict[Hashable, int] = defaultdict(int)
+
+  def set(self, call_id: str, status: Hashable) -> None:
+    """Record the current status of a tracked call."""
+    previous = self._status_of.get(call_id)
+    if previous == status:
+      return
+    if previous is not None:
+      self._counts[previous] -= 1
+    self._counts[status] += 1
+    self._status_of[call_id] = status
+
+  def discard(self, call_id: str) -> None:
+    """Stop counting a call that is no longer tracked."""
+    previous = self._status_of.pop(call_id, None)
+    if previous is not None:
+      self._counts[previous] -= 1
+
+  def count(self, status: Hashable) -> int:
+    """Get the number of tracked calls with the given status."""
+    return self._counts.get(status, 0)
@@ -2,8 +2,17 @@
 Call event handling module.
 """
 
-from .handler import CallEventHandler
+from .handler import CallEventHandler, CallEventsMixin, wait_for_pending_writes
+from .batcher import StatusUpdateBatcher, get_status_batcher
+from .peers import register_supervisor, start_peer_listener, stop_peer_listener
 
 __all__ = [
-    'CallEventHandler'
+    'CallEventHandler',
+    'CallEventsMixin',
+    'wait_for_pending_writes',
+    'StatusUpdateBatcher',
+    'get_status_batcher',
+    'register_supervisor',
+    'start_peer_listener',
+    'stop_peer_listener'
 ]
@@ -0,0 +1,167 @@
+"""
+Batched call status writer for webhook event handling.
+"""
+import asyncio
+from typing import List, Optional, Tuple
+from datetime import datetime
+
+from data.db.ops.call import update_call_status_many
+from data.db.pool import get_db_pool
+from data.db.models.calllog import CallStatus as DbCallStatus
+from core.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
+StatusRow = Tuple[str, DbCallStatus, Optional[datetime], Optional[datetime]]
+
+# Queued by stop() to end the background loop after its current batch
+_STOP = object()
+
+
+class StatusUpdateBatcher:
+  """
+  Collects call status updates and writes them to the database in batches.
+
+  A background task flushes the queue whenever it holds `max_batch` entries
+  or `flush_interval` seconds have passed since the first queued entry.
+  """
+
+  def __init__(self, max_batch: int = 64, flush_interval: float = 0.25):
+    """Initialize batcher limits."""
+    self.max_batch = max_batch
+    self.flush_interval = flush_interval
+    self._queue: Optional[asyncio.Queue] = None
+    self._pending: List[StatusRow] = []
+    self._task: Optional[asyncio.Task] = None
+    self._flush_lock: Optional[asyncio.Lock] = None
+
+  def submit(
+      self,
+      call_id: str,
+      status: DbCallStatus,
+      answered_at: Optional[datetime] = None,
+      ended_at: Optional[datetime] = None
+  ) -> None:
+    """Queue a status update and return immediately."""
+    self._ensure_started()
+    self._queue.put_nowait((call_id, status, answered_at, ended_at))
+
+  async def flush(self) -> int:
+    """
+    Write all queued updates to the database.
+
+    Returns:
+        Number of rows written
+    """
+    if self._queue is None:
+      return 0
+
+    async with self._flush_lock:
+      rows = self._drain()
+      if not rows:
+        return 0
+      return await self._write(rows)
+
+  async def stop(self) -> None:
+    """Stop the background task after its current flush, then flush the rest."""
+    if self._task is not None:
+      if not self._task.done():
+        # Let the loop finish any write in progress instead of cancelling
+        # it with rows already taken off the queue
+        self._queue.put_nowait(_STOP)
+        await self._task
+      self._task = None
+
+    await self.flush()
+
+  def _ensure_started(self) -> None:
+    """Create the queue and background task on first use."""
+    if self._queue is None:
+      self._queue = asyncio.Queue()
+      self._flush_lock = asyncio.Lock()
+
+    if self._task is None or self._task.done():
+      self._task = asyncio.create_task(self._run())
+
+  async def _run(self) -> None:
+    """Background loop flushing on batch size or timer."""
+    loop = asyncio.get_running_loop()
+
+    while True:
+      # Block until there is at least one update to write
+      row = await self._queue.get()
+      if row is _STOP:
+        return
+      self._pending.append(row)
+
+      stopping = False
+      deadline = loop.time() + self.flush_interval
+      while len(self._pending) < self.max_batch:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+          break
+        try:
+          row = await asyncio.wait_for(self._queue.get(), remaining)
+        except asyncio.TimeoutError:
+          break
+        if row is _STOP:
+          stopping = True
+          break
+        self._pending.append(row)
+
+      try:
+        await self.flush()
+      except Exception as e:
+        logger.error("Failed to flush call status batch: %s", e)
+
+      if stopping:
+        return
+
+  def _drain(self) -> List[StatusRow]:
+    """Take every queued update, keeping only the latest one per call."""
+    rows = self._pending
+    self._pending = []
+    stopping = False
+    while not self._queue.empty():
+      row = self._queue.get_nowait()
+      if row is _STOP:
+        stopping = True
+      else:
+        rows.append(row)
+
+    if stopping:
+      # Hand the stop signal back to the background loop
+      self._queue.put_nowait(_STOP)
+
+    latest = {}
+    for call_id, status, answered_at, ended_at in rows:
+      previous = latest.get(call_id)
+      if previous is not None:
+        # Keep timing fields set by earlier events for the same call
+        answered_at = answered_at or previous[2]
+        ended_at = ended_at or previous[3]
+      latest[call_id] = (call_id, status, answered_at, ended_at)
+    return list(latest.values())
+
+  async def _write(self, rows: List[StatusRow]) -> int:
+    """Write a batch of rows on the shared connection pool."""
+    return await update_call_status_many(None, rows, pool=get_db_pool())
+
+
+# Global batcher instance
+_status_batcher: Optional[StatusUpdateBatcher] = None
+
+
+def get_status_batcher() -> StatusUpdateBatcher:
+  """
+  Get or create the shared status update batcher.
+
+  Returns:
+      StatusUpdateBatcher instance
+  """
+  global _status_batcher
+
+  if _status_batcher is None:
+    _status_batcher = StatusUpdateBatcher()
+
+  return _status_batcher
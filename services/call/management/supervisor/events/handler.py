@@ -1,135 +1,239 @@
 """
 Call event handler for processing webhook events.
 """
-from typing import Dict, Any, Optional
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator, Deque, Optional, Set, Tuple, Coroutine
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 
-from data.db.ops.call import update_call_status
-from data.redis.ops.session import update_call_session
-from models.internal.callcontext import CallContext, CallStatus as ContextCallStatus
+from data.redis.ops.session import update_call_session, update_call_session_fields
+from data.redis.ops.events import publish_call_event
+from models.internal.callcontext import CallContext, CallDirection, CallStatus as ContextCallStatus
 from data.db.models.calllog import CallStatus as DbCallStatus
 from core.logging.setup import get_logger
 
+from ..counts import CallStatusCounter
+from ..guard import safe_bool
+from .batcher import StatusUpdateBatcher, get_status_batcher
+
 logger = get_logger(__name__)
 
+# Bound once; saves an attribute lookup per log call on the hot path
+_log_info = logger.info
+_log_warning = logger.warning
+_log_error = logger.error
 
-class CallEventHandler:
-  """Handles call events from webhooks."""
+_UTC = timezone.utc
+
+# Status members bound once; avoids enum attribute lookups per event
+_ANSWERED = DbCallStatus.ANSWERED
+_COMPLETED = DbCallStatus.COMPLETED
+_FAILED = DbCallStatus.FAILED
+_CTX_ANSWERED = ContextCallStatus.ANSWERED
+_CTX_ENDED = ContextCallStatus.ENDED
+_CTX_FAILED = ContextCallStatus.FAILED
+_CTX_INITIATED = ContextCallStatus.INITIATED
+
+# Fields that change when a call is answered or ends; only these are re-sent
+_ANSWER_FIELDS = frozenset({"status", "start_time"})
+_END_FIELDS = frozenset({"status", "end_time", "duration"})
+
+# Webhook event type aliases mapped to handler method names
+_DISPATCH: Dict[str, str] = {
+    "call_answered": "handle_call_answered",
+    "answered": "handle_call_answered",
+    "call_hangup": "handle_call_hangup",
+    "hangup": "handle_call_hangup",
+    "ended": "handle_call_hangup",
+    "call_failed": "handle_call_failed",
+    "failed": "handle_call_failed",
+}
+
+# Outstanding background Redis writes; strong references keep them alive
+_pending_writes: Set[asyncio.Task] = set()
+
+
+def _bg(coro: Coroutine) -> asyncio.Task:
+  """Run a Redis write in the background, logging any failure."""
+  task = asyncio.create_task(coro)
+  _pending_writes.add(task)
+  task.add_done_callback(_on_write_done)
+  return task
+
+
+def _on_write_done(task: asyncio.Task) -> None:
+  """Drop a finished background write and log its exception, if any."""
+  _pending_writes.discard(task)
+  if not task.cancelled() and task.exception() is not None:
+    _log_error("Background Redis write failed: %s", task.exception())
+
+
+async def wait_for_pending_writes() -> None:
+  """Wait for all outstanding background Redis writes to finish."""
+  if _pending_writes:
+    await asyncio.gather(*list(_pending_writes), return_exceptions=True)
+
+
+class _CallLock:
+  """Lock for a single call with the number of events holding or awaiting it."""
+
+  __slots__ = ("lock", "users")
+
+  def __init__(self):
+    self.lock = asyncio.Lock()
+    self.users = 0
 
-  def __init__(self, active_calls: Dict[str, CallContext]):
-    """Initialize with reference to active calls."""
-    self.active_calls = active_calls
 
+class CallEventsMixin:
+  """
+  Webhook event handling shared by CallEventHandler and CallSupervisor.
+
+  Hosts provide `active_calls`, `ringover_index`, `status_counts` and
+  `_start_order`, and call `_setup_events()` once during initialization.
+  """
+
+  __slots__ = ()
+
+  active_calls: "OrderedDict[str, CallContext]"
+  ringover_index: Dict[str, str]
+  status_counts: CallStatusCounter
+  status_batcher: StatusUpdateBatcher
+  _locks: Dict[str, _CallLock]
+  _start_order: Deque[Tuple[float, str]]
+
+  def _setup_events(self) -> None:
+    """Initialize state private to event handling."""
+    self.status_batcher = get_status_batcher()
+    self._locks = {}
+
+  @asynccontextmanager
+  async def _call_lock(self, call_id: str) -> AsyncIterator[None]:
+    """
+    Serialize events for a single call.
+
+    The lock is created on first use and dropped once no event holds or
+    awaits it, so calls leave no entry behind however they are removed.
+    """
+    entry = self._locks.get(call_id)
+    if entry is None:
+      entry = self._locks[call_id] = _CallLock()
+
+    entry.users += 1
+    try:
+      async with entry.lock:
+        yield
+    finally:
+      entry.users -= 1
+      if not entry.users:
+        del self._locks[call_id]
+
+  @safe_bool
   async def handle_call_answered(
       self,
       call_context: CallContext,
       session
   ) -> bool:
     """Handle call answered event."""
-    try:
-      # Update call status
-      success = await update_call_status(
-          session=session,
+    async with self._call_lock(call_context.call_id):
+      now = datetime.now(_UTC)
+
+      # Queue call status update
+      self.status_batcher.submit(
           call_id=call_context.call_id,
-          status=DbCallStatus.ANSWERED,
-          answered_at=datetime.now(timezone.utc)
+          status=_ANSWERED,
+          answered_at=now
       )
 
-      if success:
-        # Update context
-        call_context.status = ContextCallStatus.ANSWERED
-        call_context.start_time = datetime.now(timezone.utc)
+      # Update context
+      call_context.status = _CTX_ANSWERED
+      call_context.start_time = now
 
-        # Store updated context
-        await update_call_session(
+      # Store updated context; calls already tracked only need the delta
+      if call_context.call_id in self.active_calls:
+        _bg(update_call_session_fields(
+            call_context.call_id,
+            **call_context.model_dump(mode="json", include=_ANSWER_FIELDS)
+        ))
+      else:
+        _bg(update_call_session(
             call_id=call_context.call_id,
             session_data=call_context.model_dump(
-                by_alias=True, exclude_none=True
+                mode="json", by_alias=True, exclude_none=True
             )
-        )
+        ))
 
-        # Register as active call
-        self.active_calls[call_context.call_id] = call_context
+      # Register as active call
+      self.active_calls[call_context.call_id] = call_context
+      self.active_calls.move_to_end(call_context.call_id)
+      self.status_counts.set(call_context.call_id, _CTX_ANSWERED)
+      if call_context.ringover_call_id:
+        self.ringover_index[call_context.ringover_call_id] = call_context.call_id
+      # Answering restarts the call's clock, so queue it for expiry again
+      self._start_order.append((now.timestamp(), call_context.call_id))
 
-        logger.info(f"Call {call_context.call_id} answered and active")
-        return True
+      # Let peer workers know about the transition
+      _bg(publish_call_event(call_context.call_id, call_context.status.value))
 
-      return False
-
-    except Exception as e:
-      logger.error(f"Failed to handle call answered: {e}")
-      return False
+      _log_info("Call %s answered and active", call_context.call_id)
+      return True
 
+  @safe_bool
   async def handle_call_hangup(
       self,
       call_context: CallContext,
       session
   ) -> bool:
     """Handle call hangup event."""
-    try:
-      # Update call status
-      end_time = datetime.now(timezone.utc)
-      success = await update_call_status(
-          session=session,
+    async with self._call_lock(call_context.call_id):
+      # Queue call status update
+      end_time = datetime.now(_UTC)
+      self.status_batcher.submit(
           call_id=call_context.call_id,
-          status=DbCallStatus.COMPLETED,
+          status=_COMPLETED,
           ended_at=end_time
       )
 
-      if success:
-        # Calculate duration
-        if call_context.start_time:
-          duration = int((end_time - call_context.start_time).total_seconds())
-          call_context.duration = duration
+      # Calculate duration
+      if call_context.start_time:
+        duration = int((end_time - call_context.start_time).total_seconds())
+        call_context.duration = duration
 
-        # Update context
-        call_context.status = ContextCallStatus.ENDED
-        call_context.end_time = end_time
+      # Update context
+      call_context.status = _CTX_ENDED
+      call_context.end_time = end_time
 
-        # Clean up
-        await self._cleanup_call(call_context)
+      # Clean up
+      await self._cleanup_call(call_context)
 
-        logger.info(f"Call {call_context.call_id} ended successfully")
-        return True
-
-      return False
-
-    except Exception as e:
-      logger.error(f"Failed to handle call hangup: {e}")
-      return False
+      _log_info("Call %s ended successfully", call_context.call_id)
+      return True
 
+  @safe_bool
   async def handle_call_failed(
       self,
       call_context: CallContext,
       session
   ) -> bool:
     """Handle call failed event."""
-    try:
-      # Update call status
-      end_time = datetime.now(timezone.utc)
-      success = await update_call_status(
-          session=session,
+    async with self._call_lock(call_context.call_id):
+      # Queue call status update
+      end_time = datetime.now(_UTC)
+      self.status_batcher.submit(
           call_id=call_context.call_id,
-          status=DbCallStatus.FAILED,
+          status=_FAILED,
           ended_at=end_time
       )
 
-      if success:
-        # Update context
-        call_context.status = ContextCallStatus.FAILED
-        call_context.end_time = end_time
+      # Update context
+      call_context.status = _CTX_FAILED
+      call_context.end_time = end_time
 
-        # Clean up
-        await self._cleanup_call(call_context)
+      # Clean up
+      await self._cleanup_call(call_context)
 
-        logger.info(f"Call {call_context.call_id} marked as failed")
-        return True
-
-      return False
-
-    except Exception as e:
-      logger.error(f"Failed to handle call failure: {e}")
-      return False
+      _log_info("Call %s marked as failed", call_context.call_id)
+      return True
 
   async def _cleanup_call(self, call_context: CallContext) -> None:
     """Clean up call resources."""
@@ -137,73 +241,125 @@ class CallEventHandler:
       # Remove from active calls
       if call_context.call_id in self.active_calls:
         del self.active_calls[call_context.call_id]
+      self.status_counts.discard(call_context.call_id)
+      if call_context.ringover_call_id:
+        self.ringover_index.pop(call_context.ringover_call_id, None)
 
-      # Update session storage
-      await update_call_session(
-          call_id=call_context.call_id,
-          session_data=call_context.dict()
-      )
+      # Update session storage with the end-of-call delta only
+      _bg(update_call_session_fields(
+          call_context.call_id,
+          **call_context.model_dump(
+              mode="json", include=_END_FIELDS, exclude_none=True
+          )
+      ))
 
-      logger.info(f"Cleaned up call {call_context.call_id}")
+      # Let peer workers drop the call from their active maps
+      _bg(publish_call_event(call_context.call_id, call_context.status.value))
+
+      _log_info("Cleaned up call %s", call_context.call_id)
 
     except Exception as e:
-      logger.error(f"Failed to cleanup call {call_context.call_id}: {e}")
+      _log_error("Failed to cleanup call %s: %s", call_context.call_id, e)
 
-  async def handle_event(self, webhook_event, session) -> bool:
+  @safe_bool
+  async def handle_event(
+      self,
+      webhook_event,
+      session,
+      call_id: Optional[str] = None
+  ) -> bool:
     """
     Handle webhook events by routing to appropriate handlers.
 
     Args:
         webhook_event: The webhook event from Ringover
         session: Database session
+        call_id: Our call ID when already resolved from the Ringover ID
 
     Returns:
         True if event was handled successfully
     """
-    try:
-      # Get or create call context
-      call_context = await self._get_or_create_call_context(webhook_event)
-
-      # Route to appropriate handler based on event type
-      event_type = webhook_event.event_type.lower()
-
-      if event_type in ['call_answered', 'answered']:
-        return await self.handle_call_answered(call_context, session)
-      elif event_type in ['call_hangup', 'hangup', 'ended']:
-        return await self.handle_call_hangup(call_context, session)
-      elif event_type in ['call_failed', 'failed']:
-        return await self.handle_call_failed(call_context, session)
-      else:
-        logger.warning(f"Unhandled event type: {event_type}")
-        return False
-
-    except Exception as e:
-      logger.error(f"Failed to handle event: {e}")
+    # Get or create call context
+    call_context = await self._get_or_create_call_context(
+        webhook_event, call_id)
+
+    # Route to appropriate handler based on event type
+    event_type = webhook_event.event_type
+    method_name = _DISPATCH.get(event_type)
+    if method_name is None:
+      event_type = event_type.lower()
+      method_name = _DISPATCH.get(event_type)
+
+    if method_name is None:
+      _log_warning("Unhandled event type: %s", event_type)
       return False
 
-  async def _get_or_create_call_context(self, webhook_event) -> CallContext:
+    return await getattr(self, method_name)(call_context, session)
+
+  async def _get_or_create_call_context(
+      self,
+      webhook_event,
+      call_id: Optional[str] = None
+  ) -> CallContext:
     """Get existing call context or create new one from webhook event."""
+    # Extract webhook fields once instead of probing attributes one by one
+    if hasattr(webhook_event, 'model_dump'):
+      data = webhook_event.model_dump()
+    elif isinstance(webhook_event, dict):
+      data = webhook_event
+    else:
+      data = vars(webhook_event)
+
     # Check if we already have this call in active calls
-    call_id = getattr(webhook_event, 'call_id', None)
+    ringover_call_id = data.get('call_id')
+    call_id = call_id or ringover_call_id
     if call_id and call_id in self.active_calls:
+      # Mark as most recently active
+      self.active_calls.move_to_end(call_id)
       return self.active_calls[call_id]
 
     # Create new context from webhook event
     # This is a simplified version - you may need to adjust based on your webhook structure
-    from models.internal.callcontext import CallDirection
-
-    context = CallContext(
-        call_id=call_id or str(webhook_event.get('id', '')),
+    # Fields come from our own webhook model, so skip per-field validation
+    context = CallContext.model_construct(
+        call_id=call_id or str(data.get('id', '')),
         session_id=f"session_{call_id}",
-        phone_number=getattr(webhook_event, 'phone_number', ''),
-        agent_id=getattr(webhook_event, 'agent_id', 'default'),
+        phone_number=data.get('phone_number', ''),
+        agent_id=data.get('agent_id', 'default'),
         direction=CallDirection.INBOUND,
-        status=ContextCallStatus.INITIATED,
+        status=_CTX_INITIATED,
         start_time=None,
         end_time=None,
         duration=None,
-        ringover_call_id=getattr(webhook_event, 'ringover_call_id', None),
+        ringover_call_id=data.get('ringover_call_id', ringover_call_id),
         websocket_id=None
     )
 
     return context
+
+
+class CallEventHandler(CallEventsMixin):
+  """Handles call events from webhooks."""
+
+  __slots__ = (
+      "active_calls",
+      "ringover_index",
+      "status_counts",
+      "status_batcher",
+      "_locks",
+      "_start_order",
+  )
+
+  def __init__(
+      self,
+      active_calls: "OrderedDict[str, CallContext]",
+      ringover_index: Optional[Dict[str, str]] = None,
+      status_counts: Optional[CallStatusCounter] = None,
+      start_order: Optional[Deque[Tuple[float, str]]] = None
+  ):
+    """Initialize with references to shared call tracking state."""
+    self.active_calls = active_calls
+    self.ringover_index = ringover_index if ringover_index is not None else {}
+    self.status_counts = status_counts or CallStatusCounter()
+    self._start_order = start_order if start_order is not None else deque()
+    self._setup_events()
@@ -0,0 +1,61 @@
+"""
+Drops calls from local supervisors when a peer worker ends them.
+"""
+import asyncio
+import weakref
+from typing import Optional, TYPE_CHECKING
+
+from data.redis.ops.events import listen_call_events
+from models.internal.callcontext import CallStatus as ContextCallStatus
+from core.logging.setup import get_logger
+
+if TYPE_CHECKING:
+  from services.call.management.supervisor.main import CallSupervisor
+
+logger = get_logger(__name__)
+
+# Statuses after which a call no longer belongs in any active-call map
+_TERMINAL_STATUSES = frozenset({
+    ContextCallStatus.ENDED.value,
+    ContextCallStatus.FAILED.value
+})
+
+_supervisors: "weakref.WeakSet[CallSupervisor]" = weakref.WeakSet()
+_listener_task: Optional[asyncio.Task] = None
+
+
+def register_supervisor(supervisor: "CallSupervisor") -> None:
+  """Register a supervisor to receive peer call events."""
+  _supervisors.add(supervisor)
+
+
+def _on_call_event(call_id: str, status: str) -> None:
+  """Evict a call ended elsewhere from every local supervisor."""
+  if status not in _TERMINAL_STATUSES:
+    return
+
+  for supervisor in list(_supervisors):
+    supervisor.evict_call(call_id)
+
+
+def start_peer_listener() -> None:
+  """Start the process-wide call event listener if not running."""
+  global _listener_task
+
+  if _listener_task is None or _listener_task.done():
+    _listener_task = asyncio.create_task(listen_call_events(_on_call_event))
+
+
+async def stop_peer_listener() -> None:
+  """Stop the call event listener."""
+  global _listener_task
+
+  if _listener_task is not None:
+    _listener_task.cancel()
+    try:
+      await _listener_task
+    except asyncio.CancelledError:
+      pass
+    except Exception as e:
+      logger.error("Call event listener stopped with error: %s", e)
+    _listener_task = None
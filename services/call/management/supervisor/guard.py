@@ -0,0 +1,44 @@
+"""
+Error guards shared by supervisor components.
+"""
+import functools
+from typing import Any, Awaitable, Callable, Optional
+
+from core.logging.setup import get_logger
+
+AsyncFn = Callable[..., Awaitable[Any]]
+
+
+def log_and_swallow(
+    default: Any = False,
+    default_factory: Optional[Callable[[], Any]] = None
+) -> Callable[[AsyncFn], AsyncFn]:
+  """
+  Log and swallow any exception raised by an async method.
+
+  Args:
+      default: Value returned when the method raises
+      default_factory: Builds a fresh return value instead of `default`,
+          for mutable results such as dicts
+
+  Returns:
+      Decorator guarding the method
+  """
+  def decorator(fn: AsyncFn) -> AsyncFn:
+    logger = get_logger(fn.__module__)
+
+    @functools.wraps(fn)
+    async def wrap(*args, **kwargs):
+      try:
+        return await fn(*args, **kwargs)
+      except Exception as e:
+        logger.error("%s failed: %s", fn.__qualname__, e)
+        return default_factory() if default_factory else default
+
+    return wrap
+
+  return decorator
+
+
+# Guard for methods reporting success as a bool
+safe_bool = log_and_swallow(False)
@@ -2,8 +2,9 @@
 Call lifecycle management module.
 """
 
-from .manager import CallLifecycleManager
+from .manager import CallLifecycleManager, CallLifecycleMixin
 
 __all__ = [
-    'CallLifecycleManager'
+    'CallLifecycleManager',
+    'CallLifecycleMixin'
 ]
@@ -1,7 +1,8 @@
 """
 Call lifecycle manager for handling call creation and termination.
 """
-from typing import Optional, Dict
+from typing import Optional, Dict, Deque, Tuple
+from collections import OrderedDict, deque
 import uuid
 from datetime import datetime, timezone
 
@@ -9,22 +10,45 @@ from data.redis.ops.session import store_call_session, delete_call_session
 from models.internal.callcontext import CallContext, CallDirection, CallStatus
 from core.logging.setup import get_logger
 
+from ..counts import CallStatusCounter
+from ..guard import log_and_swallow, safe_bool
+
 logger = get_logger(__name__)
 
+# Bound once; saves an attribute lookup per log call on the hot path
+_log_info = logger.info
+_log_warning = logger.warning
+_log_error = logger.error
 
-class CallLifecycleManager:
-  """Manages call lifecycle operations."""
 
-  def __init__(self, active_calls: Dict[str, CallContext]):
-    """Initialize with reference to active calls."""
-    self.active_calls = active_calls
+class CallLifecycleMixin:
+  """
+  Call start, end and expiry shared by CallLifecycleManager and CallSupervisor.
+
+  Hosts provide `active_calls`, `ringover_index`, `status_counts` and
+  `_start_order`, the (start timestamp, call_id) queue shared with event
+  handling so expiry sweeps only touch calls old enough to expire.
+  """
+
+  # Calls older than this are considered stale
+  INACTIVE_CALL_TIMEOUT = 7200  # 2 hours
+  # Upper bound on tracked calls; the least recently active are evicted first
+  MAX_ACTIVE_CALLS = 10000
+
+  __slots__ = ()
+
+  active_calls: "OrderedDict[str, CallContext]"
+  ringover_index: Dict[str, str]
+  status_counts: CallStatusCounter
+  _start_order: Deque[Tuple[float, str]]
 
   async def start_call(
       self,
       call_id: str,
       agent_id: str,
       phone_number: str,
-      websocket_id: Optional[str] = None
+      websocket_id: Optional[str] = None,
+      ringover_call_id: Optional[str] = None
   ) -> Optional[CallContext]:
     """
     Start a new call and create call context.
@@ -34,6 +58,7 @@ class CallLifecycleManager:
         agent_id: Agent handling the call
         phone_number: Phone number for the call
         websocket_id: WebSocket connection ID
+        ringover_call_id: Ringover's call ID, if already known
 
     Returns:
         Created CallContext or None if failed
@@ -42,7 +67,7 @@ class CallLifecycleManager:
       # Create call context
       call_context = CallContext(
           call_id=call_id,
-          session_id=str(uuid.uuid4()),
+          session_id=uuid.uuid4().hex,
           phone_number=phone_number,
           agent_id=agent_id,
           direction=CallDirection.OUTBOUND,
@@ -50,23 +75,46 @@ class CallLifecycleManager:
           start_time=datetime.now(timezone.utc),
           end_time=None,
           duration=None,
-          ringover_call_id=None,
+          ringover_call_id=ringover_call_id,
           websocket_id=websocket_id
       )
 
       # Store in active calls
       self.active_calls[call_id] = call_context
+      self.active_calls.move_to_end(call_id)
+      self.status_counts.set(call_id, call_context.status)
+      if ringover_call_id:
+        self.ringover_index[ringover_call_id] = call_id
+      self._start_order.append((call_context.start_time.timestamp(), call_id))
 
       # Store session data
-      await store_call_session(call_id, call_context.dict())
+      await store_call_session(
+          call_id,
+          call_context.model_dump(
+              mode="json", by_alias=True, exclude_none=True)
+      )
+
+      # Expire calls past the inactivity timeout as new ones arrive, so
+      # zombies cannot pile up when no periodic cleanup is running
+      await self._expire_started_before(
+          call_context.start_time.timestamp() - self.INACTIVE_CALL_TIMEOUT)
+
+      # Evict least recently active calls beyond the cap
+      while len(self.active_calls) > self.MAX_ACTIVE_CALLS:
+        stale_call_id = next(iter(self.active_calls))
+        _log_warning("Active call limit reached, evicting %s", stale_call_id)
+        if not await self.end_call(stale_call_id):
+          self.active_calls.pop(stale_call_id, None)
+          self.status_counts.discard(stale_call_id)
 
-      logger.info(f"Started call {call_id} with agent {agent_id}")
+      _log_info("Started call %s with agent %s", call_id, agent_id)
       return call_context
 
     except Exception as e:
-      logger.error(f"Failed to start call {call_id}: {e}")
+      _log_error("Failed to start call %s: %s", call_id, e)
       return None
 
+  @safe_bool
   async def end_call(self, call_id: str) -> bool:
     """
     End a call and clean up resources.
@@ -77,32 +125,30 @@ class CallLifecycleManager:
     Returns:
         True if call ended successfully
     """
-    try:
-      call_context = self.active_calls.get(call_id)
-      if not call_context:
-        logger.warning(f"Call {call_id} not found in active calls")
-        return False
+    call_context = self.active_calls.get(call_id)
+    if not call_context:
+      _log_warning("Call %s not found in active calls", call_id)
+      return False
 
-      # Update call context
-      call_context.status = CallStatus.ENDED
-      call_context.end_time = datetime.now(timezone.utc)
+    # Update call context
+    call_context.status = CallStatus.ENDED
+    call_context.end_time = datetime.now(timezone.utc)
 
-      if call_context.start_time:
-        duration = call_context.end_time - call_context.start_time
-        call_context.duration = int(duration.total_seconds())
+    if call_context.start_time:
+      duration = call_context.end_time - call_context.start_time
+      call_context.duration = int(duration.total_seconds())
 
-      # Remove from active calls
-      del self.active_calls[call_id]
+    # Remove from active calls
+    del self.active_calls[call_id]
+    self.status_counts.discard(call_id)
+    if call_context.ringover_call_id:
+      self.ringover_index.pop(call_context.ringover_call_id, None)
 
-      # Clean up session data
-      await delete_call_session(call_id)
+    # Clean up session data
+    await delete_call_session(call_id)
 
-      logger.info(f"Ended call {call_id}")
-      return True
-
-    except Exception as e:
-      logger.error(f"Failed to end call {call_id}: {e}")
-      return False
+    _log_info("Ended call %s", call_id)
+    return True
 
   def get_active_calls(self) -> list[CallContext]:
     """Get list of all active calls."""
@@ -112,6 +158,7 @@ class CallLifecycleManager:
     """Get count of active calls."""
     return len(self.active_calls)
 
+  @log_and_swallow(default=0)
   async def cleanup_inactive_calls(self) -> int:
     """
     Clean up inactive calls (calls that have been inactive for too long).
@@ -119,36 +166,61 @@ class CallLifecycleManager:
     Returns:
         Number of calls cleaned up
     """
-    try:
-      current_time = datetime.now(timezone.utc)
-      cleanup_count = 0
-      calls_to_remove = []
-
-      # Find calls that need cleanup
-      for call_id, call_context in self.active_calls.items():
-        # Define criteria for inactive calls
-        # Example: calls that started more than 2 hours ago without proper end
-        if (call_context.start_time and
-                (current_time - call_context.start_time).total_seconds() > 7200):  # 2 hours
-          calls_to_remove.append(call_id)
-        # Or calls with status ended but still in active calls
-        elif call_context.status == CallStatus.ENDED:
-          calls_to_remove.append(call_id)
-
-      # Remove inactive calls
-      for call_id in calls_to_remove:
-        try:
-          await self.end_call(call_id)
-          cleanup_count += 1
-          logger.info(f"Cleaned up inactive call: {call_id}")
-        except Exception as e:
-          logger.error(f"Failed to cleanup call {call_id}: {e}")
-
-      if cleanup_count > 0:
-        logger.info(f"Cleaned up {cleanup_count} inactive calls")
-
-      return cleanup_count
+    cutoff = datetime.now(timezone.utc).timestamp() - self.INACTIVE_CALL_TIMEOUT
+    cleanup_count = await self._expire_started_before(cutoff)
 
-    except Exception as e:
-      logger.error(f"Failed to cleanup inactive calls: {e}")
-      return 0
+    if cleanup_count > 0:
+      _log_info("Cleaned up %s inactive calls", cleanup_count)
+
+    return cleanup_count
+
+  async def _expire_started_before(self, cutoff: float) -> int:
+    """
+    End calls started before `cutoff`; only entries old enough are touched.
+
+    Args:
+        cutoff: Epoch seconds; calls started earlier are ended
+
+    Returns:
+        Number of calls ended
+    """
+    expired_count = 0
+
+    while self._start_order and self._start_order[0][0] < cutoff:
+      _, call_id = self._start_order.popleft()
+      call_context = self.active_calls.get(call_id)
+
+      # Skip calls already ended or restarted since they were queued
+      if (call_context is None or not call_context.start_time or
+              call_context.start_time.timestamp() >= cutoff):
+        continue
+
+      if await self.end_call(call_id):
+        expired_count += 1
+        _log_info("Cleaned up inactive call: %s", call_id)
+
+    return expired_count
+
+
+class CallLifecycleManager(CallLifecycleMixin):
+  """Manages call lifecycle operations."""
+
+  __slots__ = (
+      "active_calls",
+      "ringover_index",
+      "status_counts",
+      "_start_order",
+  )
+
+  def __init__(
+      self,
+      active_calls: "OrderedDict[str, CallContext]",
+      ringover_index: Optional[Dict[str, str]] = None,
+      status_counts: Optional[CallStatusCounter] = None,
+      start_order: Optional[Deque[Tuple[float, str]]] = None
+  ):
+    """Initialize with references to shared call tracking state."""
+    self.active_calls = active_calls
+    self.ringover_index = ringover_index if ringover_index is not None else {}
+    self.status_counts = status_counts or CallStatusCounter()
+    self._start_order = start_order if start_order is not None else deque()
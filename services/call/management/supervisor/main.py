@@ -1,36 +1,65 @@
 """
 Main call supervisor class that coordinates all supervisor components.
 """
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timezone
+from typing import Dict, Mapping, Optional
+from collections import OrderedDict, deque
+from types import MappingProxyType
 
 from data.db.ops.call import get_call_by_ringover_id
-from data.redis.ops.session import get_call_session
 from models.external.ringover.webhook import RingoverWebhookEvent
 from models.internal.callcontext import CallContext
 from core.logging.setup import get_logger
 
-from .events.handler import CallEventHandler
-from .lifecycle.manager import CallLifecycleManager
-from .operations.manager import CallOperationsManager
+from .counts import CallStatusCounter
+from .guard import safe_bool
+from .events.handler import CallEventsMixin
+from .events.peers import register_supervisor
+from .lifecycle.manager import CallLifecycleMixin
+from .operations.manager import CallOperationsMixin
 
 logger = get_logger(__name__)
 
+# Bound once; saves an attribute lookup per log call on the hot path
+_log_info = logger.info
 
-class CallSupervisor:
+
+class CallSupervisor(CallEventsMixin, CallLifecycleMixin, CallOperationsMixin):
   """
   Service for supervising and managing active calls.
-  Uses modular components for event handling, lifecycle management, and operations.
+  Event handling, lifecycle management, and operations are mixed in so their
+  methods are called directly on the supervisor.
   """
 
-  def __init__(self):
-    self._active_calls: Dict[str, CallContext] = {}
-
-    # Initialize modular components
-    self.event_handler = CallEventHandler(self._active_calls)
-    self.lifecycle_manager = CallLifecycleManager(self._active_calls)
-    self.operations_manager = CallOperationsManager(self._active_calls)
+  # __weakref__ keeps instances registrable with the peer listener's WeakSet
+  __slots__ = (
+      "active_calls",
+      "_active_calls_view",
+      "ringover_index",
+      "status_counts",
+      "status_batcher",
+      "_locks",
+      "_start_order",
+      "__weakref__",
+  )
 
+  def __init__(self):
+    self.active_calls: "OrderedDict[str, CallContext]" = OrderedDict()
+    # Read-only live view handed out to callers; copy it for a snapshot
+    self._active_calls_view: Mapping[str, CallContext] = MappingProxyType(
+        self.active_calls)
+    # Ringover call ID -> internal call ID for calls we know about
+    self.ringover_index: Dict[str, str] = {}
+    # Running per-status totals kept in step with active calls
+    self.status_counts = CallStatusCounter()
+    # (start timestamp, call_id) in start order, for O(expired) sweeps
+    self._start_order = deque()
+
+    self._setup_events()
+
+    # Receive call-ended events published by peer workers
+    register_supervisor(self)
+
+  @safe_bool
   async def handle_call_event(
       self,
       webhook_event: RingoverWebhookEvent,
@@ -46,52 +75,43 @@ class CallSupervisor:
     Returns:
         True if event was handled successfully
     """
-    try:
-      event_type = webhook_event.event_type
-      ringover_call_id = webhook_event.call_id
-
-      logger.info(
-          f"Handling call event: {event_type} for call {ringover_call_id}")
-
-      # Use modular event handler
-      return await self.event_handler.handle_event(webhook_event, session)
-
-    except Exception as e:
-      logger.error(f"Error handling call event: {e}")
-      return False
+    event_type = webhook_event.event_type
+    ringover_call_id = webhook_event.call_id
 
-  async def get_active_calls(self) -> Dict[str, CallContext]:
-    """Get all active calls."""
-    return self._active_calls.copy()
+    _log_info(
+        "Handling call event: %s for call %s", event_type, ringover_call_id)
 
-  async def get_call_status(self, call_id: str) -> Optional[Dict[str, Any]]:
-    """Get status of a specific call."""
-    return await self.operations_manager.get_call_status(call_id)
+    call_id = await self._resolve_call_id(ringover_call_id, session)
 
-  async def cleanup_inactive_calls(self):
-    """Clean up inactive calls."""
-    await self.lifecycle_manager.cleanup_inactive_calls()
+    return await self.handle_event(webhook_event, session, call_id=call_id)
 
-  async def get_call_metrics(self) -> Dict[str, Any]:
-    """Get call metrics."""
-    return await self.operations_manager.get_call_metrics()
-
-  async def update_call_context(self, call_id: str, context_updates: Dict[str, Any]):
-    """Update call context."""
-    await self.operations_manager.update_call_context(call_id, context_updates)
-
-  async def end_call(self, call_id: str):
-    """End a call."""
-    await self.lifecycle_manager.end_call(call_id)
-
-  async def pause_call(self, call_id: str):
-    """Pause a call."""
-    await self.operations_manager.pause_call(call_id)
-
-  async def resume_call(self, call_id: str):
-    """Resume a call."""
-    await self.operations_manager.resume_call(call_id)
-
-  async def transfer_call(self, call_id: str, target_number: str) -> bool:
-    """Transfer a call to another number."""
-    return await self.operations_manager.transfer_call(call_id, target_number)
+  async def _resolve_call_id(
+      self,
+      ringover_call_id: Optional[str],
+      session
+  ) -> Optional[str]:
+    """Map a Ringover call ID to our call ID, hitting the DB only on a miss."""
+    if not ringover_call_id:
+      return None
+
+    call_id = self.ringover_index.get(ringover_call_id)
+    if call_id is not None:
+      return call_id
+
+    call_log = await get_call_by_ringover_id(session, ringover_call_id)
+    if call_log is None:
+      return None
+
+    self.ringover_index[ringover_call_id] = call_log.call_id
+    return call_log.call_id
+
+  def evict_call(self, call_id: str) -> None:
+    """Drop a call that another worker has ended from local state."""
+    call_context = self.active_calls.pop(call_id, None)
+    self.status_counts.discard(call_id)
+    if call_context is not None and call_context.ringover_call_id:
+      self.ringover_index.pop(call_context.ringover_call_id, None)
+
+  async def get_active_calls(self) -> Mapping[str, CallContext]:
+    """Get a read-only live view of all active calls."""
+    return self._active_calls_view
@@ -2,8 +2,9 @@
 Call operations management module.
 """
 
-from .manager import CallOperationsManager
+from .manager import CallOperationsManager, CallOperationsMixin
 
 __all__ = [
-    'CallOperationsManager'
+    'CallOperationsManager',
+    'CallOperationsMixin'
 ]
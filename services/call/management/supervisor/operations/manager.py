@@ -1,22 +1,42 @@
 """
 Call operations manager for handling call control operations.
 """
-from typing import Dict, Optional, Any, Optional, Any
+from typing import Dict, Optional, Any
+from collections import deque
 from datetime import datetime, timezone
+import time
 
-from models.internal.callcontext import CallContext
+from models.internal.callcontext import CallContext, CallStatus
 from core.logging.setup import get_logger
 
+from ..counts import CallStatusCounter
+from ..guard import log_and_swallow, safe_bool
+
 logger = get_logger(__name__)
 
+# Bound once; saves an attribute lookup per log call on the hot path
+_log_info = logger.info
+_log_warning = logger.warning
 
-class CallOperationsManager:
-  """Manages call operations like transfer and DTMF."""
+_UTC = timezone.utc
 
-  def __init__(self, active_calls: Dict[str, CallContext]):
-    """Initialize with reference to active calls."""
-    self.active_calls = active_calls
+# Most recent DTMF tones kept per call
+_MAX_DTMF_TONES = 256
+
+
+class CallOperationsMixin:
+  """
+  Call control operations shared by CallOperationsManager and CallSupervisor.
+
+  Hosts provide `active_calls` and `status_counts`.
+  """
+
+  __slots__ = ()
 
+  active_calls: Dict[str, CallContext]
+  status_counts: CallStatusCounter
+
+  @safe_bool
   async def transfer_call(self, call_id: str, target_number: str) -> bool:
     """
     Transfer a call to another number.
@@ -28,28 +48,22 @@ class CallOperationsManager:
     Returns:
         True if transfer was initiated successfully
     """
-    try:
-      call_context = self.active_calls.get(call_id)
-      if not call_context:
-        logger.warning(f"No active call found for transfer: {call_id}")
-        return False
-
-      # TODO: Implement actual transfer logic with Ringover API
-      # For now, just log and return success
-      logger.info(
-          f"Transfer initiated for call {call_id} to {target_number}")
-
-      # Update call context
-      call_context.metadata["transfer_target"] = target_number
-      call_context.metadata["transfer_initiated_at"] = datetime.now(
-          timezone.utc).isoformat()
-
-      return True
-
-    except Exception as e:
-      logger.error(f"Failed to transfer call {call_id}: {e}")
+    call_context = self.active_calls.get(call_id)
+    if not call_context:
+      _log_warning("No active call found for transfer: %s", call_id)
       return False
 
+    # TODO: Implement actual transfer logic with Ringover API
+    # For now, just log and return success
+    _log_info("Transfer initiated for call %s to %s", call_id, target_number)
+
+    # Update call context
+    call_context.metadata["transfer_target"] = target_number
+    call_context.metadata["transfer_initiated_at"] = datetime.now(_UTC).isoformat()
+
+    return True
+
+  @safe_bool
   async def send_dtmf(self, call_id: str, tone: str) -> bool:
     """
     Send DTMF tone to a call.
@@ -61,30 +75,26 @@ class CallOperationsManager:
     Returns:
         True if DTMF was sent successfully
     """
-    try:
-      call_context = self.active_calls.get(call_id)
-      if not call_context:
-        logger.warning(f"No active call found for DTMF: {call_id}")
-        return False
-
-      # TODO: Implement actual DTMF sending with Ringover API
-      # For now, just log and return success
-      logger.info(f"DTMF tone '{tone}' sent to call {call_id}")
-
-      # Track DTMF in metadata
-      if "dtmf_tones" not in call_context.metadata:
-        call_context.metadata["dtmf_tones"] = []
-      call_context.metadata["dtmf_tones"].append({
-          "tone": tone,
-          "timestamp": datetime.now(timezone.utc).isoformat()
-      })
-
-      return True
-
-    except Exception as e:
-      logger.error(f"Failed to send DTMF to call {call_id}: {e}")
+    call_context = self.active_calls.get(call_id)
+    if not call_context:
+      _log_warning("No active call found for DTMF: %s", call_id)
       return False
 
+    # TODO: Implement actual DTMF sending with Ringover API
+    # For now, just log and return success
+    _log_info("DTMF tone '%s' sent to call %s", tone, call_id)
+
+    # Track recent DTMF in metadata as parallel tone / epoch-seconds columns
+    metadata = call_context.metadata
+    if "dtmf_tones_chars" not in metadata:
+      metadata["dtmf_tones_chars"] = deque(maxlen=_MAX_DTMF_TONES)
+      metadata["dtmf_tones_ts"] = deque(maxlen=_MAX_DTMF_TONES)
+    metadata["dtmf_tones_chars"].append(tone)
+    metadata["dtmf_tones_ts"].append(time.time())
+
+    return True
+
+  @log_and_swallow(default=None)
   async def get_call_status(self, call_id: str) -> Optional[Dict[str, Any]]:
     """
     Get status information for a specific call.
@@ -95,26 +105,25 @@ class CallOperationsManager:
     Returns:
         Dictionary with call status information
     """
-    try:
-      call_context = self.active_calls.get(call_id)
-      if not call_context:
-        return None
-
-      return {
-          "call_id": call_context.call_id,
-          "status": call_context.status.value,
-          "phone_number": call_context.phone_number,
-          "agent_id": call_context.agent_id,
-          "direction": call_context.direction.value,
-          "start_time": call_context.start_time.isoformat() if call_context.start_time else None,
-          "duration": call_context.duration,
-          "metadata": call_context.metadata
-      }
-
-    except Exception as e:
-      logger.error(f"Failed to get call status for {call_id}: {e}")
+    call_context = self.active_calls.get(call_id)
+    if not call_context:
       return None
 
+    return {
+        "call_id": call_context.call_id,
+        "status": call_context.status.value,
+        "phone_number": call_context.phone_number,
+        "agent_id": call_context.agent_id,
+        "direction": call_context.direction.value,
+        "start_time": call_context.start_time,
+        "duration": call_context.duration,
+        "metadata": {
+            key: list(value) if isinstance(value, deque) else value
+            for key, value in call_context.metadata.items()
+        }
+    }
+
+  @log_and_swallow(default_factory=dict)
   async def get_call_metrics(self) -> Dict[str, Any]:
     """
     Get overall call metrics.
@@ -122,22 +131,17 @@ class CallOperationsManager:
     Returns:
         Dictionary with call metrics
     """
-    try:
-      total_calls = len(self.active_calls)
-      answered_calls = sum(1 for call in self.active_calls.values()
-                           if call.status.value == "answered")
-
-      return {
-          "total_active_calls": total_calls,
-          "answered_calls": answered_calls,
-          "pending_calls": total_calls - answered_calls,
-          "timestamp": datetime.now(timezone.utc).isoformat()
-      }
-
-    except Exception as e:
-      logger.error(f"Failed to get call metrics: {e}")
-      return {}
+    total_calls = len(self.active_calls)
+    answered_calls = self.status_counts.count(CallStatus.ANSWERED)
 
+    return {
+        "total_active_calls": total_calls,
+        "answered_calls": answered_calls,
+        "pending_calls": total_calls - answered_calls,
+        "timestamp": datetime.now(_UTC)
+    }
+
+  @safe_bool
   async def update_call_context(self, call_id: str, context_updates: Dict[str, Any]) -> bool:
     """
     Update call context with new information.
@@ -149,28 +153,26 @@ class CallOperationsManager:
     Returns:
         True if update was successful
     """
-    try:
-      call_context = self.active_calls.get(call_id)
-      if not call_context:
-        logger.warning(f"No active call found for update: {call_id}")
-        return False
-
-      # Update metadata
-      if "metadata" in context_updates:
-        call_context.metadata.update(context_updates["metadata"])
-
-      # Update other fields if provided
-      for field, value in context_updates.items():
-        if field != "metadata" and hasattr(call_context, field):
-          setattr(call_context, field, value)
-
-      logger.info(f"Updated call context for {call_id}")
-      return True
-
-    except Exception as e:
-      logger.error(f"Failed to update call context for {call_id}: {e}")
+    call_context = self.active_calls.get(call_id)
+    if not call_context:
+      _log_warning("No active call found for update: %s", call_id)
       return False
 
+    # Update metadata
+    if "metadata" in context_updates:
+      call_context.metadata.update(context_updates["metadata"])
+
+    # Update other fields if provided
+    for field, value in context_updates.items():
+      if field != "metadata" and hasattr(call_context, field):
+        setattr(call_context, field, value)
+    if "status" in context_updates:
+      self.status_counts.set(call_id, call_context.status)
+
+    _log_info("Updated call context for %s", call_id)
+    return True
+
+  @safe_bool
   async def pause_call(self, call_id: str) -> bool:
     """
     Pause a call (put on hold).
@@ -181,24 +183,19 @@ class CallOperationsManager:
     Returns:
         True if call was paused successfully
     """
-    try:
-      call_context = self.active_calls.get(call_id)
-      if not call_context:
-        logger.warning(f"No active call found to pause: {call_id}")
-        return False
-
-      # TODO: Implement actual pause logic with Ringover API
-      call_context.metadata["paused"] = True
-      call_context.metadata["paused_at"] = datetime.now(
-          timezone.utc).isoformat()
-
-      logger.info(f"Call {call_id} paused")
-      return True
-
-    except Exception as e:
-      logger.error(f"Failed to pause call {call_id}: {e}")
+    call_context = self.active_calls.get(call_id)
+    if not call_context:
+      _log_warning("No active call found to pause: %s", call_id)
       return False
 
+    # TODO: Implement actual pause logic with Ringover API
+    call_context.metadata["paused"] = True
+    call_context.metadata["paused_at"] = datetime.now(_UTC).isoformat()
+
+    _log_info("Call %s paused", call_id)
+    return True
+
+  @safe_bool
   async def resume_call(self, call_id: str) -> bool:
     """
     Resume a paused call.
@@ -209,20 +206,29 @@ class CallOperationsManager:
     Returns:
         True if call was resumed successfully
     """
-    try:
-      call_context = self.active_calls.get(call_id)
-      if not call_context:
-        logger.warning(f"No active call found to resume: {call_id}")
-        return False
-
-      # TODO: Implement actual resume logic with Ringover API
-      call_context.metadata["paused"] = False
-      call_context.metadata["resumed_at"] = datetime.now(
-          timezone.utc).isoformat()
-
-      logger.info(f"Call {call_id} resumed")
-      return True
-
-    except Exception as e:
-      logger.error(f"Failed to resume call {call_id}: {e}")
+    call_context = self.active_calls.get(call_id)
+    if not call_context:
+      _log_warning("No active call found to resume: %s", call_id)
       return False
+
+    # TODO: Implement actual resume logic with Ringover API
+    call_context.metadata["paused"] = False
+    call_context.metadata["resumed_at"] = datetime.now(_UTC).isoformat()
+
+    _log_info("Call %s resumed", call_id)
+    return True
+
+
+class CallOperationsManager(CallOperationsMixin):
+  """Manages call operations like transfer and DTMF."""
+
+  __slots__ = ("active_calls", "status_counts")
+
+  def __init__(
+      self,
+      active_calls: Dict[str, CallContext],
+      status_counts: Optional[CallStatusCounter] = None
+  ):
+    """Initialize with references to active calls and their status counts."""
+    self.active_calls = active_calls
+    self.status_counts = status_counts or CallStatusCounter()
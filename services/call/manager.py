@@ -15,6 +15,8 @@ logger = get_logger(__name__)
 class CallManager:
   """High-level service for managing calls."""
 
+  __slots__ = ("supervisor", "outbound_service", "state_manager", "logger")
+
   def __init__(self):
     """Initialize call manager."""
     self.supervisor = CallSupervisor()
@@ -90,7 +92,7 @@ class CallManager:
           "call_id": state.call_id,
           "state": state.state.value,
           "previous_state": state.previous_state.value if state.previous_state else None,
-          "timestamp": state.timestamp.isoformat(),
+          "timestamp": state.occurred_at,
           "agent_id": state.agent_id,
           "user_id": state.user_id,
           "metadata": state.metadata
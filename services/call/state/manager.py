@@ -1,11 +1,11 @@
 """Call state manager for tracking and managing call states."""
 
 import asyncio
+import time
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, Optional, Set, Callable, Awaitable, Union
-
-from pydantic import BaseModel
+from typing import Dict, FrozenSet, Optional, Tuple, Callable, Awaitable, Union
 
 from core.logging.setup import get_logger
 
@@ -25,26 +25,104 @@ class CallState(str, Enum):
   FAILED = "failed"
 
 
-class CallStateInfo(BaseModel):
-  """Call state information model."""
+# Valid transitions from each state
+_VALID_TRANSITIONS: Dict[CallState, FrozenSet[CallState]] = {
+    CallState.INITIALIZING: frozenset({
+        CallState.RINGING,
+        CallState.CONNECTED,
+        CallState.FAILED,
+        CallState.ENDED
+    }),
+    CallState.RINGING: frozenset({
+        CallState.CONNECTED,
+        CallState.ENDED,
+        CallState.FAILED
+    }),
+    CallState.CONNECTED: frozenset({
+        CallState.ON_HOLD,
+        CallState.MUTED,
+        CallState.TRANSFERRING,
+        CallState.RECORDING,
+        CallState.ENDING,
+        CallState.ENDED
+    }),
+    CallState.ON_HOLD: frozenset({
+        CallState.CONNECTED,
+        CallState.ENDING,
+        CallState.ENDED
+    }),
+    CallState.MUTED: frozenset({
+        CallState.CONNECTED,
+        CallState.ON_HOLD,
+        CallState.ENDING,
+        CallState.ENDED
+    }),
+    CallState.TRANSFERRING: frozenset({
+        CallState.CONNECTED,
+        CallState.ENDED,
+        CallState.FAILED
+    }),
+    CallState.RECORDING: frozenset({
+        CallState.CONNECTED,
+        CallState.ON_HOLD,
+        CallState.MUTED,
+        CallState.ENDING,
+        CallState.ENDED
+    }),
+    CallState.ENDING: frozenset({
+        CallState.ENDED
+    }),
+    CallState.ENDED: frozenset(),  # Terminal state
+    CallState.FAILED: frozenset()  # Terminal state
+}
+_NO_TRANSITIONS: FrozenSet[CallState] = frozenset()
+
+# States in which a call is still considered active
+_ACTIVE_STATES = frozenset({
+    CallState.INITIALIZING,
+    CallState.RINGING,
+    CallState.CONNECTED,
+    CallState.ON_HOLD,
+    CallState.MUTED,
+    CallState.TRANSFERRING,
+    CallState.RECORDING
+})
+
+
+@dataclass(slots=True)
+class CallStateInfo:
+  """Call state information record."""
 
   call_id: str
   state: CallState
+  timestamp: int  # Epoch nanoseconds, see occurred_at
   previous_state: Optional[CallState] = None
-  timestamp: datetime
   agent_id: Optional[str] = None
   user_id: Optional[str] = None
-  metadata: Dict = {}
+  metadata: Dict = field(default_factory=dict)
+
+  @property
+  def occurred_at(self) -> datetime:
+    """Timestamp as a timezone-aware UTC datetime."""
+    return datetime.fromtimestamp(self.timestamp / 1e9, tz=timezone.utc)
 
 
 class CallStateManager:
   """Manages call states across the system."""
 
-  def __init__(self):
+  def __init__(self, lock_shards: int = 64):
     self.logger = get_logger(__name__)
     self._call_states: Dict[str, CallStateInfo] = {}
-    self._state_locks: Dict[str, asyncio.Lock] = {}
-    self._state_change_callbacks: Dict[str, Set[Callable]] = {}
+    # Fixed pool of locks shared by calls hashing to the same shard
+    self._lock_shards = tuple(asyncio.Lock() for _ in range(lock_shards))
+    # Callbacks partitioned by kind at registration time. Tuples are
+    # replaced, never mutated, so notifiers iterate a stable snapshot
+    self._async_cbs: Dict[str, Tuple[Callable, ...]] = {}
+    self._sync_cbs: Dict[str, Tuple[Callable, ...]] = {}
+
+  def _lock_for(self, call_id: str) -> asyncio.Lock:
+    """Get the shard lock guarding a call's state."""
+    return self._lock_shards[hash(call_id) % len(self._lock_shards)]
 
   async def initialize_call(
       self,
@@ -60,14 +138,13 @@ class CallStateManager:
     call_state = CallStateInfo(
         call_id=call_id,
         state=CallState.INITIALIZING,
-        timestamp=datetime.now(timezone.utc),
+        timestamp=time.time_ns(),
         agent_id=agent_id,
         user_id=user_id,
-        metadata=metadata or {}
+        metadata=dict(metadata or {})
     )
 
     self._call_states[call_id] = call_state
-    self._state_locks[call_id] = asyncio.Lock()
 
     await self._notify_state_change(call_state)
 
@@ -84,7 +161,7 @@ class CallStateManager:
     if call_id not in self._call_states:
       raise ValueError(f"Call {call_id} not found")
 
-    async with self._state_locks[call_id]:
+    async with self._lock_for(call_id):
       current_state = self._call_states[call_id]
 
       # Validate state transition
@@ -93,26 +170,26 @@ class CallStateManager:
             f"Invalid state transition from {current_state.state} to {new_state}"
         )
 
-      # Update state
-      updated_state = CallStateInfo(
-          call_id=call_id,
-          state=new_state,
-          previous_state=current_state.state,
-          timestamp=datetime.now(timezone.utc),
-          agent_id=current_state.agent_id,
-          user_id=current_state.user_id,
-          metadata={**current_state.metadata, **(metadata or {})}
-      )
-
-      self._call_states[call_id] = updated_state
+      # Update state in place
+      previous_state = current_state.state
+      current_state.previous_state = previous_state
+      current_state.state = new_state
+      current_state.timestamp = time.time_ns()
+      if metadata:
+        current_state.metadata.update(metadata)
 
       self.logger.info(
-          f"State updated for call {call_id}: {current_state.state} -> {new_state}"
+          f"State updated for call {call_id}: {previous_state} -> {new_state}"
       )
 
-      await self._notify_state_change(updated_state)
+      # Callbacks run outside the shard lock, so one that updates another
+      # call on the same shard cannot deadlock; they see this transition
+      # even if a later update lands first
+      snapshot = replace(current_state, metadata=dict(current_state.metadata))
+
+    await self._notify_state_change(snapshot)
 
-      return updated_state
+    return current_state
 
   async def get_state(self, call_id: str) -> Optional[CallStateInfo]:
     """Get current call state."""
@@ -128,108 +205,60 @@ class CallStateManager:
 
       # Clean up
       del self._call_states[call_id]
-      if call_id in self._state_locks:
-        del self._state_locks[call_id]
-      if call_id in self._state_change_callbacks:
-        del self._state_change_callbacks[call_id]
+      self._async_cbs.pop(call_id, None)
+      self._sync_cbs.pop(call_id, None)
 
       self.logger.info(f"Removed call {call_id} from state tracking")
 
   async def get_active_calls(self) -> Dict[str, CallStateInfo]:
     """Get all active calls."""
-    active_states = {
-        CallState.INITIALIZING,
-        CallState.RINGING,
-        CallState.CONNECTED,
-        CallState.ON_HOLD,
-        CallState.MUTED,
-        CallState.TRANSFERRING,
-        CallState.RECORDING
-    }
-
     return {
         call_id: state
         for call_id, state in self._call_states.items()
-        if state.state in active_states
+        if state.state in _ACTIVE_STATES
     }
 
   def register_state_callback(self, call_id: str, callback: Callable) -> None:
     """Register callback for state changes."""
-    if call_id not in self._state_change_callbacks:
-      self._state_change_callbacks[call_id] = set()
-    self._state_change_callbacks[call_id].add(callback)
+    registry = (
+        self._async_cbs if asyncio.iscoroutinefunction(callback)
+        else self._sync_cbs
+    )
+    callbacks = registry.get(call_id, ())
+    if callback not in callbacks:
+      registry[call_id] = callbacks + (callback,)
 
   def unregister_state_callback(self, call_id: str, callback: Callable) -> None:
     """Unregister callback for state changes."""
-    if call_id in self._state_change_callbacks:
-      self._state_change_callbacks[call_id].discard(callback)
+    for registry in (self._async_cbs, self._sync_cbs):
+      if call_id in registry:
+        registry[call_id] = tuple(
+            cb for cb in registry[call_id] if cb != callback)
 
   async def _notify_state_change(self, state_info: CallStateInfo) -> None:
     """Notify registered callbacks of state changes."""
 
-    callbacks = self._state_change_callbacks.get(state_info.call_id, set())
+    call_id = state_info.call_id
 
-    for callback in callbacks:
+    for callback in self._sync_cbs.get(call_id, ()):
       try:
-        if asyncio.iscoroutinefunction(callback):
-          await callback(state_info)
-        else:
-          callback(state_info)
+        callback(state_info)
       except Exception as e:
         self.logger.error(f"Error in state change callback: {e}")
 
-  def _is_valid_transition(self, current: CallState, new: CallState) -> bool:
-    """Validate state transitions."""
+    async_callbacks = self._async_cbs.get(call_id)
+    if not async_callbacks:
+      return
 
-    # Define valid transitions
-    valid_transitions = {
-        CallState.INITIALIZING: {
-            CallState.RINGING,
-            CallState.CONNECTED,
-            CallState.FAILED,
-            CallState.ENDED
-        },
-        CallState.RINGING: {
-            CallState.CONNECTED,
-            CallState.ENDED,
-            CallState.FAILED
-        },
-        CallState.CONNECTED: {
-            CallState.ON_HOLD,
-            CallState.MUTED,
-            CallState.TRANSFERRING,
-            CallState.RECORDING,
-            CallState.ENDING,
-            CallState.ENDED
-        },
-        CallState.ON_HOLD: {
-            CallState.CONNECTED,
-            CallState.ENDING,
-            CallState.ENDED
-        },
-        CallState.MUTED: {
-            CallState.CONNECTED,
-            CallState.ON_HOLD,
-            CallState.ENDING,
-            CallState.ENDED
-        },
-        CallState.TRANSFERRING: {
-            CallState.CONNECTED,
-            CallState.ENDED,
-            CallState.FAILED
-        },
-        CallState.RECORDING: {
-            CallState.CONNECTED,
-            CallState.ON_HOLD,
-            CallState.MUTED,
-            CallState.ENDING,
-            CallState.ENDED
-        },
-        CallState.ENDING: {
-            CallState.ENDED
-        },
-        CallState.ENDED: set(),  # Terminal state
-        CallState.FAILED: set()  # Terminal state
-    }
+    # Run async callbacks concurrently so latency is the slowest, not the sum
+    results = await asyncio.gather(
+        *(callback(state_info) for callback in async_callbacks),
+        return_exceptions=True
+    )
+    for result in results:
+      if isinstance(result, Exception):
+        self.logger.error(f"Error in state change callback: {result}")
 
-    return new in valid_transitions.get(current, set())
+  def _is_valid_transition(self, current: CallState, new: CallState) -> bool:
+    """Validate state transitions."""
+    return new in _VALID_TRANSITIONS.get(current, _NO_TRANSITIONS)
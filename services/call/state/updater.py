@@ -1,17 +1,59 @@
 """
 Call state update service
 """
-from typing import Dict, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 from datetime import datetime, timezone
+import asyncio
+import time
+
+from pydantic_core import to_json
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from models.internal.callcontext import CallContext, CallStatus
-from data.redis.ops.session.store import store_call_session
-from data.redis.ops.session.retrieve import get_call_session
-from data.redis.ops.session.delete import delete_call_session
+from data.redis.ops.session.store import store_call_session_raw
+from data.redis.ops.session.update import update_call_session_atomic
+from data.redis.ops.session.delete import finish_call_session
 from core.logging.setup import get_logger
 
 logger = get_logger(__name__)
 
+# (monotonic time, ISO timestamp) reused for updates within the same 1ms
+_cached_now_iso: Tuple[float, str] = (float("-inf"), "")
+
+
+def _now_iso() -> str:
+  """Current UTC time in ISO format, at most 1ms stale."""
+  global _cached_now_iso
+
+  now = time.monotonic()
+  cached_at, iso = _cached_now_iso
+  if now - cached_at < 0.001:
+    return iso
+
+  iso = datetime.now(timezone.utc).isoformat()
+  _cached_now_iso = (now, iso)
+  return iso
+
+
+async def _retry_on_disconnect(
+    op: Callable[..., Awaitable[bool]],
+    *args: Any,
+    **kwargs: Any
+) -> bool:
+  """Run a session op, retrying once if Redis dropped or could not connect."""
+  try:
+    return await op(*args, **kwargs)
+  except RedisConnectionError as e:
+    logger.warning("Redis connection lost in %s, retrying: %s", op.__name__, e)
+
+  # Let the client reconnect before the single retry
+  await asyncio.sleep(0)
+  try:
+    return await op(*args, **kwargs)
+  except RedisConnectionError as e:
+    logger.error("Redis unavailable for %s: %s", op.__name__, e)
+    return False
+
 
 class CallStateUpdater:
   """Service for updating call states"""
@@ -29,28 +71,16 @@ class CallStateUpdater:
     Returns:
         True if update successful, False otherwise
     """
-    try:
-      # Get existing call session
-      call_data = await get_call_session(call_id)
-
-      if call_data:
-        # Update the status in the data
-        call_data["status"] = status.value
-        call_data["last_updated"] = datetime.now(timezone.utc).isoformat()
-
-        # Add any additional data
-        if additional_data:
-          call_data.get("context_data", {}).update(additional_data)
-
-        # Store updated session
-        return await store_call_session(call_id, call_data)
-      else:
-        logger.warning(f"Call session not found for {call_id}")
-        return False
-
-    except Exception as e:
-      logger.error(f"Error updating call status for {call_id}: {e}")
-      return False
+    # Patch the existing session server-side in a single round trip
+    return await _retry_on_disconnect(
+        update_call_session_atomic,
+        call_id,
+        {
+            "status": status.value,
+            "last_updated": _now_iso()
+        },
+        merge={"context_data": additional_data} if additional_data else None
+    )
 
   async def create_call_session(self, call_context: CallContext) -> bool:
     """
@@ -62,14 +92,15 @@ class CallStateUpdater:
     Returns:
         True if creation successful, False otherwise
     """
-    try:
-      # Convert CallContext to dict for storage
-      session_data = call_context.dict()
-      return await store_call_session(call_context.call_id, session_data)
-    except Exception as e:
-      logger.error(
-          f"Error creating call session for {call_context.call_id}: {e}")
-      return False
+    # Encode each field straight to JSON bytes in pydantic's serializer,
+    # skipping the intermediate JSON-mode dict and a json.dumps pass
+    encoded_fields = {
+        field: to_json(value)
+        for field, value in call_context.model_dump(
+            by_alias=True, exclude_none=True).items()
+    }
+    return await _retry_on_disconnect(
+        store_call_session_raw, call_context.call_id, encoded_fields)
 
   async def end_call_session(self, call_id: str) -> bool:
     """
@@ -81,15 +112,12 @@ class CallStateUpdater:
     Returns:
         True if cleanup successful, False otherwise
     """
-    try:
-      # Update status to ended first
-      await self.update_call_status(call_id, CallStatus.ENDED)
-
-      # Delete from active sessions after a delay (for cleanup)
-      # Note: In production, you might want to keep this for a short period
-      # for debugging or move to a different storage
-      return await delete_call_session(call_id)
-
-    except Exception as e:
-      logger.error(f"Error ending call session for {call_id}: {e}")
-      return False
+    # Mark as ended and delete in one pipelined round trip
+    # Note: In production, you might want to keep this for a short period
+    # for debugging or move to a different storage
+    return await _retry_on_disconnect(
+        finish_call_session,
+        call_id,
+        status=CallStatus.ENDED.value,
+        last_updated=_now_iso()
+    )
@@ -1,28 +1,47 @@
-"""LLM service package."""
-
-from services.llm.orchestrator import LLMOrchestrator
-from services.llm.providers import base, openai, gemini, anthropic
-from services.llm.factory import create_prompt_manager, create_integrated_voice_agent
-from services.llm.integration import VoiceAgentLLMIntegration
-from services.llm.script import (
-    ScriptSchema,
-    ScriptManager,
-    ScriptLoader,
-    ScriptConverter,
-    ScriptAPI,
-    VoiceAgentScriptManager,
-    create_basic_script,
-    create_customer_service_script,
-    create_sales_script
-)
+"""LLM service package.
+
+Exports are resolved lazily on first access, so importing a submodule such as
+``services.llm.prompt`` does not load every provider SDK.
+"""
+import importlib
+from typing import Any, Dict
+
+# Exported name -> module providing it
+_LAZY_ATTRS: Dict[str, str] = {
+    "LLMOrchestrator": "services.llm.orchestrator",
+    "get_orchestrator": "services.llm.orchestrator",
+    "create_prompt_manager": "services.llm.factory",
+    "get_prompt_manager": "services.llm.factory",
+    "create_integrated_voice_agent": "services.llm.factory",
+    "VoiceAgentLLMIntegration": "services.llm.integration",
+    "ScriptSchema": "services.llm.script",
+    "ScriptManager": "services.llm.script",
+    "ScriptLoader": "services.llm.script",
+    "ScriptConverter": "services.llm.script",
+    "ScriptAPI": "services.llm.script",
+    "VoiceAgentScriptManager": "services.llm.script",
+    "create_basic_script": "services.llm.script",
+    "create_customer_service_script": "services.llm.script",
+    "create_sales_script": "services.llm.script"
+}
+
+# Exported provider submodules
+_LAZY_MODULES: Dict[str, str] = {
+    "base": "services.llm.providers.base",
+    "openai": "services.llm.providers.openai",
+    "gemini": "services.llm.providers.gemini",
+    "anthropic": "services.llm.providers.anthropic"
+}
 
 __all__ = [
     "LLMOrchestrator",
+    "get_orchestrator",
     "base",
     "openai",
     "gemini",
     "anthropic",
     "create_prompt_manager",
+    "get_prompt_manager",
     "create_integrated_voice_agent",
     "VoiceAgentLLMIntegration",
     "ScriptSchema",
@@ -35,3 +54,20 @@ __all__ = [
     "create_customer_service_script",
     "create_sales_script"
 ]
+
+
+def __getattr__(name: str) -> Any:
+  """Import an exported name on first access and cache it on the package."""
+  if name in _LAZY_MODULES:
+    value = importlib.import_module(_LAZY_MODULES[name])
+  elif name in _LAZY_ATTRS:
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+  else:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+  globals()[name] = value
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(__all__))
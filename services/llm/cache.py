@@ -0,0 +1,98 @@
+"""
+Exact-match cache for deterministic LLM responses.
+"""
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.external.llm.response import LLMResponse
+from core.logging.setup import get_logger
+
+logger = get_logger(__name__)
+
+# Above this temperature responses are sampled, so repeats are not reused
+DETERMINISTIC_TEMPERATURE = 0.05
+
+
+class LLMResponseCache:
+  """
+  In-memory LRU cache of LLM responses with a time-to-live.
+
+  Only requests at or below DETERMINISTIC_TEMPERATURE are cached, where an
+  identical request is expected to produce the same answer, e.g. repeated
+  greetings and IVR prompts.
+  """
+
+  def __init__(self, max_entries: int = 1024, ttl: float = 3600):
+    """
+    Initialize cache limits.
+
+    Args:
+        max_entries: Maximum number of cached responses
+        ttl: Seconds a cached response stays valid
+    """
+    self.max_entries = max_entries
+    self.ttl = ttl
+    self._entries: "OrderedDict[str, Tuple[float, LLMResponse]]" = OrderedDict()
+
+  def make_key(
+      self,
+      provider: str,
+      model: str,
+      messages: List[Dict[str, str]],
+      temperature: float,
+      max_tokens: int,
+      extra_params: Dict[str, Any]
+  ) -> Optional[str]:
+    """
+    Build the cache key for a request.
+
+    Returns:
+        Hex digest of the request, or None if it should not be cached
+    """
+    if temperature > DETERMINISTIC_TEMPERATURE:
+      return None
+
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "extra_params": extra_params
+        },
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+  def get(self, key: str) -> Optional[LLMResponse]:
+    """Get a cached response if present and not expired."""
+    entry = self._entries.get(key)
+    if entry is None:
+      return None
+
+    expires_at, response = entry
+    if expires_at <= time.monotonic():
+      del self._entries[key]
+      return None
+
+    self._entries.move_to_end(key)
+    return response
+
+  def set(self, key: str, response: LLMResponse) -> None:
+    """Cache a response, evicting the least recently used over the limit."""
+    self._entries[key] = (time.monotonic() + self.ttl, response)
+    self._entries.move_to_end(key)
+    if len(self._entries) > self.max_entries:
+      self._entries.popitem(last=False)
+
+  def clear(self) -> None:
+    """Drop all cached responses."""
+    self._entries.clear()
+
+  def __len__(self) -> int:
+    return len(self._entries)
@@ -9,20 +9,15 @@ from services.llm.prompt.templates import (
     create_call_center_agent_template,
     create_sales_agent_template
 )
-from services.llm.orchestrator import LLMOrchestrator
-from services.tts.elevenlabs import ElevenLabsService
-from services.stt.whisper import WhisperService
-from services.llm.prompt.builder import PromptBuilder
-from services.llm.integration import VoiceAgentLLMIntegration
-from data.db.models.agentconfig import AgentConfig
-from core.config.services.tts.elevenlabs import ElevenLabsConfig
 
+# Heavy service modules are imported where they are used; these are for
+# annotations only
 if TYPE_CHECKING:
-  from services.agent.core import AgentCore
-
-if TYPE_CHECKING:
-  from services.ringover.streaming import RingoverStreamHandler
-from core.config.services.stt.whisper import WhisperConfig
+  from services.llm.integration import VoiceAgentLLMIntegration
+  from services.llm.orchestrator import LLMOrchestrator
+  from data.db.models.agentconfig import AgentConfig
+  from core.config.services.tts.elevenlabs import ElevenLabsConfig
+  from core.config.services.stt.whisper import WhisperConfig
 
 
 def create_prompt_manager() -> PromptManager:
@@ -48,13 +43,32 @@ def create_prompt_manager() -> PromptManager:
   return manager
 
 
+# Global prompt manager instance
+_prompt_manager: Optional[PromptManager] = None
+
+
+def get_prompt_manager() -> PromptManager:
+  """
+  Get the shared prompt manager, building it on first use.
+
+  Returns:
+      PromptManager instance with the built-in templates registered
+  """
+  global _prompt_manager
+
+  if _prompt_manager is None:
+    _prompt_manager = create_prompt_manager()
+
+  return _prompt_manager
+
+
 def create_integrated_voice_agent(
-    agent_config: AgentConfig,
-    llm_orchestrator: LLMOrchestrator,
-    tts_config: Optional[ElevenLabsConfig] = None,
-    stt_config: Optional[WhisperConfig] = None,
+    agent_config: "AgentConfig",
+    llm_orchestrator: "LLMOrchestrator",
+    tts_config: Optional["ElevenLabsConfig"] = None,
+    stt_config: Optional["WhisperConfig"] = None,
     enable_streaming: bool = False
-) -> VoiceAgentLLMIntegration:
+) -> "VoiceAgentLLMIntegration":
   """
   Create an integrated voice agent system.
 
@@ -72,23 +86,29 @@ def create_integrated_voice_agent(
   from services.agent.core import AgentCore
   agent_core = AgentCore(agent_config, llm_orchestrator)
 
-  # Create the prompt manager
-  prompt_manager = create_prompt_manager()
+  # Reuse the shared prompt manager; its templates are the same for every agent
+  prompt_manager = get_prompt_manager()
 
   # Create TTS service
-  tts_service = ElevenLabsService(tts_config) if tts_config else None
+  tts_service = None
+  if tts_config:
+    from services.tts.elevenlabs import ElevenLabsService
+    tts_service = ElevenLabsService(tts_config)
 
   # Create streaming components if enabled
   stream_handler = None
   if enable_streaming and stt_config:
-    # Import locally to avoid circular dependency
+    # Import locally to avoid circular dependency and load cost when unused
     from services.ringover.streaming import RingoverStreamHandler
+    from services.stt.whisper import WhisperService
+    from services.llm.prompt.builder import PromptBuilder
 
     stt_service = WhisperService(stt_config)
     prompt_builder = PromptBuilder(prompt_manager)
     stream_handler = RingoverStreamHandler(stt_service, prompt_builder)
 
   # Create the integrated system
+  from services.llm.integration import VoiceAgentLLMIntegration
   integration = VoiceAgentLLMIntegration(
       agent_core=agent_core,
       llm_orchestrator=llm_orchestrator,
@@ -9,12 +9,12 @@ from core.logging.setup import get_logger
 if TYPE_CHECKING:
   from services.agent.core import AgentCore, AgentResponse
   from services.ringover.streaming import RingoverStreamHandler
+  from services.tts.elevenlabs import ElevenLabsService
 
 from services.llm.prompt import (
-    PromptManager, PromptBuilder, ConversationContext, PromptLLMAdapter
+    PromptManager, ConversationContext, PromptLLMAdapter
 )
 from services.llm.orchestrator import LLMOrchestrator
-from services.tts.elevenlabs import ElevenLabsService
 from models.internal.callcontext import CallContext
 
 logger = get_logger(__name__)
@@ -33,7 +33,7 @@ class VoiceAgentLLMIntegration:
       agent_core: "AgentCore",
       llm_orchestrator: LLMOrchestrator,
       prompt_manager: PromptManager,
-      tts_service: Optional[ElevenLabsService] = None,
+      tts_service: Optional["ElevenLabsService"] = None,
       stream_handler: Optional["RingoverStreamHandler"] = None
   ):
     """
@@ -124,7 +124,8 @@ class VoiceAgentLLMIntegration:
     llm_response = await self.llm_adapter.generate_response_with_prompt(
         context=self.current_context,
         template_name=metadata.get("template") if metadata else None,
-        provider=metadata.get("provider", "openai") if metadata else "openai"
+        provider=metadata.get("provider", "openai") if metadata else "openai",
+        user_input=user_input
     )
 
     if not llm_response:
@@ -136,6 +137,16 @@ class VoiceAgentLLMIntegration:
     # Extract the response text
     response_text = llm_response.response.get_content()
 
+    # Start speech synthesis now so it overlaps the context update
+    tts_task = None
+    if self.tts_service:
+      tts_task = asyncio.create_task(self.tts_service.synthesize_speech(
+          response_text,
+          voice_id=metadata.get("voice_id") if metadata else None
+      ))
+      # Yield once so the request is sent before the synchronous update runs
+      await asyncio.sleep(0)
+
     # Update the conversation context
     self.current_context = self.llm_adapter.update_conversation_context(
         self.current_context,
@@ -143,14 +154,11 @@ class VoiceAgentLLMIntegration:
         response_text
     )
 
-    # Generate audio if TTS is available
+    # Collect generated audio if TTS is available
     audio_response = None
-    if self.tts_service:
+    if tts_task:
       try:
-        audio_response = await self.tts_service.synthesize_speech(
-            response_text,
-            voice_id=metadata.get("voice_id") if metadata else None
-        )
+        audio_response = await tts_task
       except Exception as e:
         logger.error(f"Failed to generate speech: {e}")
 
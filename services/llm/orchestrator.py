@@ -1,14 +1,16 @@
 """
 LLM orchestrator for managing multiple providers.
 """
-from typing import Dict, Any, Optional, List, AsyncIterator
+from typing import Dict, Any, Optional, List, AsyncIterator, Callable, NamedTuple
 from enum import Enum
+import asyncio
+import importlib
+from importlib import metadata
 
-from services.llm.providers.base import BaseLLMProvider
-from services.llm.providers.openai import OpenAIProvider
-from services.llm.providers.gemini import GeminiProvider
-from services.llm.providers.anthropic import AnthropicProvider
-from models.external.llm.request import LLMRequest, LLMMessage
+import httpx
+
+from services.llm.cache import LLMResponseCache
+from services.llm.providers.base import BaseLLMProvider, build_request
 from models.external.llm.response import LLMResponse
 from core.config.registry import config_registry
 from core.logging import get_logger
@@ -23,58 +25,151 @@ class LLMProviderType(Enum):
   ANTHROPIC = "anthropic"
 
 
+# Configured provider name -> (provider type, module, class, SDK distribution).
+# Only the module of the configured provider is imported, so unused SDKs are
+# never loaded
+_PROVIDERS = {
+    "openai": (LLMProviderType.OPENAI, "services.llm.providers.openai", "OpenAIProvider", "openai"),
+    "google": (LLMProviderType.GEMINI, "services.llm.providers.gemini", "GeminiProvider", "google-generativeai"),
+    "anthropic": (LLMProviderType.ANTHROPIC, "services.llm.providers.anthropic", "AnthropicProvider", "anthropic")
+}
+
+# SDKs that accept the shared httpx client
+_HTTPX_PROVIDERS = frozenset({LLMProviderType.OPENAI, LLMProviderType.ANTHROPIC})
+
+
+def _sdk_version(distribution: str) -> str:
+  """Get the installed version of a provider SDK without importing it."""
+  try:
+    return metadata.version(distribution)
+  except metadata.PackageNotFoundError:
+    return "unknown version"
+
+
+class _ProviderOps(NamedTuple):
+  """Bound provider methods, resolved once per provider."""
+  generate: Callable
+  stream: Callable
+  validate: Callable
+
+
+# Tokens read ahead of the stream consumer
+_STREAM_BUFFER_SIZE = 16
+
+# Queued after the last token of a provider stream
+_STREAM_END = object()
+
+
+async def _pump_stream(stream: AsyncIterator[str], queue: asyncio.Queue) -> None:
+  """Copy a provider stream into a queue, ending with an error or _STREAM_END."""
+  try:
+    async for token in stream:
+      await queue.put(token)
+  except Exception as e:
+    await queue.put(e)
+    return
+  await queue.put(_STREAM_END)
+
+
 class LLMOrchestrator:
-  """Orchestrates LLM interactions across multiple providers."""
+  """
+  Orchestrates LLM interactions across multiple providers.
+
+  Providers backed by httpx share one pooled client so TLS connections are
+  kept alive across requests; close it with `aclose()` or use the
+  orchestrator as an async context manager.
+  """
 
   def __init__(self):
     self.logger = logger
     self._providers: Dict[str, BaseLLMProvider] = {}
+    # Provider name -> bound methods, so each call is one dict lookup
+    self._dispatch: Dict[str, _ProviderOps] = {}
+    self._cache = LLMResponseCache()
+    # Provider calls in flight, by cache key
+    self._inflight: Dict[str, asyncio.Future] = {}
+    self._http = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=30.0
+    )
+    # Providers that passed validation; failures are retried on next check
+    self._validated: Dict[str, bool] = {}
+    self._warmup_task: Optional[asyncio.Task] = None
     self._initialize_providers()
+    self._schedule_warmup()
 
-  def _initialize_providers(self):
-    """Initialize all available LLM providers."""
-    # Get LLM config from centralized registry
-    llm_config = config_registry.llm
+  async def __aenter__(self) -> "LLMOrchestrator":
+    return self
 
-    # Initialize OpenAI
-    try:
-      if llm_config.provider.value == 'openai':
-        self._providers[LLMProviderType.OPENAI.value] = OpenAIProvider({
-            'api_key': llm_config.api_key,
-            'model': llm_config.model,
-            'base_url': llm_config.base_url,
-            'max_tokens': llm_config.max_tokens,
-            'temperature': llm_config.temperature
-        })
-        self.logger.info("Initialized OpenAI provider")
-    except Exception as e:
-      self.logger.warning(f"Failed to initialize OpenAI provider: {e}")
+  async def __aexit__(self, exc_type, exc, tb) -> None:
+    await self.aclose()
 
-    # Initialize Gemini
-    try:
-      if llm_config.provider.value == 'google':
-        self._providers[LLMProviderType.GEMINI.value] = GeminiProvider({
-            'api_key': llm_config.api_key,
-            'model': llm_config.model,
-            'max_tokens': llm_config.max_tokens,
-            'temperature': llm_config.temperature
-        })
-        self.logger.info("Initialized Gemini provider")
-    except Exception as e:
-      self.logger.warning(f"Failed to initialize Gemini provider: {e}")
+  async def aclose(self) -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    if self._warmup_task is not None and not self._warmup_task.done():
+      self._warmup_task.cancel()
+    await self._http.aclose()
 
-    # Initialize Anthropic
+  def _schedule_warmup(self) -> None:
+    """Start warming up providers in the background if a loop is running."""
     try:
-      if llm_config.provider.value == 'anthropic':
-        self._providers[LLMProviderType.ANTHROPIC.value] = AnthropicProvider({
-            'api_key': llm_config.api_key,
-            'model': llm_config.model,
-            'max_tokens': llm_config.max_tokens,
-            'temperature': llm_config.temperature
-        })
-        self.logger.info("Initialized Anthropic provider")
-    except Exception as e:
-      self.logger.warning(f"Failed to initialize Anthropic provider: {e}")
+      loop = asyncio.get_running_loop()
+    except RuntimeError:
+      # Created outside the event loop; callers can await warmup() later
+      return
+    self._warmup_task = loop.create_task(self.warmup())
+
+  async def warmup(self) -> Dict[str, bool]:
+    """
+    Validate all providers concurrently.
+
+    Validation makes a minimal API call, which also opens pooled connections
+    so the first real request does not pay for DNS and the TLS handshake.
+
+    Returns:
+        Validation result per provider
+    """
+    names = list(self._providers)
+    results = await asyncio.gather(
+        *(self.validate_provider(name) for name in names))
+    return dict(zip(names, results))
+
+  def _initialize_providers(self):
+    """Initialize the configured LLM provider."""
+    # Get LLM config from centralized registry
+    llm_config = config_registry.llm
+
+    entry = _PROVIDERS.get(llm_config.provider.value)
+    if entry is None:
+      self.logger.warning(
+          f"Unsupported LLM provider: {llm_config.provider.value}")
+    else:
+      provider_type, module_name, class_name, sdk_name = entry
+      config = {
+          'api_key': llm_config.api_key,
+          'model': llm_config.model,
+          'max_tokens': llm_config.max_tokens,
+          'temperature': llm_config.temperature
+      }
+      if provider_type == LLMProviderType.OPENAI:
+        config['base_url'] = llm_config.base_url
+      if provider_type in _HTTPX_PROVIDERS:
+        config['http_client'] = self._http
+
+      try:
+        provider_class = getattr(
+            importlib.import_module(module_name), class_name)
+        llm_provider = provider_class(config)
+        self._providers[provider_type.value] = llm_provider
+        self._dispatch[provider_type.value] = _ProviderOps(
+            generate=llm_provider.generate_response_raw,
+            stream=llm_provider.stream_response,
+            validate=llm_provider.validate_config
+        )
+        self.logger.info(
+            f"Initialized {class_name} ({sdk_name} {_sdk_version(sdk_name)})")
+      except Exception as e:
+        self.logger.warning(f"Failed to initialize {class_name}: {e}")
 
     self.logger.info(
         f"Successfully initialized {len(self._providers)} LLM providers")
@@ -102,37 +197,63 @@ class LLMOrchestrator:
     Returns:
         LLM response or None if failed
     """
-    try:
-      if provider not in self._providers:
-        self.logger.error(f"Provider {provider} not available")
-        return None
-
-      # Convert messages to LLMMessage objects
-      llm_messages = [
-          LLMMessage(role=msg["role"], content=msg["content"])
-          for msg in messages
-      ]
-
-      # Create request
-      request = LLMRequest(
-          messages=llm_messages,
-          model=model,
-          temperature=temperature,
-          max_tokens=max_tokens,
-          extra_params=kwargs
-      )
-
-      # Get provider and generate response
-      llm_provider = self._providers[provider]
-      response = await llm_provider.generate_response(request)
-
-      self.logger.debug(f"Generated response using {provider}")
-      return response
+    ops = self._dispatch.get(provider)
+    if ops is None:
+      self.logger.error(f"Provider {provider} not available")
+      return None
 
+    # Deterministic requests repeat often enough to answer from the cache
+    cache_key = self._cache.make_key(
+        provider, model, messages, temperature, max_tokens, kwargs)
+    if cache_key is not None:
+      cached = self._cache.get(cache_key)
+      if cached is not None:
+        self.logger.debug(f"Served cached response for {provider}")
+        return cached
+
+    if cache_key is None:
+      return await self._call_provider(
+          ops.generate, provider, messages, model, temperature, max_tokens,
+          kwargs)
+
+    # Concurrent sessions sending the same deterministic request share one
+    # provider call; shield it so one caller's cancellation spares the rest
+    pending = self._inflight.get(cache_key)
+    if pending is None:
+      pending = asyncio.ensure_future(self._call_provider(
+          ops.generate, provider, messages, model, temperature, max_tokens,
+          kwargs))
+      self._inflight[cache_key] = pending
+      pending.add_done_callback(
+          lambda _: self._inflight.pop(cache_key, None))
+
+    response = await asyncio.shield(pending)
+    if response is not None:
+      self._cache.set(cache_key, response)
+    return response
+
+  async def _call_provider(
+      self,
+      generate: Callable,
+      provider: str,
+      messages: List[Dict[str, str]],
+      model: str,
+      temperature: float,
+      max_tokens: int,
+      extra_params: Dict[str, Any]
+  ) -> Optional[LLMResponse]:
+    """Send a request to a provider, logging and swallowing failures."""
+    # Only the provider call is expected to fail at runtime
+    try:
+      response = await generate(
+          messages, model, temperature, max_tokens, extra_params)
     except Exception as e:
       self.logger.error(f"Failed to generate LLM response: {e}")
       return None
 
+    self.logger.debug(f"Generated response using {provider}")
+    return response
+
   async def stream_response(
       self,
       messages: List[Dict[str, str]],
@@ -155,35 +276,39 @@ class LLMOrchestrator:
 
     Yields:
         Response tokens
+
+    Raises:
+        Exception: Provider errors are logged and re-raised so consumers can
+            tell a failed stream from a complete one
     """
-    try:
-      if provider not in self._providers:
-        self.logger.error(f"Provider {provider} not available")
-        return
-
-      # Convert messages to LLMMessage objects
-      llm_messages = [
-          LLMMessage(role=msg["role"], content=msg["content"])
-          for msg in messages
-      ]
-
-      # Create request
-      request = LLMRequest(
-          messages=llm_messages,
-          model=model,
-          temperature=temperature,
-          max_tokens=max_tokens,
-          stream=True,
-          extra_params=kwargs
-      )
-
-      # Get provider and stream response
-      llm_provider = self._providers[provider]
-      async for token in await llm_provider.stream_response(request):
-        yield token
+    ops = self._dispatch.get(provider)
+    if ops is None:
+      self.logger.error(f"Provider {provider} not available")
+      return
 
+    request = build_request(
+        messages, model, temperature, max_tokens, kwargs, stream=True)
+
+    # Read the provider stream in its own task so the next token is fetched
+    # while the consumer is still handling the previous one
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_STREAM_BUFFER_SIZE)
+    producer = asyncio.create_task(
+        _pump_stream(ops.stream(request), queue))
+
+    try:
+      while True:
+        item = await queue.get()
+        if item is _STREAM_END:
+          break
+        if isinstance(item, Exception):
+          raise item
+        yield item
     except Exception as e:
       self.logger.error(f"Failed to stream LLM response: {e}")
+      raise
+    finally:
+      # Stop reading if the consumer gave up early
+      producer.cancel()
 
   def get_available_providers(self) -> List[str]:
     """Get list of available providers."""
@@ -199,12 +324,47 @@ class LLMOrchestrator:
     Returns:
         True if provider is valid
     """
-    try:
-      if provider not in self._providers:
-        return False
+    if self._validated.get(provider):
+      return True
+
+    ops = self._dispatch.get(provider)
+    if ops is None:
+      return False
 
-      return await self._providers[provider].validate_config()
+    try:
+      valid = await ops.validate()
 
     except Exception as e:
       self.logger.error(f"Provider validation failed for {provider}: {e}")
       return False
+
+    self._validated[provider] = valid
+    return valid
+
+
+# Global orchestrator instance
+_orchestrator: Optional[LLMOrchestrator] = None
+
+
+def get_orchestrator() -> LLMOrchestrator:
+  """
+  Get or create the shared LLM orchestrator.
+
+  Returns:
+      LLMOrchestrator instance
+  """
+  global _orchestrator
+
+  if _orchestrator is None:
+    _orchestrator = LLMOrchestrator()
+
+  return _orchestrator
+
+
+async def close_orchestrator() -> None:
+  """Close the shared LLM orchestrator, if one was created."""
+  global _orchestrator
+
+  if _orchestrator is not None:
+    await _orchestrator.aclose()
+    _orchestrator = None
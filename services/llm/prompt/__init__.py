@@ -1,18 +1,42 @@
 """
 LLM Prompt module for constructing and managing prompts.
+
+Exports are resolved lazily on first access, so importing the templates or
+the manager does not load the builder or the LLM adapter.
 """
-from .manager import (
-    PromptManager,
-    PromptTemplate,
-    PromptSection,
-    PromptStructureType,
-    State,
-    Edge
-)
-from .builder import PromptBuilder, ConversationContext
-from .templates import (
-    create_single_prompt_template,
-    create_call_center_agent_template,
-    create_sales_agent_template
-)
-from .adapter import PromptLLMAdapter, PromptedLLMResponse
+import importlib
+from typing import Any, Dict
+
+# Exported name -> module providing it
+_LAZY_ATTRS: Dict[str, str] = {
+    "PromptManager": "services.llm.prompt.manager",
+    "PromptTemplate": "services.llm.prompt.manager",
+    "PromptSection": "services.llm.prompt.manager",
+    "PromptStructureType": "services.llm.prompt.manager",
+    "State": "services.llm.prompt.manager",
+    "Edge": "services.llm.prompt.manager",
+    "PromptBuilder": "services.llm.prompt.builder",
+    "PromptBuffer": "services.llm.prompt.builder",
+    "ConversationContext": "services.llm.prompt.builder",
+    "create_single_prompt_template": "services.llm.prompt.templates",
+    "create_call_center_agent_template": "services.llm.prompt.templates",
+    "create_sales_agent_template": "services.llm.prompt.templates",
+    "PromptLLMAdapter": "services.llm.prompt.adapter",
+    "PromptedLLMResponse": "services.llm.prompt.adapter"
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+  """Import an exported name on first access and cache it on the package."""
+  if name not in _LAZY_ATTRS:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+  value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+  globals()[name] = value
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,7 @@
 Adapter for integrating prompt management with LLM orchestration.
 """
 from typing import Dict, Any, Optional, List, AsyncGenerator
+from collections import deque
 from dataclasses import dataclass
 
 from core.logging.setup import get_logger
@@ -53,11 +54,16 @@ class PromptLLMAdapter:
       provider: str = "openai",
       model: Optional[str] = None,
       temperature: float = 0.7,
-      additional_variables: Optional[Dict[str, str]] = None
+      additional_variables: Optional[Dict[str, str]] = None,
+      user_input: Optional[str] = None
   ) -> PromptedLLMResponse:
     """
     Generate a response using a prompt template.
 
+    The template is sent as a system message that stays identical across
+    turns, and the history plus current input as a separate user message, so
+    providers can reuse the cached system prompt prefix.
+
     Args:
         context: Conversation context
         template_name: Name of template to use, or None for default
@@ -65,30 +71,27 @@ class PromptLLMAdapter:
         model: Specific model to use, or None for provider default
         temperature: Temperature for response generation
         additional_variables: Additional variables for the prompt
+        user_input: The caller's current input, if not yet in the history
 
     Returns:
         LLM response with prompt details
     """
-    # Build the prompt
-    prompt = self.prompt_builder.build_prompt_with_context(
+    # Build the static system prompt and the per-turn user message
+    system_prompt = self.prompt_builder.build_static_system_prompt(
         context=context,
         template_name=template_name,
         additional_variables=additional_variables
     )
+    user_message = self.prompt_builder.build_dynamic_user_message(
+        context, user_input)
 
     # Create the LLM request
     messages = [
-        {"role": "system", "content": prompt}
+        {"role": "system", "content": system_prompt}
     ]
-
-    # Add the latest user input from context if available
-    if context.conversation_history:
-      last_turn = context.conversation_history[-1]
-      if "user" in last_turn:
-        messages.append({
-            "role": "user",
-            "content": last_turn["user"]
-        })
+    if user_message:
+      messages.append({"role": "user", "content": user_message})
+    prompt = "\n\n".join(message["content"] for message in messages)
 
     # Generate the response
     response = await self.llm_orchestrator.generate_response(
@@ -176,7 +179,8 @@ class PromptLLMAdapter:
       provider: str = "openai",
       model: Optional[str] = None,
       temperature: float = 0.7,
-      additional_variables: Optional[Dict[str, str]] = None
+      additional_variables: Optional[Dict[str, str]] = None,
+      user_input: Optional[str] = None
   ) -> Optional[PromptedLLMResponse]:
     """
     Generate a response using a registered script by name.
@@ -188,6 +192,7 @@ class PromptLLMAdapter:
         model: Specific model to use, or None for provider default
         temperature: Temperature for response generation
         additional_variables: Additional variables for the prompt
+        user_input: The caller's current input, if not yet in the history
 
     Returns:
         LLM response with prompt details
@@ -203,7 +208,8 @@ class PromptLLMAdapter:
           provider=provider,
           model=model,
           temperature=temperature,
-          additional_variables=additional_variables
+          additional_variables=additional_variables,
+          user_input=user_input
       )
     except Exception as e:
       logger.error(
@@ -227,15 +233,34 @@ class PromptLLMAdapter:
     Returns:
         The updated conversation context
     """
+    # Keep history in a bounded deque so old turns fall off in O(1)
+    max_turns = self.prompt_builder.max_history_turns
+    history = context.conversation_history
+    if not isinstance(history, deque) or history.maxlen != max_turns:
+      history = context.conversation_history = deque(history, maxlen=max_turns)
+      context.history_text = None
+
     # Add the new turn to the history
-    context.conversation_history.append({
+    evicted = history[0] if history and len(history) == max_turns else None
+    turn = {
         "user": user_input,
         "agent": agent_response
-    })
-
-    # Limit history size if needed
-    if len(context.conversation_history) > self.prompt_builder.max_history_turns:
-      context.conversation_history = context.conversation_history[-self.prompt_builder.max_history_turns:]
+    }
+    history.append(turn)
+
+    # Update the cached history text in place rather than re-joining every
+    # turn: drop the evicted turn's text from the front, append the new one
+    text = context.history_text
+    if text is not None and max_turns:
+      builder = self.prompt_builder
+      if evicted is not None:
+        evicted_text = builder.format_turn(evicted)
+        if evicted_text:
+          text = text[len(evicted_text) + 2:]
+      turn_text = builder.format_turn(turn)
+      if turn_text:
+        text = f"{text}\n\n{turn_text}" if text else turn_text
+      context.history_text = text
 
     return context
 
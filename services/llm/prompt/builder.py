@@ -1,9 +1,11 @@
 """
 Dynamic prompt builder for real-time context integration.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, MutableSequence, Optional, Tuple, Union
+from itertools import islice
 import time
-from dataclasses import dataclass
+from functools import lru_cache
+from dataclasses import dataclass, field
 
 from core.logging.setup import get_logger
 from .manager import PromptManager, PromptTemplate, PromptStructureType
@@ -11,14 +13,47 @@ from .manager import PromptManager, PromptTemplate, PromptStructureType
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=2)
+def _time_strings(epoch_second: int) -> Tuple[str, str]:
+  """Format the local time and date once per wall-clock second."""
+  local = time.localtime(epoch_second)
+  return time.strftime("%H:%M:%S", local), time.strftime("%Y-%m-%d", local)
+
+
 @dataclass
 class ConversationContext:
   """Context information for the current conversation."""
   call_id: str
   caller_info: Dict[str, Any]
-  conversation_history: List[Dict[str, str]]
+  # A list, or a bounded deque once PromptLLMAdapter records turns
+  conversation_history: MutableSequence[Dict[str, str]]
   current_state: Optional[str] = None
   metadata: Optional[Dict[str, Any]] = None
+  # Formatted history kept by PromptBuilder.format_history; None when stale
+  history_text: Optional[str] = field(default=None, repr=False, compare=False)
+  # String-valued caller info and metadata as prompt variables, kept by
+  # PromptBuilder; reset to None when caller_info or metadata change
+  prompt_variables: Optional[Dict[str, str]] = field(
+      default=None, repr=False, compare=False)
+
+
+@dataclass
+class PromptBuffer:
+  """
+  A full prompt kept in parts around the live user input.
+
+  Streaming transcription replaces `current_user_input` in place; the prompt
+  string is only assembled by `render()` when it is sent.
+  """
+  header: str
+  current_user_input: str = ""
+  footer: str = "## Current Response"
+
+  def render(self) -> str:
+    """Assemble the prompt string."""
+    if not self.current_user_input:
+      return f"{self.header}{self.footer}"
+    return f"{self.header}## Current User Input\n{self.current_user_input}\n\n{self.footer}"
 
 
 class PromptBuilder:
@@ -52,40 +87,106 @@ class PromptBuilder:
     Returns:
         The complete prompt with context
     """
+    return self.build_prompt_buffer(
+        context, template_name, additional_variables).render()
+
+  def build_prompt_buffer(
+      self,
+      context: ConversationContext,
+      template_name: Optional[str] = None,
+      additional_variables: Optional[Dict[str, str]] = None
+  ) -> PromptBuffer:
+    """
+    Build a prompt with conversation context for streaming updates.
+
+    Args:
+        context: The conversation context
+        template_name: Name of template to use, or None for default
+        additional_variables: Additional variables to inject
+
+    Returns:
+        The prompt, ready for update_with_streaming_transcription
+    """
+    base_prompt = self.build_static_system_prompt(
+        context, template_name, additional_variables)
+
+    # Add conversation history
+    history_text = self.format_history(context)
+
+    return PromptBuffer(
+        header=f"{base_prompt}\n\n## Conversation History\n{history_text}\n\n")
+
+  def build_static_system_prompt(
+      self,
+      context: ConversationContext,
+      template_name: Optional[str] = None,
+      additional_variables: Optional[Dict[str, str]] = None
+  ) -> str:
+    """
+    Build the system prompt from the template, without conversation turns.
+
+    The result only changes with the template state and variables, so it
+    forms a stable prefix that providers can serve from their prompt cache.
+
+    Args:
+        context: The conversation context
+        template_name: Name of template to use, or None for default
+        additional_variables: Additional variables to inject
+
+    Returns:
+        The system prompt
+    """
     # Get the appropriate template
     template = self.prompt_manager.get_template(template_name)
 
-    # Prepare variables
-    variables = self._prepare_variables(context, additional_variables)
+    # Caller and template variables are fixed for the conversation, so the
+    # prompt with those applied is memoized and only the per-turn variables
+    # are substituted here
+    static_variables = self._prepare_static_variables(context)
+    dynamic_variables = self._prepare_dynamic_variables(additional_variables)
 
     # Build the base prompt
+    state = None
     if template.structure_type != PromptStructureType.SINGLE and context.current_state:
-      base_prompt = self.prompt_manager.build_prompt(
-          template_name=template_name,
-          state=context.current_state,
-          variables=variables
-      )
-    else:
-      base_prompt = self.prompt_manager.build_prompt(
-          template_name=template_name,
-          variables=variables
-      )
+      state = context.current_state
+    return self.prompt_manager.build_prompt_cached(
+        template_name=template_name,
+        state=state,
+        static_variables=static_variables,
+        variables=dynamic_variables
+    )
+
+  def build_dynamic_user_message(
+      self,
+      context: ConversationContext,
+      user_input: Optional[str] = None
+  ) -> str:
+    """
+    Build the per-turn user message sent after the system prompt.
 
-    # Add conversation history
-    history_text = self._format_conversation_history(
-        context.conversation_history)
+    Args:
+        context: The conversation context
+        user_input: The caller's current input, if not yet in the history
 
-    # Combine everything
-    full_prompt = f"{base_prompt}\n\n## Conversation History\n{history_text}\n\n## Current Response"
+    Returns:
+        Conversation history followed by the current input
+    """
+    parts = []
 
-    return full_prompt
+    history_text = self.format_history(context)
+    if history_text:
+      parts.append(f"## Conversation History\n{history_text}")
+
+    if user_input:
+      parts.append(f"## Current User Input\n{user_input}")
+
+    return "\n\n".join(parts)
+
+  def _prepare_static_variables(self, context: ConversationContext) -> Dict[str, str]:
+    """Prepare variables that stay fixed for the conversation."""
+    if context.prompt_variables is not None:
+      return context.prompt_variables
 
-  def _prepare_variables(
-      self,
-      context: ConversationContext,
-      additional_vars: Optional[Dict[str, str]] = None
-  ) -> Dict[str, str]:
-    """Prepare variables from context and additional sources."""
     variables = {}
 
     # Add caller info
@@ -99,11 +200,20 @@ class PromptBuilder:
         if isinstance(value, str):
           variables[key] = value
 
+    context.prompt_variables = variables
+    return variables
+
+  def _prepare_dynamic_variables(
+      self,
+      additional_vars: Optional[Dict[str, str]] = None
+  ) -> Dict[str, str]:
+    """Prepare variables that change on every turn."""
     # Add time-related info
-    current_time = time.strftime("%H:%M:%S")
-    current_date = time.strftime("%Y-%m-%d")
-    variables["current_time"] = current_time
-    variables["current_date"] = current_date
+    current_time, current_date = _time_strings(int(time.time()))
+    variables = {
+        "current_time": current_time,
+        "current_date": current_date
+    }
 
     # Add additional variables
     if additional_vars:
@@ -111,49 +221,70 @@ class PromptBuilder:
 
     return variables
 
-  def _format_conversation_history(self, history: List[Dict[str, str]]) -> str:
-    """Format conversation history for the prompt."""
-    # Limit history to the most recent turns
-    limited_history = history[-self.max_history_turns:] if len(
-        history) > self.max_history_turns else history
+  def format_history(self, context: ConversationContext) -> str:
+    """
+    Get the formatted conversation history, reusing the cached text.
+
+    PromptLLMAdapter keeps `context.history_text` current as turns are
+    recorded; anything else changing the history should reset it to None.
+    """
+    if context.history_text is None:
+      context.history_text = self._format_conversation_history(
+          context.conversation_history)
+    return context.history_text
+
+  def format_turn(self, turn: Dict[str, str]) -> str:
+    """Format a single conversation turn for the prompt."""
+    formatted = []
+    user_msg = turn.get("user", "")
+    agent_msg = turn.get("agent", "")
 
-    formatted_turns = []
-    for turn in limited_history:
-      user_msg = turn.get("user", "")
-      agent_msg = turn.get("agent", "")
+    if user_msg:
+      formatted.append(f"User: {user_msg}")
+    if agent_msg:
+      formatted.append(f"Agent: {agent_msg}")
 
-      if user_msg:
-        formatted_turns.append(f"User: {user_msg}")
-      if agent_msg:
-        formatted_turns.append(f"Agent: {agent_msg}")
+    return "\n\n".join(formatted)
 
-    return "\n\n".join(formatted_turns)
+  def _format_conversation_history(
+      self,
+      history: MutableSequence[Dict[str, str]]
+  ) -> str:
+    """Format conversation history for the prompt."""
+    # Limit history to the most recent turns; islice also works on deques
+    excess = len(history) - self.max_history_turns
+    limited_history = islice(history, excess, None) if excess > 0 else history
+
+    formatted_turns = [self.format_turn(turn) for turn in limited_history]
+    return "\n\n".join(text for text in formatted_turns if text)
 
   def update_with_streaming_transcription(
       self,
-      base_prompt: str,
+      base_prompt: Union[PromptBuffer, str],
       transcription_segment: str
-  ) -> str:
+  ) -> Union[PromptBuffer, str]:
     """
     Update a prompt with new streaming transcription segment.
 
     Args:
-        base_prompt: The current prompt
+        base_prompt: The current prompt, preferably from build_prompt_buffer
         transcription_segment: New transcription segment
 
     Returns:
-        Updated prompt
+        Updated prompt; a PromptBuffer is updated in place and returned
     """
-    # Split the base prompt to find where to insert the new transcription
-    if "## Current Response" in base_prompt:
-      parts = base_prompt.split("## Current Response", 1)
-      main_part = parts[0]
+    if isinstance(base_prompt, PromptBuffer):
+      base_prompt.current_user_input = transcription_segment
+      return base_prompt
 
+    # Split the base prompt to find where to insert the new transcription
+    main_part, marker, _ = base_prompt.partition("## Current Response")
+    if marker:
       # Check if there's already a "Current User Input" section
-      if "## Current User Input\n" in main_part:
+      head, input_marker, _ = main_part.partition("## Current User Input\n")
+      if input_marker:
         # Update the existing section
-        sections = main_part.split("## Current User Input\n", 1)
-        new_main_part = sections[0] + \
+        new_main_part = head + \
             f"## Current User Input\n{transcription_segment}\n\n"
       else:
         # Add a new section
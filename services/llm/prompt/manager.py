@@ -1,14 +1,76 @@
 """
 Prompt manager for constructing and managing LLM prompts.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+from collections import OrderedDict
 from enum import Enum
-from pydantic import BaseModel
+import re
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from core.logging.setup import get_logger
 
 logger = get_logger(__name__)
 
+# {{variable}} placeholders; names are identifiers so they are also valid
+# str.format fields
+_PLACEHOLDER_RE = re.compile(r"\{\{([A-Za-z_]\w*)\}\}")
+
+# Statically rendered prompts kept by PromptManager.build_prompt_cached
+_RENDER_CACHE_SIZE = 256
+
+
+class _Placeholders(dict):
+  """Variables for str.format_map; unknown names render as placeholders."""
+
+  __slots__ = ()
+
+  def __missing__(self, key: str) -> str:
+    return "{{" + key + "}}"
+
+
+def _escape_braces(text: str) -> str:
+  """Escape literal braces for str.format."""
+  return text.replace("{", "{{").replace("}", "}}")
+
+
+class _Skeleton(NamedTuple):
+  """Prompt text for one template state, prepared at registration."""
+  # Alternating literal text and placeholder names
+  parts: List[str]
+  # The same text as a str.format template with every placeholder a field
+  template: str
+
+
+def _make_skeleton(text: str) -> _Skeleton:
+  """
+  Prepare prompt text for substitution.
+
+  Placeholder names are interned: they are looked up in the variables dict
+  on every build, and the builder's own variable names are interned literals.
+  """
+  parts = _PLACEHOLDER_RE.split(text)
+  for i in range(1, len(parts), 2):
+    parts[i] = sys.intern(parts[i])
+  return _Skeleton(parts, _to_format_string(parts, {}))
+
+
+def _to_format_string(parts: List[str], variables: Dict[str, str]) -> str:
+  """
+  Substitute variables into split prompt text, leaving a str.format template.
+
+  Literal text and values are brace-escaped; placeholders without a value
+  become format fields for a later `format_map`.
+  """
+  out = parts[:]
+  for i in range(0, len(out), 2):
+    out[i] = _escape_braces(out[i])
+  for i in range(1, len(out), 2):
+    name = out[i]
+    out[i] = _escape_braces(variables[name]) if name in variables else "{" + name + "}"
+  return "".join(out)
+
 
 class PromptStructureType(Enum):
   """Types of prompt structures supported."""
@@ -17,22 +79,28 @@ class PromptStructureType(Enum):
   CONVERSATION_FLOW = "conversation_flow"
 
 
-class PromptSection(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PromptSection:
   """Section of a prompt with specific purpose."""
   title: str
   content: str
   weight: float = 1.0  # For potential prioritization in token limited contexts
 
 
-class State(BaseModel):
+@dataclass(slots=True, frozen=True)
+class State:
   """State in a multi-prompt or conversation flow structure."""
   name: str
   prompt: str
-  tools: List[str] = []
+  tools: Tuple[str, ...] = ()
   description: Optional[str] = None
 
+  def __post_init__(self):
+    object.__setattr__(self, "tools", tuple(self.tools))
+
 
-class Edge(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Edge:
   """Edge connecting two states in a conversation flow."""
   from_state: str
   to_state: str
@@ -40,17 +108,36 @@ class Edge(BaseModel):
   description: Optional[str] = None
 
 
-class PromptTemplate(BaseModel):
-  """Template for constructing prompts."""
+@dataclass(slots=True, frozen=True)
+class PromptTemplate:
+  """
+  Template for constructing prompts.
+
+  Templates are built from already validated input (built-in templates and
+  ScriptSchema), so these are plain dataclasses rather than models. They
+  are shared once cached or registered, so collections are stored as
+  tuples and a read-only mapping.
+  """
   name: str
   structure_type: PromptStructureType
-  sections: List[PromptSection] = []
-  states: List[State] = []
-  edges: List[Edge] = []
+  sections: Tuple[PromptSection, ...] = ()
+  states: Tuple[State, ...] = ()
+  edges: Tuple[Edge, ...] = ()
   general_prompt: Optional[str] = None
-  general_tools: List[str] = []
+  general_tools: Tuple[str, ...] = ()
   starting_state: Optional[str] = None
-  dynamic_variables: Dict[str, str] = {}
+  dynamic_variables: Mapping[str, str] = field(
+      default_factory=lambda: MappingProxyType({}))
+
+  def __post_init__(self):
+    # Accept any iterables, but never keep a reference to the caller's
+    # mutable list or dict
+    object.__setattr__(self, "sections", tuple(self.sections))
+    object.__setattr__(self, "states", tuple(self.states))
+    object.__setattr__(self, "edges", tuple(self.edges))
+    object.__setattr__(self, "general_tools", tuple(self.general_tools))
+    object.__setattr__(
+        self, "dynamic_variables", MappingProxyType(dict(self.dynamic_variables)))
 
 
 class PromptManager:
@@ -59,6 +146,14 @@ class PromptManager:
   def __init__(self):
     self.templates: Dict[str, PromptTemplate] = {}
     self.default_template = None
+    # Prompt text per template prepared for substitution, keyed by state name
+    # (None for single prompts); rendered once at registration
+    self._skeletons: Dict[str, Dict[Optional[str], _Skeleton]] = {}
+    # States per template indexed by name; the first state with a name wins
+    self._states: Dict[str, Dict[str, State]] = {}
+    # Skeletons with static variables applied, still format templates for
+    # the per-turn variables; most recently used last
+    self._rendered: "OrderedDict[Tuple, str]" = OrderedDict()
 
   def register_template(self, template: PromptTemplate, make_default: bool = False):
     """
@@ -68,7 +163,16 @@ class PromptManager:
         template: The prompt template to register
         make_default: Whether to make this the default template
     """
-    self.templates[template.name] = template
+    # Names are interned so lookups with the same interned key compare by
+    # identity
+    name = sys.intern(template.name)
+    self.templates[name] = template
+    states: Dict[str, State] = {}
+    for state in template.states:
+      states.setdefault(sys.intern(state.name), state)
+    self._states[name] = states
+    self._skeletons[name] = self._render_skeletons(template)
+    self._rendered.clear()
     logger.info(f"Registered prompt template: {template.name}")
 
     if make_default or not self.default_template:
@@ -91,11 +195,30 @@ class PromptManager:
 
     return self.templates[name]
 
+  def get_state(
+      self,
+      template_name: Optional[str],
+      state_name: str
+  ) -> Optional[State]:
+    """
+    Get a state of a template by name.
+
+    Args:
+        template_name: Name of template to use, or None for default
+        state_name: Name of the state
+
+    Returns:
+        The state, or None if the template has no such state
+    """
+    template = self.get_template(template_name)
+    return self._states.get(template.name, {}).get(state_name)
+
   def build_prompt(
       self,
       template_name: Optional[str] = None,
       state: Optional[str] = None,
-      variables: Optional[Dict[str, str]] = None
+      variables: Optional[Dict[str, str]] = None,
+      deferred: Iterable[str] = ()
   ) -> str:
     """
     Build a prompt from a template.
@@ -104,6 +227,7 @@ class PromptManager:
         template_name: Name of template to use, or None for default
         state: Specific state to build prompt for, if applicable
         variables: Dynamic variables to inject into the prompt
+        deferred: Variable names left as placeholders for a later pass
 
     Returns:
         The constructed prompt
@@ -113,81 +237,130 @@ class PromptManager:
 
     # Combine template dynamic variables with passed variables
     all_variables = {**template.dynamic_variables, **variables}
+    for name in deferred:
+      all_variables.pop(name, None)
 
-    if template.structure_type == PromptStructureType.SINGLE:
-      return self._build_single_prompt(template, all_variables)
+    skeleton = self._get_skeleton(template, state)
+    return skeleton.template.format_map(_Placeholders(all_variables))
+
+  def build_prompt_cached(
+      self,
+      template_name: Optional[str] = None,
+      state: Optional[str] = None,
+      static_variables: Optional[Dict[str, str]] = None,
+      variables: Optional[Dict[str, str]] = None
+  ) -> str:
+    """
+    Build a prompt, memoizing the part rendered from static variables.
+
+    Static variables stay fixed over a conversation, so the template with
+    those applied is cached and each call only substitutes `variables`.
+
+    Args:
+        template_name: Name of template to use, or None for default
+        state: Specific state to build prompt for, if applicable
+        static_variables: Variables fixed for the conversation
+        variables: Per-call variables; these take precedence
+
+    Returns:
+        The constructed prompt
+    """
+    variables = variables or {}
+    key = (
+        template_name or self.default_template,
+        state,
+        frozenset((static_variables or {}).items()),
+        frozenset(variables)
+    )
+    partial = self._rendered.get(key)
+    if partial is not None:
+      self._rendered.move_to_end(key)
+    else:
+      template = self.get_template(template_name)
+      fields = {**template.dynamic_variables, **(static_variables or {})}
+      for name in variables:
+        fields.pop(name, None)
+      partial = _to_format_string(
+          self._get_skeleton(template, state).parts, fields)
+      self._rendered[key] = partial
+      if len(self._rendered) > _RENDER_CACHE_SIZE:
+        self._rendered.popitem(last=False)
+
+    return partial.format_map(_Placeholders(variables))
+
+  def _get_skeleton(self, template: PromptTemplate, state: Optional[str]) -> _Skeleton:
+    """Get the prepared prompt text for a template and state."""
+    skeletons = self._skeletons.get(template.name)
+    if skeletons is None:
+      skeletons = self._skeletons[template.name] = self._render_skeletons(
+          template)
 
-    if state:
-      return self._build_state_prompt(template, state, all_variables)
+    if template.structure_type == PromptStructureType.SINGLE:
+      return skeletons[None]
 
     # If multi-prompt or conversation flow and no state specified, use starting state
-    if template.starting_state:
-      return self._build_state_prompt(template, template.starting_state, all_variables)
+    state_name = state or template.starting_state
+    if not state_name:
+      raise ValueError("No state specified for multi-prompt template")
+
+    skeleton = skeletons.get(state_name)
+    if skeleton is None:
+      raise ValueError(f"State not found in template: {state_name}")
+    return skeleton
+
+  def _render_skeletons(self, template: PromptTemplate) -> Dict[Optional[str], _Skeleton]:
+    """Render and prepare the prompt text for every state of a template."""
+    if template.structure_type == PromptStructureType.SINGLE:
+      return {None: _make_skeleton(self._build_single_prompt(template))}
 
-    raise ValueError("No state specified for multi-prompt template")
+    states = self._states.get(template.name)
+    if states is None:
+      states = {}
+      for state in template.states:
+        states.setdefault(state.name, state)
 
-  def _build_single_prompt(self, template: PromptTemplate, variables: Dict[str, str]) -> str:
+    return {
+        name: _make_skeleton(self._build_state_prompt(template, state))
+        for name, state in states.items()
+    }
+
+  def _build_single_prompt(self, template: PromptTemplate) -> str:
     """Build a single prompt from sections."""
     prompt_parts = []
 
     # Add general prompt if available
     if template.general_prompt:
-      prompt_parts.append(self._apply_variables(
-          template.general_prompt, variables))
+      prompt_parts.append(template.general_prompt)
 
     # Add sections
     for section in template.sections:
-      section_text = f"## {section.title}\n{section.content}\n"
-      prompt_parts.append(self._apply_variables(section_text, variables))
+      prompt_parts.append(f"## {section.title}\n{section.content}\n")
 
     return "\n".join(prompt_parts)
 
-  def _build_state_prompt(
-      self,
-      template: PromptTemplate,
-      state_name: str,
-      variables: Dict[str, str]
-  ) -> str:
+  def _build_state_prompt(self, template: PromptTemplate, state: State) -> str:
     """Build a prompt for a specific state."""
     prompt_parts = []
 
     # Add general prompt if available
     if template.general_prompt:
-      prompt_parts.append(self._apply_variables(
-          template.general_prompt, variables))
-
-    # Find the specific state
-    state = None
-    for s in template.states:
-      if s.name == state_name:
-        state = s
-        break
-
-    if not state:
-      raise ValueError(f"State not found in template: {state_name}")
+      prompt_parts.append(template.general_prompt)
 
     # Add state-specific prompt
-    prompt_parts.append(self._apply_variables(state.prompt, variables))
-
-    # List available tools for this state
-    if state.tools or template.general_tools:
-      tools_list = []
-      if template.general_tools:
-        tools_list.extend(template.general_tools)
-      if state.tools:
-        tools_list.extend(state.tools)
+    prompt_parts.append(state.prompt)
 
-      unique_tools = list(set(tools_list))  # Remove duplicates
+    # List available tools for this state, deduplicated in declaration order
+    unique_tools = dict.fromkeys((*template.general_tools, *state.tools))
+    if unique_tools:
       tools_section = "## Available Tools\n" + \
           "\n".join([f"- {tool}" for tool in unique_tools])
       prompt_parts.append(tools_section)
 
     return "\n".join(prompt_parts)
 
-  def _apply_variables(self, text: str, variables: Dict[str, str]) -> str:
-    """Apply variable substitution to text."""
-    result = text
-    for key, value in variables.items():
-      placeholder = f"{{{{{key}}}}}"
-      result = result.replace(placeholder, value)
-    return result
+  def apply_variables(self, text: str, variables: Dict[str, str]) -> str:
+    """Apply variable substitution to text; unknown placeholders are kept."""
+    if not variables or "{{" not in text:
+      return text
+    return _PLACEHOLDER_RE.sub(
+        lambda match: variables.get(match.group(1), match.group(0)), text)
@@ -1,7 +1,8 @@
 """
 Library of reusable prompt templates.
 """
-from typing import Dict, List
+from functools import lru_cache
+from typing import Sequence, Tuple
 
 from .manager import PromptStructureType, PromptSection, State, Edge, PromptTemplate
 
@@ -12,11 +13,14 @@ def create_single_prompt_template(
     style: str,
     tasks: str,
     guidelines: str,
-    tools: List[str] = []
+    tools: Sequence[str] = ()
 ) -> PromptTemplate:
   """
   Create a single prompt template with standard sections.
 
+  Templates are cached per set of arguments and shared between callers, so
+  the returned template must not be modified.
+
   Args:
       name: Template name
       identity: Agent identity description
@@ -28,10 +32,24 @@ def create_single_prompt_template(
   Returns:
       A configured PromptTemplate
   """
+  return _build_single_prompt_template(
+      name, identity, style, tasks, guidelines, tuple(tools))
+
+
+@lru_cache(maxsize=32)
+def _build_single_prompt_template(
+    name: str,
+    identity: str,
+    style: str,
+    tasks: str,
+    guidelines: str,
+    tools: Tuple[str, ...]
+) -> PromptTemplate:
+  """Build a single prompt template; cached by create_single_prompt_template."""
   return PromptTemplate(
       name=name,
       structure_type=PromptStructureType.SINGLE,
-      sections=[
+      sections=(
           PromptSection(
               title="Identity",
               content=identity,
@@ -52,16 +70,19 @@ def create_single_prompt_template(
               content=guidelines,
               weight=0.7
           )
-      ],
+      ),
       general_prompt="You are an AI voice assistant engaging in a phone conversation. Respond naturally, keep responses concise, and maintain a friendly, helpful tone.",
       general_tools=tools
   )
 
 
+@lru_cache(maxsize=1)
 def create_call_center_agent_template() -> PromptTemplate:
   """
   Create a template for a call center agent with multiple states.
 
+  The template is built once and shared, so it must not be modified.
+
   Returns:
       A multi-state PromptTemplate for call center scenarios
   """
@@ -69,36 +90,36 @@ def create_call_center_agent_template() -> PromptTemplate:
       name="call_center_agent",
       structure_type=PromptStructureType.MULTI_PROMPT,
       general_prompt="You are a professional AI call center agent named {{agent_name}}. You represent {{company_name}} and are here to provide excellent customer service. Always be courteous, helpful, and efficient.",
-      general_tools=["end_call", "transfer_to_human"],
+      general_tools=("end_call", "transfer_to_human"),
       starting_state="greeting",
-      states=[
+      states=(
           State(
               name="greeting",
               prompt="This is the start of the call. Introduce yourself by name, mention you're with {{company_name}}. Be warm and welcoming, but professional. Ask how you can help the caller today.",
-              tools=[]
+              tools=()
           ),
           State(
               name="identification",
               prompt="You need to verify the caller's identity. Ask for their full name and one piece of verification information like their email address or account number. Be courteous but thorough.",
-              tools=["verify_customer"]
+              tools=("verify_customer",)
           ),
           State(
               name="issue_discovery",
               prompt="Listen to the customer's issue. Ask clarifying questions as needed to fully understand their problem. Show empathy for their situation. Your goal is to categorize their issue correctly.",
-              tools=["categorize_issue", "check_account_status"]
+              tools=("categorize_issue", "check_account_status")
           ),
           State(
               name="resolution",
               prompt="Provide a solution to the customer's issue. Be clear and concise. If you need to access specific information, use the appropriate tools. Confirm that the solution meets their needs.",
-              tools=["lookup_order", "process_refund", "schedule_service"]
+              tools=("lookup_order", "process_refund", "schedule_service")
           ),
           State(
               name="closing",
               prompt="Thank the customer for calling {{company_name}}. Summarize what was discussed and any actions that will be taken. Offer additional help if needed. End the call politely.",
-              tools=[]
+              tools=()
           )
-      ],
-      edges=[
+      ),
+      edges=(
           Edge(
               from_state="greeting",
               to_state="identification",
@@ -123,7 +144,7 @@ def create_call_center_agent_template() -> PromptTemplate:
               condition="Issue has been resolved",
               description="Close call after resolution"
           )
-      ],
+      ),
       dynamic_variables={
           "agent_name": "Support Agent",
           "company_name": "Example Company"
@@ -131,10 +152,13 @@ def create_call_center_agent_template() -> PromptTemplate:
   )
 
 
+@lru_cache(maxsize=1)
 def create_sales_agent_template() -> PromptTemplate:
   """
   Create a template for a sales agent with multiple states.
 
+  The template is built once and shared, so it must not be modified.
+
   Returns:
       A multi-state PromptTemplate for sales scenarios
   """
@@ -142,36 +166,36 @@ def create_sales_agent_template() -> PromptTemplate:
       name="sales_agent",
       structure_type=PromptStructureType.MULTI_PROMPT,
       general_prompt="You are an enthusiastic AI sales agent named {{agent_name}} for {{company_name}}. Your goal is to understand customer needs and recommend appropriate products or services. Be friendly, helpful, and persuasive without being pushy.",
-      general_tools=["end_call", "transfer_to_human"],
+      general_tools=("end_call", "transfer_to_human"),
       starting_state="greeting",
-      states=[
+      states=(
           State(
               name="greeting",
               prompt="Warmly introduce yourself and {{company_name}}. Express appreciation for their interest. Ask an engaging open-ended question about what brought them to consider our products/services today.",
-              tools=[]
+              tools=()
           ),
           State(
               name="needs_discovery",
               prompt="Explore the customer's needs, pain points, and goals. Ask thoughtful questions to understand their situation fully. Show genuine interest in helping them find the right solution.",
-              tools=["check_customer_history"]
+              tools=("check_customer_history",)
           ),
           State(
               name="product_presentation",
               prompt="Based on the customer's needs, present relevant products or services. Highlight benefits rather than features. Use clear, compelling language. Check for understanding and interest.",
-              tools=["lookup_product", "check_availability", "get_pricing"]
+              tools=("lookup_product", "check_availability", "get_pricing")
           ),
           State(
               name="objection_handling",
               prompt="Address any concerns or objections the customer raises. Be empathetic, non-defensive, and solution-oriented. Provide relevant information to overcome objections.",
-              tools=["get_comparison", "check_reviews"]
+              tools=("get_comparison", "check_reviews")
           ),
           State(
               name="closing",
               prompt="Move the sale forward appropriately. This might mean completing a purchase, scheduling a demo, or setting up a follow-up call. Be clear about next steps. Thank them for their time.",
-              tools=["process_order", "schedule_demo", "create_followup"]
+              tools=("process_order", "schedule_demo", "create_followup")
           )
-      ],
-      edges=[
+      ),
+      edges=(
           Edge(
               from_state="greeting",
               to_state="needs_discovery",
@@ -202,7 +226,7 @@ def create_sales_agent_template() -> PromptTemplate:
               condition="Objections successfully addressed",
               description="Move to close after addressing concerns"
           )
-      ],
+      ),
       dynamic_variables={
           "agent_name": "Sales Consultant",
           "company_name": "Example Products Inc."
@@ -1,9 +1,33 @@
-"""LLM providers package."""
+"""LLM providers package.
+
+Provider classes are resolved lazily on first access, so importing one
+provider module does not load every other provider's SDK.
+"""
+import importlib
+from typing import Any, Dict
 
 from .base import BaseLLMProvider
-from .openai import OpenAIProvider
-from .gemini import GeminiProvider
-from .anthropic import AnthropicProvider
+
+# Exported name -> module providing it
+_LAZY_ATTRS: Dict[str, str] = {
+    "OpenAIProvider": "services.llm.providers.openai",
+    "GeminiProvider": "services.llm.providers.gemini",
+    "AnthropicProvider": "services.llm.providers.anthropic"
+}
 
 __all__ = ["BaseLLMProvider", "OpenAIProvider",
            "GeminiProvider", "AnthropicProvider"]
+
+
+def __getattr__(name: str) -> Any:
+  """Import a provider class on first access and cache it on the package."""
+  if name not in _LAZY_ATTRS:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+  value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+  globals()[name] = value
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(__all__))
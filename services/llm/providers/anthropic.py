@@ -16,6 +16,37 @@ from core.logging.setup import get_logger
 
 logger = get_logger(__name__)
 
+# Provider settings used when the config leaves them out
+_DEFAULT_SETTINGS: Dict[str, Any] = {
+    "api_key": None,
+    "timeout": 30.0,
+    "http_client": None,
+    "model": "claude-3-5-sonnet-20241022",
+    "temperature": 0.7,
+    "max_tokens": 1024,
+}
+
+# Internal message roles mapped to Anthropic roles
+_ROLE_MAP = {"assistant": "assistant", "user": "user"}
+
+# Models offered by get_available_models
+_ANTHROPIC_MODELS = (
+    # Claude 3.5 Models (Latest)
+    "claude-3-5-sonnet-20241022",
+    "claude-3-5-sonnet-20240620",
+    "claude-3-5-haiku-20241022",
+
+    # Claude 3 Models
+    "claude-3-opus-20240229",
+    "claude-3-sonnet-20240229",
+    "claude-3-haiku-20240307",
+
+    # Legacy Claude Models
+    "claude-2.1",
+    "claude-2.0",
+    "claude-instant-1.2"
+)
+
 
 class AnthropicProvider(BaseLLMProvider):
   """Anthropic Claude LLM Provider"""
@@ -25,47 +56,37 @@ class AnthropicProvider(BaseLLMProvider):
     self.logger = logger
     self.provider_name = "anthropic"
 
+    # Resolve settings against the defaults in one merge
+    settings = {**_DEFAULT_SETTINGS, **config}
+
     # Initialize Anthropic client
-    api_key = config.get("api_key")
+    api_key = settings["api_key"]
     if not api_key:
       raise ValueError("Anthropic API key is required")
 
     self.client = anthropic.AsyncAnthropic(
         api_key=api_key,
-        timeout=config.get("timeout", 30.0)
+        timeout=settings["timeout"],
+        http_client=settings["http_client"]
     )
 
-    self.model = config.get("model", "claude-3-5-sonnet-20241022")
-    self.temperature = config.get("temperature", 0.7)
-    self.max_tokens = config.get("max_tokens", 1024)
+    self.model = settings["model"]
+    self.temperature = settings["temperature"]
+    self.max_tokens = settings["max_tokens"]
+
+    # Defaults shared by every request; copied and overridden per call
+    self._base_params: Dict[str, Any] = {
+        "model": self.model,
+        "max_tokens": self.max_tokens,
+        "temperature": self.temperature,
+    }
 
     logger.info(f"Initialized Anthropic provider with model: {self.model}")
 
   async def generate_response(self, request: LLMRequest) -> LLMResponse:
     """Generate a response using Anthropic Claude"""
     try:
-      # Convert messages to Anthropic format
-      messages = self._convert_messages(request.messages)
-
-      # Prepare request parameters
-      params = {
-          "model": request.model or self.model,
-          "messages": messages,
-          "max_tokens": request.max_tokens or self.max_tokens,
-          "temperature": request.temperature if request.temperature is not None else self.temperature,
-      }
-
-      # Add system prompt if provided in extra_params
-      if "system_prompt" in request.extra_params:
-        params["system"] = request.extra_params["system_prompt"]
-
-      # Add optional parameters from extra_params
-      if "top_p" in request.extra_params:
-        params["top_p"] = request.extra_params["top_p"]
-
-      if request.stop_sequences:
-        # Max 4 for Anthropic
-        params["stop_sequences"] = request.stop_sequences[:4]
+      params = self._build_params(request)
 
       logger.debug(f"Sending request to Anthropic: {params['model']}")
 
@@ -73,11 +94,9 @@ class AnthropicProvider(BaseLLMProvider):
       response = await self.client.messages.create(**params)
 
       # Extract response content
-      content = ""
-      if response.content:
-        for block in response.content:
-          if hasattr(block, 'text'):
-            content += block.text
+      content = "".join(
+          block.text for block in (response.content or ())
+          if hasattr(block, 'text'))
 
       # Create choices in the expected format
       choice = LLMChoice(
@@ -88,12 +107,15 @@ class AnthropicProvider(BaseLLMProvider):
 
       # Create usage information
       usage = None
-      if hasattr(response, 'usage') and response.usage:
+      response_usage = getattr(response, 'usage', None)
+      if response_usage:
+        # Counts reported by the API; read each once
+        input_tokens = getattr(response_usage, 'input_tokens', None) or 0
+        output_tokens = getattr(response_usage, 'output_tokens', None) or 0
         usage = LLMUsage(
-            prompt_tokens=getattr(response.usage, 'input_tokens', 0),
-            completion_tokens=getattr(response.usage, 'output_tokens', 0),
-            total_tokens=getattr(response.usage, 'input_tokens', 0) +
-            getattr(response.usage, 'output_tokens', 0)
+            prompt_tokens=input_tokens,
+            completion_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens
         )
 
       return LLMResponse(
@@ -115,28 +137,7 @@ class AnthropicProvider(BaseLLMProvider):
   async def stream_response(self, request: LLMRequest) -> AsyncIterator[str]:
     """Stream response from Anthropic Claude"""
     try:
-      # Convert messages to Anthropic format
-      messages = self._convert_messages(request.messages)
-
-      # Prepare request parameters
-      params = {
-          "model": request.model or self.model,
-          "messages": messages,
-          "max_tokens": request.max_tokens or self.max_tokens,
-          "temperature": request.temperature if request.temperature is not None else self.temperature,
-          "stream": True,
-      }
-
-      # Add system prompt if provided in extra_params
-      if "system_prompt" in request.extra_params:
-        params["system"] = request.extra_params["system_prompt"]
-
-      # Add optional parameters from extra_params
-      if "top_p" in request.extra_params:
-        params["top_p"] = request.extra_params["top_p"]
-
-      if request.stop_sequences:
-        params["stop_sequences"] = request.stop_sequences[:4]
+      params = self._build_params(request, stream=True)
 
       logger.debug(f"Starting stream from Anthropic: {params['model']}")
 
@@ -144,14 +145,22 @@ class AnthropicProvider(BaseLLMProvider):
       stream = await self.client.messages.create(**params)
 
       async for event in stream:
-        # Handle different types of streaming events
-        if event.type == "content_block_delta":
-          if hasattr(event.delta, 'text'):
-            yield event.delta.text
-        elif event.type == "content_block_start":
+        # Handle different types of streaming events; text deltas dominate,
+        # so read the attribute directly and skip the non-text ones
+        event_type = event.type
+        if event_type == "content_block_delta":
+          try:
+            text = event.delta.text
+          except AttributeError:
+            continue
+          yield text
+        elif event_type == "content_block_start":
           # Start of content block, might contain initial text
-          if hasattr(event.content_block, 'text'):
-            yield event.content_block.text
+          try:
+            text = event.content_block.text
+          except AttributeError:
+            continue
+          yield text
 
     except anthropic.APIError as e:
       logger.error(f"Anthropic streaming error: {str(e)}")
@@ -175,44 +184,76 @@ class AnthropicProvider(BaseLLMProvider):
       logger.error(f"Anthropic configuration validation failed: {str(e)}")
       return False
 
+  def _build_params(
+      self,
+      request: LLMRequest,
+      stream: bool = False
+  ) -> Dict[str, Any]:
+    """
+    Build Messages API parameters for a request.
+
+    Starts from the instance defaults and overrides only the fields the
+    request sets.
+    """
+    params = self._base_params.copy()
+    params["messages"] = self._convert_messages(request.messages)
+    if request.model:
+      params["model"] = request.model
+    if request.max_tokens:
+      params["max_tokens"] = request.max_tokens
+    if request.temperature is not None:
+      params["temperature"] = request.temperature
+    if stream:
+      params["stream"] = True
+
+    # Add system prompt from system messages or extra_params
+    system = self._build_system(request)
+    if system:
+      params["system"] = system
+
+    # Add optional parameters from extra_params
+    if "top_p" in request.extra_params:
+      params["top_p"] = request.extra_params["top_p"]
+
+    stop_sequences = request.stop_sequences
+    if stop_sequences:
+      # Max 4 for Anthropic; only copy when there are more
+      params["stop_sequences"] = (
+          stop_sequences if len(stop_sequences) <= 4 else stop_sequences[:4])
+
+    return params
+
+  def _build_system(self, request: LLMRequest) -> Optional[List[Dict[str, Any]]]:
+    """
+    Build the system prompt as a content block marked for prompt caching.
+
+    System messages are joined in order; `system_prompt` in extra_params
+    takes precedence, as before. The cache breakpoint lets Anthropic reuse
+    the prompt prefix across turns while it stays unchanged.
+    """
+    text = request.extra_params.get("system_prompt")
+    if text is None:
+      text = "\n\n".join(
+          msg.content for msg in request.messages if msg.role == "system")
+    if not text:
+      return None
+
+    return [{
+        "type": "text",
+        "text": text,
+        "cache_control": {"type": "ephemeral"}
+    }]
+
   def _convert_messages(self, messages: List[RequestLLMMessage]) -> List[MessageParam]:
     """Convert internal message format to Anthropic format"""
-    anthropic_messages = []
-
-    for msg in messages:
-      # Map roles - skip system messages as they're handled separately
-      if msg.role == "assistant":
-        role = "assistant"
-      elif msg.role == "user":
-        role = "user"
-      elif msg.role == "system":
-        # System messages are handled separately in Anthropic
-        continue
-      else:
-        role = "user"  # Default fallback
-
-      anthropic_messages.append({
-          "role": role,
-          "content": msg.content
-      })
-
-    return anthropic_messages
+    # System messages are handled separately in Anthropic; unknown roles
+    # fall back to user
+    return [
+        {"role": _ROLE_MAP.get(msg.role, "user"), "content": msg.content}
+        for msg in messages
+        if msg.role != "system"
+    ]
 
   def get_available_models(self) -> List[str]:
     """Get list of available Anthropic models"""
-    return [
-        # Claude 3.5 Models (Latest)
-        "claude-3-5-sonnet-20241022",
-        "claude-3-5-sonnet-20240620",
-        "claude-3-5-haiku-20241022",
-
-        # Claude 3 Models
-        "claude-3-opus-20240229",
-        "claude-3-sonnet-20240229",
-        "claude-3-haiku-20240307",
-
-        # Legacy Claude Models
-        "claude-2.1",
-        "claude-2.0",
-        "claude-instant-1.2"
-    ]
+    return list(_ANTHROPIC_MODELS)
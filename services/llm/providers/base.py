@@ -3,10 +3,40 @@ Base LLM provider interface.
 """
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, AsyncIterator
-from models.external.llm.request import LLMRequest
+from models.external.llm.request import LLMRequest, LLMMessage
 from models.external.llm.response import LLMResponse
 
 
+def build_request(
+    messages: List[Dict[str, str]],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    extra_params: Dict[str, Any],
+    stream: bool = False
+) -> LLMRequest:
+  """
+  Build a provider request from conversation message dicts.
+
+  Messages are built with model_construct: role and content are plain strings
+  from our own conversation history, so per-message validation is skipped.
+  The request itself is still validated.
+  """
+  llm_messages = [
+      LLMMessage.model_construct(role=msg["role"], content=msg["content"])
+      for msg in messages
+  ]
+
+  return LLMRequest(
+      messages=llm_messages,
+      model=model,
+      temperature=temperature,
+      max_tokens=max_tokens,
+      stream=stream,
+      extra_params=extra_params
+  )
+
+
 class BaseLLMProvider(ABC):
   """Base class for all LLM providers."""
 
@@ -29,6 +59,33 @@ class BaseLLMProvider(ABC):
     """
     pass
 
+  async def generate_response_raw(
+      self,
+      messages: List[Dict[str, str]],
+      model: str,
+      temperature: float,
+      max_tokens: int,
+      extra_params: Dict[str, Any]
+  ) -> LLMResponse:
+    """
+    Generate a response from conversation message dicts.
+
+    Providers whose SDK takes message dicts directly override this to skip
+    building an LLMRequest and converting it back.
+
+    Args:
+        messages: Conversation messages with role and content
+        model: Model name
+        temperature: Response randomness
+        max_tokens: Maximum tokens
+        extra_params: Provider-specific parameters
+
+    Returns:
+        LLM response object
+    """
+    return await self.generate_response(build_request(
+        messages, model, temperature, max_tokens, extra_params))
+
   @abstractmethod
   async def stream_response(
       self,
@@ -74,12 +131,7 @@ class BaseLLMProvider(ABC):
     Returns:
         Formatted messages for the provider
     """
-    messages = []
-
     if system_prompt:
-      messages.append({"role": "system", "content": system_prompt})
-
-    for message in conversation_history:
-      messages.append(message)
+      return [{"role": "system", "content": system_prompt}, *conversation_history]
 
-    return messages
+    return list(conversation_history)
@@ -25,6 +25,27 @@ from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Models offered by get_available_models
+_GEMINI_MODELS = (
+    # Gemini Pro Models (Latest)
+    "gemini-1.5-pro",
+    "gemini-1.5-pro-002",
+    "gemini-1.5-pro-001",
+    "gemini-1.5-flash",
+    "gemini-1.5-flash-002",
+    "gemini-1.5-flash-001",
+    "gemini-1.5-flash-8b",
+
+    # Gemini 1.0 Pro Models
+    "gemini-1.0-pro",
+    "gemini-1.0-pro-001",
+    "gemini-pro",  # Alias for backward compatibility
+
+    # Experimental/Vision Models
+    "gemini-1.5-pro-vision-latest",
+    "gemini-pro-vision"
+)
+
 
 class GeminiProvider(BaseLLMProvider):
   """Google Gemini LLM provider."""
@@ -221,22 +242,4 @@ class GeminiProvider(BaseLLMProvider):
 
   def get_available_models(self) -> List[str]:
     """Get list of available Gemini models."""
-    return [
-        # Gemini Pro Models (Latest)
-        "gemini-1.5-pro",
-        "gemini-1.5-pro-002",
-        "gemini-1.5-pro-001",
-        "gemini-1.5-flash",
-        "gemini-1.5-flash-002",
-        "gemini-1.5-flash-001",
-        "gemini-1.5-flash-8b",
-
-        # Gemini 1.0 Pro Models
-        "gemini-1.0-pro",
-        "gemini-1.0-pro-001",
-        "gemini-pro",  # Alias for backward compatibility
-
-        # Experimental/Vision Models
-        "gemini-1.5-pro-vision-latest",
-        "gemini-pro-vision"
-    ]
+    return list(_GEMINI_MODELS)
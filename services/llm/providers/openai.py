@@ -13,6 +13,37 @@ from core.logging.setup import get_logger
 
 logger = get_logger(__name__)
 
+# Models offered by get_available_models
+_OPENAI_MODELS = (
+    # GPT-4o Models (Latest)
+    "gpt-4o",
+    "gpt-4o-mini",
+    "gpt-4o-2024-11-20",
+    "gpt-4o-2024-08-06",
+    "gpt-4o-2024-05-13",
+    "gpt-4o-mini-2024-07-18",
+
+    # GPT-4 Turbo Models
+    "gpt-4-turbo",
+    "gpt-4-turbo-2024-04-09",
+    "gpt-4-turbo-preview",
+    "gpt-4-0125-preview",
+    "gpt-4-1106-preview",
+
+    # GPT-4 Models
+    "gpt-4",
+    "gpt-4-0613",
+    "gpt-4-32k",
+    "gpt-4-32k-0613",
+
+    # GPT-3.5 Models
+    "gpt-3.5-turbo",
+    "gpt-3.5-turbo-0125",
+    "gpt-3.5-turbo-1106",
+    "gpt-3.5-turbo-16k",
+    "gpt-3.5-turbo-instruct"
+)
+
 
 class OpenAIProvider(BaseLLMProvider):
   """OpenAI LLM provider."""
@@ -30,7 +61,8 @@ class OpenAIProvider(BaseLLMProvider):
     self.client = AsyncOpenAI(
         api_key=api_key,
         timeout=config.get("timeout", 30.0),
-        max_retries=config.get("max_retries", 3)
+        max_retries=config.get("max_retries", 3),
+        http_client=config.get("http_client")
     )
 
     self.model = config.get("model", "gpt-4o-mini")
@@ -46,61 +78,45 @@ class OpenAIProvider(BaseLLMProvider):
       messages = self._prepare_openai_messages(request)
 
       # Prepare request parameters
-      params = {
-          "model": request.model or self.model,
-          "messages": messages,
-          "temperature": request.temperature if request.temperature is not None else self.temperature,
-          "max_tokens": request.max_tokens or self.max_tokens,
-      }
+      params = self._build_params(
+          messages, request.model, request.temperature, request.max_tokens,
+          request.extra_params, request.stop_sequences)
+
+      logger.debug(f"Sending request to OpenAI: model={params['model']}")
 
-      # Add optional parameters from extra_params
-      if "top_p" in request.extra_params:
-        params["top_p"] = request.extra_params["top_p"]
+      # Make API call
+      response: ChatCompletion = await self.client.chat.completions.create(**params)
+      return self._convert_response(response)
 
-      if request.stop_sequences:
-        # OpenAI supports up to 4 stop sequences
-        params["stop"] = request.stop_sequences[:4]
+    except Exception as e:
+      logger.error(f"Error in OpenAI generate_response: {str(e)}")
+      raise Exception(f"OpenAI API error: {str(e)}")
 
-      if "frequency_penalty" in request.extra_params:
-        params["frequency_penalty"] = request.extra_params["frequency_penalty"]
+  async def generate_response_raw(
+      self,
+      messages: List[Dict[str, str]],
+      model: str,
+      temperature: float,
+      max_tokens: int,
+      extra_params: Dict[str, Any]
+  ) -> LLMResponse:
+    """Generate a response, passing message dicts straight to the SDK."""
+    try:
+      # Add system prompt if provided in extra_params
+      if "system_prompt" in extra_params:
+        messages = [
+            {"role": "system", "content": extra_params["system_prompt"]},
+            *messages
+        ]
 
-      if "presence_penalty" in request.extra_params:
-        params["presence_penalty"] = request.extra_params["presence_penalty"]
+      params = self._build_params(
+          messages, model, temperature, max_tokens, extra_params)
 
       logger.debug(f"Sending request to OpenAI: model={params['model']}")
 
       # Make API call
       response: ChatCompletion = await self.client.chat.completions.create(**params)
-
-      # Convert response to our format
-      choices = []
-      for choice in response.choices:
-        llm_message = LLMMessage(
-            role=choice.message.role,
-            content=choice.message.content or ""
-        )
-        choices.append(LLMChoice(
-            message=llm_message,
-            finish_reason=choice.finish_reason,
-            index=choice.index
-        ))
-
-      usage = None
-      if response.usage:
-        usage = LLMUsage(
-            prompt_tokens=response.usage.prompt_tokens,
-            completion_tokens=response.usage.completion_tokens,
-            total_tokens=response.usage.total_tokens
-        )
-
-      return LLMResponse(
-          id=response.id,
-          provider=self.provider_name,
-          model=response.model,
-          choices=choices,
-          usage=usage,
-          raw_response=response.model_dump() if hasattr(response, 'model_dump') else None
-      )
+      return self._convert_response(response)
 
     except Exception as e:
       logger.error(f"Error in OpenAI generate_response: {str(e)}")
@@ -113,26 +129,10 @@ class OpenAIProvider(BaseLLMProvider):
       messages = self._prepare_openai_messages(request)
 
       # Prepare request parameters
-      params = {
-          "model": request.model or self.model,
-          "messages": messages,
-          "temperature": request.temperature if request.temperature is not None else self.temperature,
-          "max_tokens": request.max_tokens or self.max_tokens,
-          "stream": True,
-      }
-
-      # Add optional parameters from extra_params
-      if "top_p" in request.extra_params:
-        params["top_p"] = request.extra_params["top_p"]
-
-      if request.stop_sequences:
-        params["stop"] = request.stop_sequences[:4]
-
-      if "frequency_penalty" in request.extra_params:
-        params["frequency_penalty"] = request.extra_params["frequency_penalty"]
-
-      if "presence_penalty" in request.extra_params:
-        params["presence_penalty"] = request.extra_params["presence_penalty"]
+      params = self._build_params(
+          messages, request.model, request.temperature, request.max_tokens,
+          request.extra_params, request.stop_sequences)
+      params["stream"] = True
 
       logger.debug(f"Starting OpenAI stream: model={params['model']}")
 
@@ -146,6 +146,70 @@ class OpenAIProvider(BaseLLMProvider):
       logger.error(f"Error in OpenAI stream_response: {str(e)}")
       raise Exception(f"OpenAI streaming error: {str(e)}")
 
+  def _build_params(
+      self,
+      messages: List[Dict[str, str]],
+      model: Optional[str],
+      temperature: Optional[float],
+      max_tokens: Optional[int],
+      extra_params: Dict[str, Any],
+      stop_sequences: Optional[List[str]] = None
+  ) -> Dict[str, Any]:
+    """Build chat completion parameters, falling back to provider defaults."""
+    params = {
+        "model": model or self.model,
+        "messages": messages,
+        "temperature": temperature if temperature is not None else self.temperature,
+        "max_tokens": max_tokens or self.max_tokens,
+    }
+
+    # Add optional parameters from extra_params
+    if "top_p" in extra_params:
+      params["top_p"] = extra_params["top_p"]
+
+    if stop_sequences:
+      # OpenAI supports up to 4 stop sequences
+      params["stop"] = stop_sequences[:4]
+
+    if "frequency_penalty" in extra_params:
+      params["frequency_penalty"] = extra_params["frequency_penalty"]
+
+    if "presence_penalty" in extra_params:
+      params["presence_penalty"] = extra_params["presence_penalty"]
+
+    return params
+
+  def _convert_response(self, response: ChatCompletion) -> LLMResponse:
+    """Convert an OpenAI completion to our response format."""
+    choices = []
+    for choice in response.choices:
+      llm_message = LLMMessage(
+          role=choice.message.role,
+          content=choice.message.content or ""
+      )
+      choices.append(LLMChoice(
+          message=llm_message,
+          finish_reason=choice.finish_reason,
+          index=choice.index
+      ))
+
+    usage = None
+    if response.usage:
+      usage = LLMUsage(
+          prompt_tokens=response.usage.prompt_tokens,
+          completion_tokens=response.usage.completion_tokens,
+          total_tokens=response.usage.total_tokens
+      )
+
+    return LLMResponse(
+        id=response.id,
+        provider=self.provider_name,
+        model=response.model,
+        choices=choices,
+        usage=usage,
+        raw_response=response.model_dump() if hasattr(response, 'model_dump') else None
+    )
+
   async def validate_config(self) -> bool:
     """Validate OpenAI provider configuration."""
     try:
@@ -183,32 +247,4 @@ class OpenAIProvider(BaseLLMProvider):
 
   def get_available_models(self) -> List[str]:
     """Get list of available OpenAI models."""
-    return [
-        # GPT-4o Models (Latest)
-        "gpt-4o",
-        "gpt-4o-mini",
-        "gpt-4o-2024-11-20",
-        "gpt-4o-2024-08-06",
-        "gpt-4o-2024-05-13",
-        "gpt-4o-mini-2024-07-18",
-
-        # GPT-4 Turbo Models
-        "gpt-4-turbo",
-        "gpt-4-turbo-2024-04-09",
-        "gpt-4-turbo-preview",
-        "gpt-4-0125-preview",
-        "gpt-4-1106-preview",
-
-        # GPT-4 Models
-        "gpt-4",
-        "gpt-4-0613",
-        "gpt-4-32k",
-        "gpt-4-32k-0613",
-
-        # GPT-3.5 Models
-        "gpt-3.5-turbo",
-        "gpt-3.5-turbo-0125",
-        "gpt-3.5-turbo-1106",
-        "gpt-3.5-turbo-16k",
-        "gpt-3.5-turbo-instruct"
-    ]
+    return list(_OPENAI_MODELS)
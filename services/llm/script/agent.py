@@ -149,7 +149,8 @@ class VoiceAgentScriptManager:
     llm_response = await self.llm_adapter.generate_response_with_script(
         script_name=script_name,
         context=conversation_context,
-        additional_variables=metadata
+        additional_variables=metadata,
+        user_input=user_input
     )
 
     if not llm_response:
@@ -202,9 +203,9 @@ class VoiceAgentScriptManager:
       logger.error(f"Script not found: {script_name}")
       return False
 
-    # Check if new state exists in the script
-    state_exists = any(state.name == new_state for state in script.states)
-    if not state_exists:
+    # Check if new state exists in the script; the registered template
+    # indexes its states by name
+    if self.prompt_manager.get_state(script_name, new_state) is None:
       logger.error(f"State {new_state} not found in script {script_name}")
       return False
 
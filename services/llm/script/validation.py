@@ -33,9 +33,12 @@ async def validate_script(script: ScriptSchema) -> ValidationResult:
   """
   errors = []
 
+  state_names = [state.name for state in script.states]
+  known_states = set(state_names)
+
   # Check if starting state exists
   if script.starting_state:
-    if not any(state.name == script.starting_state for state in script.states):
+    if script.starting_state not in known_states:
       errors.append(
           f"Starting state '{script.starting_state}' not found in states")
   elif script.states:
@@ -43,7 +46,6 @@ async def validate_script(script: ScriptSchema) -> ValidationResult:
     errors.append("No starting state defined for multi-state script")
 
   # Validate state names are unique
-  state_names = [state.name for state in script.states]
   duplicate_states = [name for name in set(
       state_names) if state_names.count(name) > 1]
   if duplicate_states:
@@ -52,10 +54,10 @@ async def validate_script(script: ScriptSchema) -> ValidationResult:
 
   # Validate edges refer to valid states
   for edge in script.edges:
-    if not any(state.name == edge.from_state for state in script.states):
+    if edge.from_state not in known_states:
       errors.append(
           f"Edge source state '{edge.from_state}' not found in states")
-    if not any(state.name == edge.to_state for state in script.states):
+    if edge.to_state not in known_states:
       errors.append(f"Edge target state '{edge.to_state}' not found in states")
 
   # Check for orphaned states (no incoming edges except for starting state)
@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 
 from core.logging.setup import get_logger
 from services.stt.whisper import WhisperService
-from services.llm.prompt.builder import PromptBuilder, ConversationContext
+from services.llm.prompt.builder import PromptBuilder, PromptBuffer, ConversationContext
 
 logger = get_logger(__name__)
 
@@ -43,7 +43,7 @@ class RingoverStreamHandler:
     self.callback = callback
     self.current_audio_buffer = bytearray()
     self.conversation_context = None
-    self.current_prompt = None
+    self.current_prompt: Optional[PromptBuffer] = None
     self.last_transcription_time = None
     self.session_id = str(uuid.uuid4())
     self.transcription_buffer = []
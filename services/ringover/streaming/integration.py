@@ -8,7 +8,7 @@ from core.logging.setup import get_logger
 from .client import RingoverStreamerClient
 from .manager import RingoverStreamerManager
 from services.stt.whisper import WhisperService
-from services.llm.orchestrator import LLMOrchestrator
+from services.llm.orchestrator import LLMOrchestrator, get_orchestrator
 from services.tts.elevenlabs import ElevenLabsService
 from models.external.ringover.webhook import RingoverWebhookEvent
 
@@ -75,7 +75,7 @@ class RingoverStreamerIntegration:
       self.stt_service = WhisperService(whisper_config)
 
       # Initialize LLM orchestrator
-      self.llm_orchestrator = LLMOrchestrator()
+      self.llm_orchestrator = get_orchestrator()
 
       # Initialize TTS service
       from core.config.services.tts.elevenlabs import ElevenLabsConfig
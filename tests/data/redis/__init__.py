@@ -0,0 +1,3 @@
+"""
+Redis test package.
+"""
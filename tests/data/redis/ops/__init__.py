@@ -0,0 +1,3 @@
+"""
+Redis operations test package.
+"""
@@ -0,0 +1,3 @@
+"""
+Call session operations tests.
+"""
@@ -0,0 +1,146 @@
+"""
+Call session update operations tests.
+"""
+import asyncio
+import uuid
+from data.redis.connection import get_redis_client
+from data.redis.ops.session import (
+    store_call_session,
+    get_call_session,
+    update_call_session,
+    update_call_session_fields,
+    update_call_session_atomic,
+    delete_call_session
+)
+
+
+class SessionUpdateTests:
+  """Tests for call session updates against Redis."""
+
+  def _call_id(self):
+    """Unique call ID so runs never see each other's sessions."""
+    return f"test-{uuid.uuid4().hex}"
+
+  async def atomic_patch_merges_fields(self):
+    """Test the patch script sets fields and merges dict fields."""
+    call_id = self._call_id()
+    await store_call_session(call_id, {
+        "status": "initiated",
+        "context_data": {"language": "en", "attempt": 1}
+    })
+
+    try:
+      updated = await update_call_session_atomic(
+          call_id,
+          {"status": "answered"},
+          merge={"context_data": {"attempt": 2, "queue": "sales"}}
+      )
+      session = await get_call_session(call_id)
+
+      assert updated is True
+      assert session["status"] == "answered"
+      assert session["context_data"] == {
+          "language": "en", "attempt": 2, "queue": "sales"}
+    finally:
+      await delete_call_session(call_id)
+
+  async def atomic_patch_preserves_values(self):
+    """Test merging keeps empty lists and full float precision."""
+    call_id = self._call_id()
+    await store_call_session(call_id, {
+        "context_data": {"tags": [], "score": 0.1234567890123456789}
+    })
+
+    try:
+      updated = await update_call_session_atomic(
+          call_id, {},
+          merge={"context_data": {"balance": 12345678901234.567, "items": []}}
+      )
+      session = await get_call_session(call_id)
+
+      assert updated is True
+      assert session["context_data"] == {
+          "tags": [],
+          "score": 0.1234567890123456789,
+          "balance": 12345678901234.567,
+          "items": []
+      }
+    finally:
+      await delete_call_session(call_id)
+
+  async def atomic_patch_skips_missing_session(self):
+    """Test the patch script does not create a missing session."""
+    call_id = self._call_id()
+    redis_client = await get_redis_client()
+
+    updated = await update_call_session_atomic(
+        call_id, {"status": "answered"}, merge={"context_data": {"a": 1}})
+
+    assert updated is False
+    assert not await redis_client.exists(f"call_session:{call_id}")
+
+  async def field_update_skips_missing_session(self):
+    """Test a late field update does not recreate an ended session."""
+    call_id = self._call_id()
+    redis_client = await get_redis_client()
+
+    await store_call_session(call_id, {"status": "answered"})
+    await delete_call_session(call_id)
+    updated = await update_call_session_fields(call_id, status="ended")
+
+    assert updated is False
+    assert not await redis_client.exists(f"call_session:{call_id}")
+
+  async def full_update_sets_ttl(self):
+    """Test a full write of an unknown session still expires."""
+    call_id = self._call_id()
+    redis_client = await get_redis_client()
+
+    try:
+      await update_call_session(call_id, {"status": "answered"}, ttl=120)
+      ttl = await redis_client.ttl(f"call_session:{call_id}")
+
+      assert 0 < ttl <= 120
+    finally:
+      await delete_call_session(call_id)
+
+
+async def run_tests():
+  """Run all call session update tests."""
+  test_instance = SessionUpdateTests()
+
+  print("Running call session update tests...")
+
+  try:
+    await test_instance.atomic_patch_merges_fields()
+    print("✅ atomic_patch_merges_fields passed")
+  except Exception as e:
+    print(f"❌ atomic_patch_merges_fields failed: {e}")
+
+  try:
+    await test_instance.atomic_patch_preserves_values()
+    print("✅ atomic_patch_preserves_values passed")
+  except Exception as e:
+    print(f"❌ atomic_patch_preserves_values failed: {e}")
+
+  try:
+    await test_instance.atomic_patch_skips_missing_session()
+    print("✅ atomic_patch_skips_missing_session passed")
+  except Exception as e:
+    print(f"❌ atomic_patch_skips_missing_session failed: {e}")
+
+  try:
+    await test_instance.field_update_skips_missing_session()
+    print("✅ field_update_skips_missing_session passed")
+  except Exception as e:
+    print(f"❌ field_update_skips_missing_session failed: {e}")
+
+  try:
+    await test_instance.full_update_sets_ttl()
+    print("✅ full_update_sets_ttl passed")
+  except Exception as e:
+    print(f"❌ full_update_sets_ttl failed: {e}")
+
+
+if __name__ == "__main__":
+  asyncio.run(run_tests())
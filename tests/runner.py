@@ -109,6 +109,56 @@ async def run_all_tests():
   except Exception as e:
     print(f"❌ Contact model tests failed to run: {e}\n")
 
+  # Redis session tests
+  print("=" * 50)
+  print("REDIS SESSION TESTS")
+  print("=" * 50)
+
+  try:
+    from tests.data.redis.ops.session.update import run_tests as run_session_update_tests
+    await run_session_update_tests()
+    print()
+  except Exception as e:
+    print(f"❌ Session update tests failed to run: {e}\n")
+
+  # Call supervision tests
+  print("=" * 50)
+  print("CALL SUPERVISION TESTS")
+  print("=" * 50)
+
+  try:
+    from tests.services.call.management.supervisor.events.batcher import run_tests as run_batcher_tests
+    await run_batcher_tests()
+    print()
+  except Exception as e:
+    print(f"❌ Status batcher tests failed to run: {e}\n")
+
+  # Prompt and LLM tests
+  print("=" * 50)
+  print("PROMPT & LLM TESTS")
+  print("=" * 50)
+
+  try:
+    from tests.services.llm.prompt.manager import run_tests as run_prompt_manager_tests
+    await run_prompt_manager_tests()
+    print()
+  except Exception as e:
+    print(f"❌ Prompt manager tests failed to run: {e}\n")
+
+  try:
+    from tests.services.llm.prompt.adapter import run_tests as run_prompt_adapter_tests
+    await run_prompt_adapter_tests()
+    print()
+  except Exception as e:
+    print(f"❌ Prompt adapter tests failed to run: {e}\n")
+
+  try:
+    from tests.services.llm.orchestrator import run_tests as run_orchestrator_tests
+    await run_orchestrator_tests()
+    print()
+  except Exception as e:
+    print(f"❌ Orchestrator tests failed to run: {e}\n")
+
   print("=" * 50)
   print("🎉 Test run completed!")
   print("=" * 50)
@@ -0,0 +1,3 @@
+"""
+Call service test package.
+"""
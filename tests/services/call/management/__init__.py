@@ -0,0 +1,3 @@
+"""
+Call management test package.
+"""
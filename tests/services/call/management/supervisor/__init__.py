@@ -0,0 +1,3 @@
+"""
+Call supervisor test package.
+"""
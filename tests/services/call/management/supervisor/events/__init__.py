@@ -0,0 +1,3 @@
+"""
+Call event handling tests.
+"""
@@ -0,0 +1,110 @@
+"""
+Call status batcher tests.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from data.db.models.calllog import CallStatus
+from services.call.management.supervisor.events.batcher import StatusUpdateBatcher
+
+
+class _RecordingBatcher(StatusUpdateBatcher):
+  """Batcher that records written rows instead of touching the database."""
+
+  def __init__(self, write_delay: float = 0.0, **kwargs):
+    super().__init__(**kwargs)
+    self.write_delay = write_delay
+    self.batches = []
+
+  async def _write(self, rows):
+    await asyncio.sleep(self.write_delay)
+    self.batches.append(rows)
+    return len(rows)
+
+  @property
+  def rows(self):
+    return [row for batch in self.batches for row in batch]
+
+
+class StatusBatcherTests:
+  """Tests for batching and merging call status updates."""
+
+  async def merges_rows_per_call(self):
+    """Test answered and ended updates for one call become one row."""
+    batcher = _RecordingBatcher(flush_interval=60)
+    answered_at = datetime.now(timezone.utc)
+    ended_at = answered_at + timedelta(seconds=30)
+
+    batcher.submit("call-1", CallStatus.ANSWERED, answered_at=answered_at)
+    batcher.submit("call-2", CallStatus.ANSWERED, answered_at=answered_at)
+    batcher.submit("call-1", CallStatus.COMPLETED, ended_at=ended_at)
+    batcher.submit("call-2", CallStatus.FAILED, ended_at=ended_at)
+
+    written = await batcher.flush()
+    await batcher.stop()
+
+    assert written == 2
+    rows = {row[0]: row for row in batcher.rows}
+    assert rows["call-1"] == (
+        "call-1", CallStatus.COMPLETED, answered_at, ended_at)
+    assert rows["call-2"] == (
+        "call-2", CallStatus.FAILED, answered_at, ended_at)
+
+  async def later_timing_fields_win(self):
+    """Test a later update's own timing fields replace earlier ones."""
+    batcher = _RecordingBatcher(flush_interval=60)
+    first = datetime.now(timezone.utc)
+    second = first + timedelta(seconds=5)
+
+    batcher.submit("call-1", CallStatus.ANSWERED, answered_at=first)
+    batcher.submit("call-1", CallStatus.ANSWERED, answered_at=second)
+
+    await batcher.flush()
+    await batcher.stop()
+
+    assert batcher.rows == [("call-1", CallStatus.ANSWERED, second, None)]
+
+  async def stop_keeps_rows_being_written(self):
+    """Test stopping mid-write loses neither that batch nor later rows."""
+    batcher = _RecordingBatcher(
+        write_delay=0.05, max_batch=2, flush_interval=0.01)
+
+    for i in range(5):
+      batcher.submit(f"call-{i}", CallStatus.ANSWERED)
+
+    # Let the background loop start writing its first batch
+    await asyncio.sleep(0.02)
+    batcher.submit("call-5", CallStatus.ANSWERED)
+    await batcher.stop()
+
+    assert sorted(row[0] for row in batcher.rows) == [
+        f"call-{i}" for i in range(6)]
+
+
+async def run_tests():
+  """Run all status batcher tests."""
+  test_instance = StatusBatcherTests()
+
+  print("Running status batcher tests...")
+
+  try:
+    await test_instance.merges_rows_per_call()
+    print("✅ merges_rows_per_call passed")
+  except Exception as e:
+    print(f"❌ merges_rows_per_call failed: {e}")
+
+  try:
+    await test_instance.later_timing_fields_win()
+    print("✅ later_timing_fields_win passed")
+  except Exception as e:
+    print(f"❌ later_timing_fields_win failed: {e}")
+
+  try:
+    await test_instance.stop_keeps_rows_being_written()
+    print("✅ stop_keeps_rows_being_written passed")
+  except Exception as e:
+    print(f"❌ stop_keeps_rows_being_written failed: {e}")
+
+
+if __name__ == "__main__":
+  asyncio.run(run_tests())
@@ -0,0 +1,3 @@
+"""
+LLM service test package.
+"""
@@ -0,0 +1,112 @@
+"""
+LLM orchestrator caching and request coalescing tests.
+"""
+import asyncio
+from services.llm.orchestrator import LLMOrchestrator, _ProviderOps
+
+_MESSAGES = [{"role": "user", "content": "What are your opening hours?"}]
+
+
+class _FakeOrchestrator(LLMOrchestrator):
+  """Orchestrator with one in-process provider that counts its calls."""
+
+  def __init__(self, delay: float = 0.05):
+    self.delay = delay
+    self.calls = 0
+    super().__init__()
+
+  def _initialize_providers(self):
+    self._providers["fake"] = None
+    self._dispatch["fake"] = _ProviderOps(
+        generate=self._generate,
+        stream=None,
+        validate=self._validate
+    )
+
+  async def _generate(self, messages, model, temperature, max_tokens, extra_params):
+    self.calls += 1
+    call = self.calls
+    await asyncio.sleep(self.delay)
+    return {"call": call, "content": messages[-1]["content"]}
+
+  async def _validate(self):
+    return True
+
+
+class OrchestratorTests:
+  """Tests for deterministic response reuse."""
+
+  async def coalesces_concurrent_requests(self):
+    """Test concurrent identical deterministic requests share one call."""
+    async with _FakeOrchestrator() as orchestrator:
+      responses = await asyncio.gather(*(
+          orchestrator.generate_response(
+              _MESSAGES, provider="fake", model="m", temperature=0.0)
+          for _ in range(5)
+      ))
+
+      assert orchestrator.calls == 1
+      assert all(response is responses[0] for response in responses)
+      assert not orchestrator._inflight
+
+      # Later identical requests are answered from the cache
+      cached = await orchestrator.generate_response(
+          _MESSAGES, provider="fake", model="m", temperature=0.0)
+      assert cached is responses[0]
+      assert orchestrator.calls == 1
+
+  async def cancelled_caller_spares_others(self):
+    """Test one caller giving up does not cancel the shared call."""
+    async with _FakeOrchestrator() as orchestrator:
+      first = asyncio.create_task(orchestrator.generate_response(
+          _MESSAGES, provider="fake", model="m", temperature=0.0))
+      second = asyncio.create_task(orchestrator.generate_response(
+          _MESSAGES, provider="fake", model="m", temperature=0.0))
+
+      await asyncio.sleep(0.01)
+      first.cancel()
+      response = await second
+
+      assert response is not None
+      assert orchestrator.calls == 1
+
+  async def sampled_requests_not_shared(self):
+    """Test requests above the deterministic temperature are not shared."""
+    async with _FakeOrchestrator() as orchestrator:
+      responses = await asyncio.gather(*(
+          orchestrator.generate_response(
+              _MESSAGES, provider="fake", model="m", temperature=0.7)
+          for _ in range(3)
+      ))
+
+      assert orchestrator.calls == 3
+      assert len({response["call"] for response in responses}) == 3
+
+
+async def run_tests():
+  """Run all orchestrator tests."""
+  test_instance = OrchestratorTests()
+
+  print("Running LLM orchestrator tests...")
+
+  try:
+    await test_instance.coalesces_concurrent_requests()
+    print("✅ coalesces_concurrent_requests passed")
+  except Exception as e:
+    print(f"❌ coalesces_concurrent_requests failed: {e}")
+
+  try:
+    await test_instance.cancelled_caller_spares_others()
+    print("✅ cancelled_caller_spares_others passed")
+  except Exception as e:
+    print(f"❌ cancelled_caller_spares_others failed: {e}")
+
+  try:
+    await test_instance.sampled_requests_not_shared()
+    print("✅ sampled_requests_not_shared passed")
+  except Exception as e:
+    print(f"❌ sampled_requests_not_shared failed: {e}")
+
+
+if __name__ == "__main__":
+  asyncio.run(run_tests())
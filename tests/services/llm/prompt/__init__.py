@@ -0,0 +1,3 @@
+"""
+Prompt management test package.
+"""
@@ -0,0 +1,110 @@
+"""
+Prompt adapter conversation history tests.
+"""
+import asyncio
+from services.llm.prompt.manager import PromptManager
+from services.llm.prompt.builder import ConversationContext
+from services.llm.prompt.adapter import PromptLLMAdapter
+
+# Turns including empty sides, which format to less text or none at all
+_TURNS = [
+    ("Hi there", "Hello, how can I help?"),
+    ("", "Are you still there?"),
+    ("Yes {sorry}", ""),
+    ("", ""),
+    ("I need my order status", "Order 7 ships tomorrow.\n\nAnything else?"),
+]
+
+
+class PromptAdapterTests:
+  """Tests for incremental conversation history text."""
+
+  def __init__(self):
+    # Turns are recorded without calling the orchestrator
+    self.adapter = PromptLLMAdapter(
+        llm_orchestrator=None, prompt_manager=PromptManager())
+    self.builder = self.adapter.prompt_builder
+
+  def _new_context(self, history=None):
+    """Create a conversation context for the given history."""
+    return ConversationContext(
+        call_id="history-test",
+        caller_info={},
+        conversation_history=list(history or [])
+    )
+
+  def _fresh_history_text(self, context):
+    """Format the context's history from scratch."""
+    return self.builder.format_history(
+        self._new_context(context.conversation_history))
+
+  async def _record_turns(self, context, count):
+    """Record turns, checking the cached text against a fresh format."""
+    for i in range(count):
+      user_input, agent_response = _TURNS[i % len(_TURNS)]
+      self.adapter.update_conversation_context(
+          context, user_input, agent_response)
+
+      # Prime the cache the way a prompt build would
+      self.builder.format_history(context)
+      assert context.history_text == self._fresh_history_text(context), (
+          f"history text diverged after turn {i}")
+
+  async def history_text_after_evictions(self):
+    """Test cached history text stays equal to a fresh format."""
+    self.builder.max_history_turns = 4
+    context = self._new_context()
+    self.builder.format_history(context)
+
+    # Enough turns to evict every kind of turn more than once
+    await self._record_turns(context, 3 * len(_TURNS) + 1)
+    assert len(context.conversation_history) == 4
+
+  async def history_text_from_long_list(self):
+    """Test a history list longer than the limit is trimmed correctly."""
+    self.builder.max_history_turns = 3
+    context = self._new_context(
+        {"user": user, "agent": agent} for user, agent in _TURNS)
+    self.builder.format_history(context)
+
+    await self._record_turns(context, len(_TURNS))
+    assert len(context.conversation_history) == 3
+
+  async def history_text_single_turn(self):
+    """Test a limit of one turn replaces the text on every turn."""
+    self.builder.max_history_turns = 1
+    context = self._new_context()
+
+    await self._record_turns(context, len(_TURNS))
+    user_input, agent_response = _TURNS[-1]
+    assert context.history_text == (
+        f"User: {user_input}\n\nAgent: {agent_response}")
+
+
+async def run_tests():
+  """Run all prompt adapter tests."""
+  test_instance = PromptAdapterTests()
+
+  print("Running prompt adapter tests...")
+
+  try:
+    await test_instance.history_text_after_evictions()
+    print("✅ history_text_after_evictions passed")
+  except Exception as e:
+    print(f"❌ history_text_after_evictions failed: {e}")
+
+  try:
+    await test_instance.history_text_from_long_list()
+    print("✅ history_text_from_long_list passed")
+  except Exception as e:
+    print(f"❌ history_text_from_long_list failed: {e}")
+
+  try:
+    await test_instance.history_text_single_turn()
+    print("✅ history_text_single_turn passed")
+  except Exception as e:
+    print(f"❌ history_text_single_turn failed: {e}")
+
+
+if __name__ == "__main__":
+  asyncio.run(run_tests())
@@ -0,0 +1,159 @@
+"""
+Prompt manager tests.
+"""
+import asyncio
+from services.llm.prompt.manager import (
+    PromptManager,
+    PromptTemplate,
+    PromptSection,
+    PromptStructureType,
+    State
+)
+
+# Literal braces in the templates, which str.format would otherwise read
+_SINGLE_PROMPT = (
+    "Hello {{caller_name}} from {{company_name}}. "
+    'Reply as JSON {"order": {{order}}}. '
+    "{{note}} {literal} {0} {{ spaced }} {{missing}}"
+)
+_STATE_PROMPT = "Confirm {{order}} for {{caller_name}} }{ {{note}}"
+
+# Values with braces that must come out exactly as given
+_VARIABLES = {
+    "caller_name": "{Ann}",
+    "company_name": "Acme {{Corp",
+    "order": '{"id": 7, "items": [1, 2]}',
+    "note": "}{ {0} {name!r} }}"
+}
+
+
+def _apply_variables_reference(text, variables):
+  """Substitute placeholders one at a time, as prompts were first built."""
+  for key, value in variables.items():
+    text = text.replace("{{" + key + "}}", value)
+  return text
+
+
+class PromptManagerTests:
+  """Tests for prompt skeletons and the render cache."""
+
+  def __init__(self):
+    self.prompt_manager = PromptManager()
+    self.prompt_manager.register_template(PromptTemplate(
+        name="braces_single",
+        structure_type=PromptStructureType.SINGLE,
+        general_prompt=_SINGLE_PROMPT,
+        sections=(PromptSection(title="Format {x}", content="{{order}} }}"),)
+    ))
+    self.prompt_manager.register_template(PromptTemplate(
+        name="braces_states",
+        structure_type=PromptStructureType.MULTI_PROMPT,
+        general_prompt=_SINGLE_PROMPT,
+        starting_state="confirm",
+        states=(State(name="confirm", prompt=_STATE_PROMPT, tools=("{tool}",)),)
+    ))
+
+  def _raw_prompt(self, template_name):
+    """Template text with no variables applied."""
+    return self.prompt_manager.build_prompt(template_name)
+
+  async def build_prompt_matches_reference(self):
+    """Test skeleton substitution against one-at-a-time replacement."""
+    for template_name in ("braces_single", "braces_states"):
+      expected = _apply_variables_reference(
+          self._raw_prompt(template_name), _VARIABLES)
+      built = self.prompt_manager.build_prompt(
+          template_name, variables=_VARIABLES)
+
+      assert built == expected
+      assert "{{missing}}" in built
+      assert "{{ spaced }}" in built
+
+  async def build_prompt_cached_matches_reference(self):
+    """Test cached static rendering against one-at-a-time replacement."""
+    static_variables = {
+        "caller_name": _VARIABLES["caller_name"],
+        "company_name": _VARIABLES["company_name"]
+    }
+    variables = {"order": _VARIABLES["order"], "note": _VARIABLES["note"]}
+
+    for template_name in ("braces_single", "braces_states"):
+      expected = _apply_variables_reference(
+          self._raw_prompt(template_name), _VARIABLES)
+
+      # First call renders the static part, the second reuses it
+      for _ in range(2):
+        built = self.prompt_manager.build_prompt_cached(
+            template_name,
+            static_variables=static_variables,
+            variables=variables
+        )
+        assert built == expected
+
+  async def render_cache_key(self):
+    """Test that cached renders never leak between different inputs."""
+    manager = self.prompt_manager
+    variables = {"order": "1", "note": "n"}
+
+    ann = manager.build_prompt_cached(
+        "braces_single", static_variables={"caller_name": "Ann"},
+        variables=variables)
+    bob = manager.build_prompt_cached(
+        "braces_single", static_variables={"caller_name": "Bob"},
+        variables=variables)
+    assert "Hello Ann " in ann
+    assert "Hello Bob " in bob
+
+    # Per-call variables take precedence over a cached static value
+    override = manager.build_prompt_cached(
+        "braces_single", static_variables={"caller_name": "Ann"},
+        variables={**variables, "caller_name": "Cy"})
+    assert "Hello Cy " in override
+
+    # A different state of the same template is rendered separately
+    state_prompt = manager.build_prompt_cached(
+        "braces_states", state="confirm",
+        static_variables={"caller_name": "Ann"}, variables=variables)
+    assert state_prompt.startswith(
+        _apply_variables_reference(_SINGLE_PROMPT, {"caller_name": "Ann", **variables}))
+    assert "Confirm 1 for Ann" in state_prompt
+
+    # Re-registering a template drops its cached renders
+    manager.register_template(PromptTemplate(
+        name="braces_single",
+        structure_type=PromptStructureType.SINGLE,
+        general_prompt="Bye {{caller_name}}"
+    ))
+    rebuilt = manager.build_prompt_cached(
+        "braces_single", static_variables={"caller_name": "Ann"},
+        variables=variables)
+    assert rebuilt.startswith("Bye Ann")
+
+
+async def run_tests():
+  """Run all prompt manager tests."""
+  test_instance = PromptManagerTests()
+
+  print("Running prompt manager tests...")
+
+  try:
+    await test_instance.build_prompt_matches_reference()
+    print("✅ build_prompt_matches_reference passed")
+  except Exception as e:
+    print(f"❌ build_prompt_matches_reference failed: {e}")
+
+  try:
+    await test_instance.build_prompt_cached_matches_reference()
+    print("✅ build_prompt_cached_matches_reference passed")
+  except Exception as e:
+    print(f"❌ build_prompt_cached_matches_reference failed: {e}")
+
+  try:
+    await test_instance.render_cache_key()
+    print("✅ render_cache_key passed")
+  except Exception as e:
+    print(f"❌ render_cache_key failed: {e}")
+
+
+if __name__ == "__main__":
+  asyncio.run(run_tests())